@@ -0,0 +1,120 @@
+import llvmlite.binding as llvm
+import os
+import subprocess
+import tempfile
+from llvm_target import create_target_machine
+
+# Symbol the program's entry point is exported as in shared libraries
+PROGRAM_ENTRY = "program_main"
+
+# Output kinds supported by compile_native()
+OUTPUT_KINDS = ('object', 'executable', 'shared')
+
+# C `int main()` that runs the program and reports success to the OS
+EXECUTABLE_ENTRY_IR = f"""
+declare void @"{PROGRAM_ENTRY}"()
+
+define i32 @"main"() {{
+entry:
+  call void @"{PROGRAM_ENTRY}"()
+  ret i32 0
+}}
+"""
+
+
+class LinkError(Exception):
+    """Raised when the system C toolchain fails to link an object file."""
+
+
+def prepare_module(optimized_ir, kind, target_machine):
+    """
+    Parse the optimized IR (unless it already is a module, which is then modified in
+    place) and adapt its entry point to the requested output kind.
+
+    The generated `void main()` is renamed to `program_main`. Executables get a
+    C-compatible `int main()` wrapper; shared libraries export `program_main`.
+    """
+    module = llvm.parse_assembly(optimized_ir) if isinstance(optimized_ir, str) else optimized_ir
+    module.triple = target_machine.triple
+    module.data_layout = str(target_machine.target_data)
+
+    main = module.get_function("main")
+    main.name = PROGRAM_ENTRY
+    if kind == 'executable':
+        module.link_in(llvm.parse_assembly(EXECUTABLE_ENTRY_IR))
+    module.verify()
+    return module
+
+
+def emit_object(optimized_ir, output_path, kind='object', target_machine=None):
+    """
+    Emit a relocatable object file for the optimized IR.
+
+    Parameters:
+    optimized_ir (str or ModuleRef): The optimized LLVM IR (e.g. from CodeOptimizer).
+    output_path (str): Path of the .o file to write.
+    kind (str): Output the object is meant for ('object', 'executable' or 'shared').
+    target_machine (TargetMachine): Target to emit for (defaults to a PIC host target).
+
+    Returns:
+    str: The path of the written object file.
+    """
+    # Position independent code links into both PIE executables and shared libraries
+    target_machine = target_machine or create_target_machine(reloc='pic', opt=3)
+    module = prepare_module(optimized_ir, kind, target_machine)
+    with open(output_path, 'wb') as f:
+        f.write(target_machine.emit_object(module))
+    return output_path
+
+
+def find_c_compiler():
+    """Return the system C compiler driver used for linking (honours $CC)."""
+    return os.environ.get('CC', 'cc')
+
+
+def link(object_path, output_path, kind='executable', cc=None, extra_args=()):
+    """
+    Link an object file with the system C toolchain.
+
+    Parameters:
+    object_path (str): The object file produced by emit_object().
+    output_path (str): Path of the executable or shared library to produce.
+    kind (str): 'executable' or 'shared'.
+    cc (str): C compiler driver to link with (defaults to $CC or `cc`).
+    extra_args (iterable): Additional linker arguments.
+    """
+    command = [cc or find_c_compiler()]
+    if kind == 'shared':
+        command.append('-shared')
+    command += [object_path, '-o', output_path, '-lm', *extra_args]
+
+    try:
+        completed = subprocess.run(command, capture_output=True, text=True)
+    except OSError as e:
+        raise LinkError(f"Cannot run the C compiler '{command[0]}': {e}")
+    if completed.returncode != 0:
+        raise LinkError(f"Linking failed ({' '.join(command)}):\n{completed.stderr}")
+    return output_path
+
+
+def compile_native(optimized_ir, output_path, kind='executable', cc=None):
+    """
+    Compile optimized IR ahead of time to an object file, executable or shared library.
+
+    Parameters:
+    optimized_ir (str or ModuleRef): The optimized LLVM IR, as text or as a parsed module.
+    output_path (str): Path of the artifact to produce.
+    kind (str): One of OUTPUT_KINDS.
+    cc (str): C compiler driver used for linking.
+
+    Returns:
+    str: The path of the produced artifact.
+    """
+    if kind not in OUTPUT_KINDS:
+        raise ValueError(f"Unknown output kind '{kind}'. Expected one of: {', '.join(OUTPUT_KINDS)}")
+    if kind == 'object':
+        return emit_object(optimized_ir, output_path, kind)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        object_path = emit_object(optimized_ir, os.path.join(tmp_dir, 'program.o'), kind)
+        return link(object_path, output_path, kind, cc)
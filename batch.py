@@ -0,0 +1,144 @@
+import fnmatch
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+# Files picked up when a directory is given to the batch driver
+DEFAULT_PATTERN = '*.src'
+
+
+class FileResult:
+    """Outcome of compiling one file of a batch."""
+
+    def __init__(self, path):
+        self.path = path
+        self.ok = False
+        self.error = None        # Error message when the compilation failed
+        self.output_path = None  # Artifact written with --emit
+        self.cache_hit = False
+        self.stage_times = {}    # Wall seconds per pipeline stage
+        self.total_time = 0.0    # Wall seconds for the whole file, including reading it
+
+
+def find_sources(paths, pattern=DEFAULT_PATTERN):
+    """Expand files and directories (searched recursively for `pattern`) into a sorted list of files."""
+    sources = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                sources.extend(os.path.join(root, name) for name in sorted(files) if fnmatch.fnmatch(name, pattern))
+        else:
+            sources.append(path)
+    return sources
+
+
+def _init_worker():
+    """Load the lexer, the parser tables and LLVM once per worker process."""
+    import lexer
+    import parser  # noqa: F401 (builds the LALR parser from parsetab)
+    from llvm_target import get_target_machine
+
+    lexer.get_lexer()
+    get_target_machine()
+
+
+def output_path_for(path, kind, output_dir=None):
+    """Artifact path of an --emit batch compilation (next to the source unless an output directory is given)."""
+    suffix = {'object': '.o', 'executable': '', 'shared': '.so'}[kind]
+    base = os.path.splitext(path)[0] + suffix
+    if output_dir is None:
+        return base
+    return os.path.join(output_dir, os.path.basename(base))
+
+
+def compile_file(path, stages=('optimize',), opt_level=None, passes=None, cpu=None, emit=None, output_dir=None,
+                 cache_dir=None, cache_max_size=None, use_cache=True):
+    """
+    Compile one file of a batch. Never raises: failures, syntax errors included, are
+    reported in the FileResult with their message.
+
+    Parameters:
+    path (str): Source file to compile.
+    stages (iterable): Pipeline stages to run (see compiler.STAGES).
+    opt_level (str): Optimization level (see code_optimizer.OPT_LEVELS).
+    passes (iterable): Extra optimization passes.
+    cpu (str): Target CPU (see llvm_target.set_target_cpu); the worker keeps it for later files.
+    emit (str): Also produce an 'object', 'executable' or 'shared' artifact.
+    output_dir (str): Directory of the emitted artifacts (default: next to the sources).
+    cache_dir, cache_max_size: Compilation cache settings; use_cache=False bypasses the cache.
+
+    Returns:
+    FileResult: Status and timings of the file.
+    """
+    import compiler
+    from compile_cache import CompilationCache
+    from profiling import PipelineProfiler
+
+    result = FileResult(path)
+    start = time.perf_counter()
+    if cpu and 'optimize' in stages:
+        from llvm_target import set_target_cpu
+
+        set_target_cpu(cpu)
+    profiler = PipelineProfiler(trace_memory=False, time_passes=False)
+    try:
+        with open(path, 'r') as f:
+            source = f.read()
+        cache = CompilationCache(cache_dir, cache_max_size) if use_cache else None
+        compilation = compiler.compile(source, stages=stages, cache=cache, profiler=profiler,
+                                       opt_level=opt_level, passes=passes)
+        result.cache_hit = compilation.cache_hit
+        if emit:
+            from aot_compiler import compile_native
+
+            result.output_path = output_path_for(path, emit, output_dir)
+            emit_start = time.perf_counter()
+            compile_native(compilation.optimized, result.output_path, kind=emit)
+            result.stage_times['emit'] = time.perf_counter() - emit_start
+        result.ok = True
+    except Exception as e:
+        result.error = str(e)
+    for profile in profiler.stages:
+        result.stage_times[profile.stage] = profile.wall_time
+    result.total_time = time.perf_counter() - start
+    return result
+
+
+def compile_batch(paths, jobs=None, **options):
+    """
+    Compile many files across a pool of worker processes.
+
+    Each worker loads the lexer, the parser tables and LLVM once and then
+    compiles files one after another. A program that fails to compile only
+    fails its own FileResult; if a worker process dies (e.g. LLVM crashes),
+    the files it took down with it are retried once in a fresh pool.
+
+    Parameters:
+    paths (list): Source files to compile.
+    jobs (int): Number of worker processes (default: the CPU count).
+    options: Keyword arguments forwarded to compile_file().
+
+    Yields:
+    FileResult: One per file, in completion order.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    pending = list(paths)
+    retried = set()
+    while pending:
+        batch, pending = pending, []
+        with ProcessPoolExecutor(max_workers=min(jobs, len(batch)), initializer=_init_worker) as pool:
+            futures = {pool.submit(compile_file, path, **options): path for path in batch}
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    yield future.result()
+                except BrokenProcessPool:
+                    if path in retried:
+                        result = FileResult(path)
+                        result.error = "The worker process compiling this file crashed"
+                        yield result
+                    else:
+                        retried.add(path)
+                        pending.append(path)
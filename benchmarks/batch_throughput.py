@@ -0,0 +1,66 @@
+"""
+Batch compilation throughput.
+
+Compiles copies of the benchmarks/corpus programs with the parallel batch
+driver at increasing worker counts (cache disabled) and reports files per
+second and the speedup over a single worker, which should grow with the
+number of cores.
+
+Usage:
+python benchmarks/batch_throughput.py [--copies N] [--jobs 1,2,4]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch import compile_batch, find_sources
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus')
+
+
+def default_jobs():
+    counts = [1]
+    while counts[-1] * 2 <= (os.cpu_count() or 1):
+        counts.append(counts[-1] * 2)
+    return counts
+
+
+def make_batch(directory, copies):
+    """Copy every corpus program `copies` times into `directory`."""
+    for source in find_sources([CORPUS_DIR]):
+        name = os.path.splitext(os.path.basename(source))[0]
+        for copy in range(copies):
+            shutil.copy(source, os.path.join(directory, f"{name}_{copy}.src"))
+    return find_sources([directory])
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--copies', type=int, default=8, help="Copies of each corpus program")
+    arg_parser.add_argument('--jobs', default=','.join(str(jobs) for jobs in default_jobs()),
+                            help="Comma-separated worker counts")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        sources = make_batch(directory, args.copies)
+        print(f"{'jobs':>6} {'seconds':>10} {'files/s':>10} {'speedup':>9}")
+        baseline = None
+        for jobs in (int(jobs) for jobs in args.jobs.split(',')):
+            start = time.perf_counter()
+            failures = [result for result in compile_batch(sources, jobs, use_cache=False) if not result.ok]
+            elapsed = time.perf_counter() - start
+            if failures:
+                print(f"FAIL: {failures[0].path}: {failures[0].error}")
+                return 1
+            baseline = baseline or elapsed
+            print(f"{jobs:>6} {elapsed:>10.2f} {len(sources) / elapsed:>10.1f} {baseline / elapsed:>8.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
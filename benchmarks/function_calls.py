@@ -0,0 +1,111 @@
+"""
+Function call benchmark: recursive and call-heavy programs.
+
+Each program is compiled through the full pipeline and run natively in a JIT
+session (its output is discarded). The report shows compile time, run time and
+how many calls to user-defined functions remain in the optimized IR, which
+shows whether the small helpers were inlined.
+
+Usage:
+python benchmarks/function_calls.py [--repeat N]
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import compiler
+from code_executor import JITSession
+
+PROGRAMS = {
+    'recursive_fib': """
+def fib(n):
+    if n < 2:
+        return n
+    return fib(n - 1) + fib(n - 2)
+
+print(fib(27))
+""",
+    'helpers_in_loop': """
+def scale(x):
+    return x * 0.5
+
+def offset(x, y):
+    return x + y * 0.25
+
+total = 0.0
+for i in range(0, 5000000):
+    total = offset(scale(i), total) + total * 0.000001
+
+print(total)
+""",
+    'nested_calls': """
+def inc(x):
+    return x + 1.5
+
+def twice(x):
+    return inc(inc(x))
+
+def poly(x):
+    return twice(x) * twice(x) - inc(x)
+
+acc = 0.0
+for i in range(0, 3000000):
+    acc = acc * 0.5 + poly(i)
+
+print(acc)
+""",
+}
+
+
+class SuppressStdout:
+    """Discard everything written to file descriptor 1 (native printf output)."""
+
+    def __enter__(self):
+        sys.stdout.flush()
+        self.saved_fd = os.dup(1)
+        self.devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(self.devnull, 1)
+        return self
+
+    def __exit__(self, *exc):
+        os.dup2(self.saved_fd, 1)
+        os.close(self.saved_fd)
+        os.close(self.devnull)
+
+
+def count_user_calls(optimized_ir):
+    """Count call instructions to internal (user-defined) functions."""
+    internal = set(re.findall(r'define internal fastcc \S+ @"?([\w.]+)"?', optimized_ir))
+    calls = re.findall(r'call fastcc \S+ @"?([\w.]+)"?', optimized_ir)
+    return sum(1 for name in calls if name in internal)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--repeat', type=int, default=3, help="Runs per program (best time is reported)")
+    args = arg_parser.parse_args()
+
+    session = JITSession()
+    print(f"{'program':<18} {'compile (ms)':>13} {'run (ms)':>10} {'user calls left':>16}")
+    for name, source in PROGRAMS.items():
+        start = time.perf_counter()
+        result = compiler.compile(source)
+        compile_ms = (time.perf_counter() - start) * 1000
+
+        run_times = []
+        for _ in range(args.repeat):
+            with SuppressStdout():
+                start = time.perf_counter()
+                session.run_ir(result.optimized_ir)
+                run_times.append((time.perf_counter() - start) * 1000)
+
+        print(f"{name:<18} {compile_ms:>13.1f} {min(run_times):>10.1f} {count_user_calls(result.optimized_ir):>16}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""
+Input benchmark: programs summing a million numbers read from stdin.
+
+Each program is compiled through the full pipeline and run natively in a JIT
+session with file descriptor 0 redirected to a generated data file (integers
+and decimals, several per line). As a reference, the same numbers are read
+by a hand-built loop making one scanf("%lf") call per number, the way input
+was lowered before the runtime input buffer. The report shows the best run
+time of each and the numbers read per second.
+
+Usage:
+python benchmarks/input_throughput.py [--repeat N] [--numbers N]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llvmlite import ir
+
+import compiler
+from code_executor import JITSession
+from function_calls import SuppressStdout
+
+# name: (program reading `numbers` numbers, numbers per input statement)
+PROGRAMS = {
+    'input': ("""
+total = 0.0
+for i in range(0, {numbers}):
+    x = input("")
+    total = total + x
+print(total)
+""", 1),
+    'input_multiple': ("""
+total = 0.0
+for i in range(0, {count}):
+    a, b, c, d = input("")
+    total = total + a + b + c + d
+print(total)
+""", 4),
+}
+
+
+def write_numbers(path, numbers):
+    """Write `numbers` integers and two-decimal numbers, eight per line."""
+    generator = random.Random(0)
+    with open(path, 'w') as data:
+        for start in range(0, numbers, 8):
+            words = [str(generator.randint(-100000, 100000)) if generator.random() < 0.5
+                     else f"{generator.uniform(-1000, 1000):.2f}" for _ in range(min(8, numbers - start))]
+            data.write(' '.join(words) + '\n')
+
+
+def scanf_reference(numbers):
+    """IR of `main` summing `numbers` numbers read with one scanf call each."""
+    module = ir.Module(name="scanf_reference")
+    i64, double, i8_ptr = ir.IntType(64), ir.DoubleType(), ir.IntType(8).as_pointer()
+    scanf = ir.Function(module, ir.FunctionType(ir.IntType(32), [i8_ptr], var_arg=True), name="scanf")
+    printf = ir.Function(module, ir.FunctionType(ir.IntType(32), [i8_ptr], var_arg=True), name="printf")
+    # Earlier runs left stdin at the end of the previous data file
+    clearerr = ir.Function(module, ir.FunctionType(ir.VoidType(), [i8_ptr]), name="clearerr")
+    stdin = ir.GlobalVariable(module, i8_ptr, name="stdin")
+    formats = {}
+    for name, text in (('read', "%lf"), ('write', "%.2f\n")):
+        data = bytearray(text.encode('utf8') + b'\0')
+        formats[name] = ir.GlobalVariable(module, ir.ArrayType(ir.IntType(8), len(data)), name=f"{name}_format")
+        formats[name].global_constant = True
+        formats[name].initializer = ir.Constant(formats[name].value_type, data)
+
+    main = ir.Function(module, ir.FunctionType(ir.VoidType(), []), name="main")
+    builder = ir.IRBuilder(main.append_basic_block(name="entry"))
+    slot = builder.alloca(double, name="x")
+    builder.call(clearerr, [builder.load(stdin)])
+    loop = main.append_basic_block(name="loop")
+    done = main.append_basic_block(name="done")
+    entry = builder.block
+    builder.branch(loop)
+    builder.position_at_end(loop)
+    counter = builder.phi(i64)
+    total = builder.phi(double)
+    counter.add_incoming(ir.Constant(i64, 0), entry)
+    total.add_incoming(ir.Constant(double, 0.0), entry)
+    builder.call(scanf, [builder.bitcast(formats['read'], i8_ptr), slot])
+    following_total = builder.fadd(total, builder.load(slot))
+    following = builder.add(counter, ir.Constant(i64, 1))
+    counter.add_incoming(following, loop)
+    total.add_incoming(following_total, loop)
+    builder.cbranch(builder.icmp_signed('<', following, ir.Constant(i64, numbers)), loop, done)
+    builder.position_at_end(done)
+    builder.call(printf, [builder.bitcast(formats['write'], i8_ptr), following_total])
+    builder.ret_void()
+    return str(module)
+
+
+def best_run_time(session, optimized_ir, data_path, repeat):
+    run_times = []
+    saved_stdin = os.dup(0)
+    try:
+        for _ in range(repeat):
+            data = os.open(data_path, os.O_RDONLY)
+            os.dup2(data, 0)
+            os.close(data)
+            with SuppressStdout():
+                start = time.perf_counter()
+                session.run_ir(optimized_ir)
+                run_times.append((time.perf_counter() - start) * 1000)
+    finally:
+        os.dup2(saved_stdin, 0)
+        os.close(saved_stdin)
+    return min(run_times)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--repeat', type=int, default=3, help="Runs per program (best time is reported)")
+    arg_parser.add_argument('--numbers', type=int, default=1000000, help="Numbers read by every program")
+    args = arg_parser.parse_args()
+    numbers = args.numbers - args.numbers % 4
+
+    session = JITSession()
+    with tempfile.TemporaryDirectory() as directory:
+        data_path = os.path.join(directory, 'numbers.txt')
+        write_numbers(data_path, numbers)
+        reference_ms = best_run_time(session, scanf_reference(numbers), data_path, args.repeat)
+        print(f"{'program':<16} {'time (ms)':>10} {'numbers/s':>12} {'speedup':>8}")
+        print(f"{'scanf':<16} {reference_ms:>10.1f} {numbers / reference_ms * 1000:>12.0f} {1:>7.2f}x")
+        for name, (template, per_statement) in PROGRAMS.items():
+            source = template.format(numbers=numbers, count=numbers // per_statement)
+            elapsed_ms = best_run_time(session, compiler.compile(source).optimized_ir, data_path, args.repeat)
+            print(f"{name:<16} {elapsed_ms:>10.1f} {numbers / elapsed_ms * 1000:>12.0f} "
+                  f"{reference_ms / elapsed_ms:>7.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
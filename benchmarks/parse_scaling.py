@@ -0,0 +1,79 @@
+"""
+Parser scaling benchmark.
+
+Generates programs of increasing size from statement templates and times
+tokenizing and parsing them. Parse time per statement must stay flat (linear
+total time): the script fails when the per-statement cost of the largest
+program exceeds that of the smallest by more than --max-ratio.
+
+Usage:
+python benchmarks/parse_scaling.py [--sizes 1000,10000,100000,200000] [--max-ratio 2.0]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import lexer
+from parser import parser
+
+DEFAULT_SIZES = (1000, 10000, 100000, 200000)
+
+# Straight-line statement templates ({i} is the statement index)
+TEMPLATES = (
+    'v{i} = {i} * 2 + 1',
+    'w{i} = (v{i} - 3) / 7',
+    'print("value", v{i}, w{i}, v{i} + w{i})',
+    'l{i} = [1, 2, 3, 4, 5, 6, 7, 8]',
+    'l{i}.append(v{i})',
+    'f{i}(v{i}, w{i}, 1, 2, 3)',
+)
+
+
+def generate_program(statement_count):
+    """Build a program with exactly `statement_count` statements."""
+    lines = [TEMPLATES[i % len(TEMPLATES)].format(i=i // len(TEMPLATES)) for i in range(statement_count)]
+    return '\n'.join(lines) + '\n'
+
+
+def time_parse(source):
+    """Return (tokenize seconds, parse seconds, statement count)."""
+    start = time.perf_counter()
+    tokens = lexer.tokenize(source)
+    lexed = time.perf_counter()
+    ast = parser.parse(lexer=lexer.TokenStream(tokens))
+    parsed = time.perf_counter()
+    return lexed - start, parsed - lexed, len(ast)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--sizes', default=','.join(str(size) for size in DEFAULT_SIZES),
+                            help="Comma-separated statement counts")
+    arg_parser.add_argument('--max-ratio', type=float, default=2.0,
+                            help="Largest allowed growth of the per-statement parse time")
+    args = arg_parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(',')]
+
+    print(f"{'statements':>12} {'lex (s)':>10} {'parse (s)':>10} {'parse us/stmt':>14}")
+    per_statement = []
+    for size in sizes:
+        lex_time, parse_time, parsed_count = time_parse(generate_program(size))
+        if parsed_count != size:
+            print(f"FAIL: parsed {parsed_count} statements, expected {size}")
+            return 1
+        per_statement.append(parse_time / size)
+        print(f"{size:>12} {lex_time:>10.3f} {parse_time:>10.3f} {per_statement[-1] * 1e6:>14.2f}")
+
+    ratio = per_statement[-1] / per_statement[0]
+    print(f"per-statement growth: {ratio:.2f}x (limit {args.max_ratio:.2f}x)")
+    if ratio > args.max_ratio:
+        print("FAIL: parse time grows faster than linearly")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
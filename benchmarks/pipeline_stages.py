@@ -0,0 +1,256 @@
+"""
+End-to-end compiler benchmark with per-stage timings.
+
+Runs a corpus of generated programs (growing in size, if/elif chain length and
+nesting depth) and the hand-written programs of benchmarks/corpus through the
+whole pipeline, timing every stage separately:
+
+lex           lexer.tokenize
+parse         parser.parse
+analyze       SemanticAnalyzer.analyze_program
+fold          fold_constants (constant folding and branch pruning)
+codegen       compile_code
+optimize      CodeOptimizer.optimize_module
+jit_finalize  loading the optimized module into MCJIT and finalizing it
+execute       running the native code (its output is discarded)
+
+The analyzer and the code generator find the handler of every node in a
+table built once per class (node_dispatch.dispatch_table). The last two
+columns show what that costs: the number of dispatched nodes (tuples) in the
+program's AST and the time of looking up both handlers of all of them.
+
+The best time of --repeat runs is kept for every stage. Results can be written
+to JSON with --output; --compare checks them against a stored baseline and
+fails (exit status 1) when a stage got slower than --threshold times its
+baseline time by more than --min-delta-ms.
+
+Usage:
+python benchmarks/pipeline_stages.py [--repeat N] [--filter TEXT] [--output results.json]
+python benchmarks/pipeline_stages.py --compare baseline.json [--threshold 1.25] [--min-delta-ms 2.0]
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import lexer
+from parser import parser
+from semantic_analyzer import SemanticAnalyzer, NODE_ANALYZERS
+from constant_folder import fold_constants
+from code_generator import compile_code, NODE_VISITORS
+from code_optimizer import CodeOptimizer
+from code_executor import JITSession
+from function_calls import SuppressStdout
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus')
+
+STAGES = ('lex', 'parse', 'analyze', 'fold', 'codegen', 'optimize', 'jit_finalize', 'execute')
+
+DEFAULT_THRESHOLD = 1.25
+DEFAULT_MIN_DELTA_MS = 2.0
+
+
+def straight_line_program(statement_count):
+    """Arithmetic and prints without any control flow."""
+    templates = (
+        'v{i} = {i} * 3 + 1',
+        'w{i} = (v{i} - 2) / 7 + v{i} * 0.5',
+        'print("value", v{i}, w{i}, v{i} + w{i})',
+    )
+    lines = [templates[i % len(templates)].format(i=i // len(templates)) for i in range(statement_count)]
+    return '\n'.join(lines) + '\n'
+
+
+def if_chain_program(branch_count):
+    """A loop around one if/elif/else chain with `branch_count` conditions."""
+    lines = ['hits = 0', 'for i in range(0, 20000):', '    if i < 1:', '        hits = hits + 1']
+    for branch in range(1, branch_count):
+        lines.append(f'    elif i < {branch * 7}:')
+        lines.append(f'        hits = hits + {branch + 1}')
+    lines += ['    else:', '        hits = hits + 0', '', 'print("hits", hits)']
+    return '\n'.join(lines) + '\n'
+
+
+def nested_program(depth):
+    """Counted loops and conditions nested `depth` levels deep."""
+    lines = ['acc = 0']
+    counters = []
+    for level in range(depth):
+        indent = '    ' * (2 * level)
+        counters.append(f'n{level}')
+        lines.append(f'{indent}for n{level} in range(0, 3):')
+        lines.append(f'{indent}    if n{level} < 2:')
+    indent = '    ' * (2 * depth)
+    lines.append(f'{indent}acc = acc + {" + ".join(counters)} * 2 - 1')
+    lines += ['', 'print("acc", acc)']
+    return '\n'.join(lines) + '\n'
+
+
+def load_corpus():
+    """Return (name, source) pairs of every program in the benchmark corpus."""
+    programs = []
+    for size in (1000, 5000, 20000):
+        programs.append((f'straight_line_{size}', straight_line_program(size)))
+    for branches in (10, 100, 400):
+        programs.append((f'if_chain_{branches}', if_chain_program(branches)))
+    for depth in (2, 5, 8):
+        programs.append((f'nested_{depth}', nested_program(depth)))
+    for file_name in sorted(os.listdir(CORPUS_DIR)):
+        if file_name.endswith('.src'):
+            with open(os.path.join(CORPUS_DIR, file_name)) as f:
+                programs.append((os.path.splitext(file_name)[0], f.read()))
+    return programs
+
+
+def dispatched_node_types(ast):
+    """Return the type of every node of an AST dispatched by type (walked iteratively: elif chains nest deeply)."""
+    node_types = []
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, tuple) and node and isinstance(node[0], str):
+            node_types.append(node[0])
+        if isinstance(node, (list, tuple)):
+            stack.extend(node)
+    return node_types
+
+
+def dispatch_time(node_types):
+    """Time (ms) of looking up the analyzer and the code generator visitor of every node type."""
+    start = time.perf_counter()
+    for node_type in node_types:
+        NODE_ANALYZERS.get(node_type)
+        NODE_VISITORS.get(node_type)
+    return (time.perf_counter() - start) * 1000
+
+
+def run_pipeline(source, session, execute=True):
+    """Compile (and run) a program once, returning the time of each stage in milliseconds."""
+    timings = {}
+
+    def timed(stage, func, *args):
+        start = time.perf_counter()
+        value = func(*args)
+        timings[stage] = (time.perf_counter() - start) * 1000
+        return value
+
+    tokens = timed('lex', lexer.tokenize, source)
+    ast = timed('parse', lambda: parser.parse(lexer=lexer.TokenStream(tokens)))
+    analyzer = timed('analyze', SemanticAnalyzer().analyze_program, ast)
+    function_symbols = {name: info['symbols'] for name, info in analyzer.functions.items()}
+    ast, _ = timed('fold', fold_constants, ast, analyzer.symbols, function_symbols)
+    ir_code = timed('codegen', compile_code, ast, analyzer.symbols, function_symbols)
+    optimized_module = timed('optimize', lambda: CodeOptimizer(ir_code).optimize_module())
+
+    def load_and_finalize():
+        handle = session.add_module(optimized_module)
+        session.get_function_address('main')
+        return handle
+
+    handle = timed('jit_finalize', load_and_finalize)
+    try:
+        if execute:
+            with SuppressStdout():
+                timed('execute', session.run)
+    finally:
+        session.remove_module(handle)
+    return timings
+
+
+def benchmark(programs, repeat, execute=True):
+    """Run every program `repeat` times and keep the best time of each stage."""
+    session = JITSession()
+    results = {}
+    for name, source in programs:
+        best = {}
+        for _ in range(repeat):
+            for stage, elapsed in run_pipeline(source, session, execute).items():
+                best[stage] = min(elapsed, best.get(stage, elapsed))
+        node_types = dispatched_node_types(parser.parse(lexer=lexer.TokenStream(lexer.tokenize(source))))
+        dispatch = {'nodes': len(node_types), 'ms': min(dispatch_time(node_types) for _ in range(repeat))}
+        results[name] = {
+            'source_lines': source.count('\n'),
+            'stages': best,
+            'total_ms': sum(best.values()),
+            'dispatch': dispatch,
+        }
+        print(format_row(name, best, dispatch), flush=True)
+    return results
+
+
+def format_row(name, stages, dispatch):
+    cells = ''.join(f"{stages[stage]:>13.2f}" if stage in stages else f"{'-':>13}" for stage in STAGES)
+    return f"{name:<20}{cells}{dispatch['nodes']:>8}{dispatch['ms']:>10.3f}"
+
+
+def environment():
+    """Describe the machine and toolchain the results were measured on."""
+    import llvmlite
+    import llvmlite.binding as llvm
+
+    return {
+        'python': platform.python_version(),
+        'llvmlite': llvmlite.__version__,
+        'llvm': '.'.join(str(part) for part in llvm.llvm_version_info),
+        'machine': platform.machine(),
+        'system': platform.system(),
+    }
+
+
+def compare(results, baseline, threshold, min_delta_ms):
+    """Return the (program, stage, baseline ms, current ms) entries that regressed."""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline['programs']:
+            continue
+        baseline_stages = baseline['programs'][name]['stages']
+        for stage, elapsed in result['stages'].items():
+            before = baseline_stages.get(stage)
+            if before is None:
+                continue
+            if elapsed > before * threshold and elapsed - before > min_delta_ms:
+                regressions.append((name, stage, before, elapsed))
+    return regressions
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--repeat', type=int, default=3, help="Runs per program (best time per stage is kept)")
+    arg_parser.add_argument('--filter', default='', help="Only run programs whose name contains this text")
+    arg_parser.add_argument('--no-execute', action='store_true', help="Compile and finalize, but do not run")
+    arg_parser.add_argument('--output', help="Write the results to this JSON file")
+    arg_parser.add_argument('--compare', metavar='BASELINE', help="JSON results to check for regressions against")
+    arg_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                            help="Largest allowed ratio of a stage time to its baseline")
+    arg_parser.add_argument('--min-delta-ms', type=float, default=DEFAULT_MIN_DELTA_MS,
+                            help="Ignore slowdowns smaller than this (timer noise)")
+    args = arg_parser.parse_args()
+
+    programs = [(name, source) for name, source in load_corpus() if args.filter in name]
+    print(f"{'program (ms)':<20}" + ''.join(f"{stage:>13}" for stage in STAGES) + f"{'nodes':>8}{'dispatch':>10}")
+    results = benchmark(programs, args.repeat, execute=not args.no_execute)
+
+    report = {'environment': environment(), 'repeat': args.repeat, 'programs': results}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+        for name, stage, before, elapsed in regressions:
+            print(f"REGRESSION: {name} {stage}: {before:.2f} ms -> {elapsed:.2f} ms ({elapsed / before:.2f}x)")
+        if regressions:
+            return 1
+        print(f"no regressions against {args.compare} (threshold {args.threshold:.2f}x)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
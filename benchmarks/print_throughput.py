@@ -0,0 +1,121 @@
+"""
+Output benchmark: programs printing a million lines.
+
+Each program is compiled through the full pipeline and run natively in a JIT
+session with its output discarded (file descriptor 1 goes to /dev/null, so
+the numbers measure formatting and buffering, not the terminal). As a
+reference, the same lines are printed by a hand-built loop making one
+printf("%.2f ...\\n") call per line, the way print was lowered before the
+runtime output buffer. The buffered runs are repeated for several buffer
+sizes (PYCOMPILER_OUTPUT_BUFFER).
+
+Usage:
+python benchmarks/print_throughput.py [--repeat N] [--lines N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llvmlite import ir
+
+import compiler
+from code_executor import JITSession
+from function_calls import SuppressStdout
+from runtime import OUTPUT_BUFFER_ENV
+
+# name: (program printing `lines` lines, values per line, whether the values are integers)
+PROGRAMS = {
+    'ints': ("""
+for i in range(0, {lines}):
+    print(i, i * 3 - 7)
+""", 2, True),
+    'floats': ("""
+for i in range(0, {lines}):
+    x = i * 0.25
+    print(x, x / 3.0)
+""", 2, False),
+    'labelled': ("""
+for i in range(0, {lines}):
+    print("item", i, "of", {lines})
+""", 2, True),
+}
+
+BUFFER_SIZES = (4 * 1024, 64 * 1024, 1024 * 1024)
+
+
+def printf_reference(lines, values, integers):
+    """IR of `main` printing the same kind of lines with one printf call each."""
+    module = ir.Module(name="printf_reference")
+    i64, double = ir.IntType(64), ir.DoubleType()
+    printf = ir.Function(module, ir.FunctionType(ir.IntType(32), [ir.IntType(8).as_pointer()], var_arg=True),
+                         name="printf")
+    text = bytearray(' '.join(['%.2f'] * values).encode('utf8') + b'\n\0')
+    line_format = ir.GlobalVariable(module, ir.ArrayType(ir.IntType(8), len(text)), name="format")
+    line_format.global_constant = True
+    line_format.initializer = ir.Constant(line_format.value_type, text)
+
+    main = ir.Function(module, ir.FunctionType(ir.VoidType(), []), name="main")
+    builder = ir.IRBuilder(main.append_basic_block(name="entry"))
+    loop = main.append_basic_block(name="loop")
+    done = main.append_basic_block(name="done")
+    entry = builder.block
+    builder.branch(loop)
+    builder.position_at_end(loop)
+    counter = builder.phi(i64)
+    counter.add_incoming(ir.Constant(i64, 0), entry)
+    value = builder.sitofp(counter, double)
+    if not integers:
+        value = builder.fmul(value, ir.Constant(double, 0.25))
+    arguments = [value] + [builder.fadd(value, ir.Constant(double, float(n))) for n in range(1, values)]
+    builder.call(printf, [builder.bitcast(line_format, ir.IntType(8).as_pointer()), *arguments])
+    following = builder.add(counter, ir.Constant(i64, 1))
+    counter.add_incoming(following, loop)
+    builder.cbranch(builder.icmp_signed('<', following, ir.Constant(i64, lines)), loop, done)
+    builder.position_at_end(done)
+    builder.ret_void()
+    return str(module)
+
+
+def best_run_time(session, optimized_ir, repeat):
+    run_times = []
+    for _ in range(repeat):
+        with SuppressStdout():
+            start = time.perf_counter()
+            session.run_ir(optimized_ir)
+            run_times.append((time.perf_counter() - start) * 1000)
+    return min(run_times)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--repeat', type=int, default=3, help="Runs per program (best time is reported)")
+    arg_parser.add_argument('--lines', type=int, default=1000000, help="Lines printed by every program")
+    args = arg_parser.parse_args()
+
+    session = JITSession()
+    sizes = [f"{size // 1024} KiB (ms)" for size in BUFFER_SIZES]
+    print(f"{'program':<10} {'printf (ms)':>12}" + ''.join(f"{size:>16}" for size in sizes) + f"{'speedup':>9}")
+    saved_setting = os.environ.get(OUTPUT_BUFFER_ENV)
+    try:
+        for name, (template, values, integers) in PROGRAMS.items():
+            reference_ms = best_run_time(session, printf_reference(args.lines, values, integers), args.repeat)
+            optimized_ir = compiler.compile(template.format(lines=args.lines)).optimized_ir
+            buffered_ms = []
+            for size in BUFFER_SIZES:
+                os.environ[OUTPUT_BUFFER_ENV] = str(size)
+                buffered_ms.append(best_run_time(session, optimized_ir, args.repeat))
+            cells = ''.join(f"{elapsed:>16.1f}" for elapsed in buffered_ms)
+            print(f"{name:<10} {reference_ms:>12.1f}{cells}{reference_ms / min(buffered_ms):>8.2f}x")
+    finally:
+        if saved_setting is None:
+            os.environ.pop(OUTPUT_BUFFER_ENV, None)
+        else:
+            os.environ[OUTPUT_BUFFER_ENV] = saved_setting
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+Startup-time budget for front-end-only compiler runs (e.g. editor integrations
+that check the program on every save).
+
+Each measurement runs in a fresh interpreter so that module caching does not
+hide import costs. The script fails (exit status 1) when the median import
+time or the median `main.py --check` wall time exceeds its budget, or when the
+LLVM back end gets imported by a front-end-only run.
+
+Usage:
+python benchmarks/startup_budget.py [--runs N] [--import-budget-ms MS] [--check-budget-ms MS]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_IMPORT_BUDGET_MS = 80.0
+DEFAULT_CHECK_BUDGET_MS = 250.0
+
+# Imports the front end and analyzes a small program, reporting its own timings
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import compiler, lexer, parser, semantic_analyzer
+imported = time.perf_counter()
+compiler.compile("x = 1\\ny = x + 2\\nprint(y)\\n", stages=['analyze'])
+done = time.perf_counter()
+print(json.dumps({
+    'import_ms': (imported - start) * 1000,
+    'analyze_ms': (done - imported) * 1000,
+    'llvmlite_loaded': 'llvmlite' in sys.modules,
+}))
+"""
+
+SAMPLE_PROGRAM = """x = 10
+y = 3
+z = x * y + 2
+print("z is", z)
+"""
+
+
+def measure_probe(runs):
+    samples = []
+    for _ in range(runs):
+        completed = subprocess.run([sys.executable, '-c', PROBE], cwd=REPO_DIR,
+                                   capture_output=True, text=True, check=True)
+        samples.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+    return samples
+
+
+def measure_check(runs, source_path):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, 'main.py', '-q', '--check', source_path], cwd=REPO_DIR,
+                       capture_output=True, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--runs', type=int, default=5)
+    arg_parser.add_argument('--import-budget-ms', type=float, default=DEFAULT_IMPORT_BUDGET_MS)
+    arg_parser.add_argument('--check-budget-ms', type=float, default=DEFAULT_CHECK_BUDGET_MS)
+    args = arg_parser.parse_args()
+
+    probes = measure_probe(args.runs)
+    import_ms = statistics.median(sample['import_ms'] for sample in probes)
+    analyze_ms = statistics.median(sample['analyze_ms'] for sample in probes)
+    llvmlite_loaded = any(sample['llvmlite_loaded'] for sample in probes)
+
+    with tempfile.NamedTemporaryFile('w', suffix='.src', delete=False) as f:
+        f.write(SAMPLE_PROGRAM)
+    try:
+        check_ms = statistics.median(measure_check(args.runs, f.name))
+    finally:
+        os.remove(f.name)
+
+    print(f"front-end import:     {import_ms:8.1f} ms (budget {args.import_budget_ms:.1f} ms)")
+    print(f"front-end compile:    {analyze_ms:8.1f} ms")
+    print(f"main.py --check run:  {check_ms:8.1f} ms (budget {args.check_budget_ms:.1f} ms)")
+    print(f"llvmlite imported:    {'yes' if llvmlite_loaded else 'no'}")
+
+    failures = []
+    if import_ms > args.import_budget_ms:
+        failures.append("front-end import time exceeds its budget")
+    if check_ms > args.check_budget_ms:
+        failures.append("main.py --check wall time exceeds its budget")
+    if llvmlite_loaded:
+        failures.append("llvmlite was imported by a front-end-only run")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,58 +1,198 @@
 import llvmlite.binding as llvm
 import ctypes
 from ctypes import CFUNCTYPE, c_int32, c_char_p, POINTER
-from llvmlite import ir
+from llvm_target import initialize_llvm, create_target_machine, get_target_machine
 import platform
+import time
 
 
+def load_c_library():
+    """Load the C library of the host platform through ctypes."""
+    if platform.system() == 'Windows':
+        return ctypes.CDLL('msvcrt')
+    if platform.system() == 'Darwin':
+        return ctypes.CDLL('libc.dylib')
+    return ctypes.CDLL('libc.so.6')
 
-def execute_ir(ir_code):
-    # Initialize LLVM
-    llvm.initialize()
-    llvm.initialize_native_target()
-    llvm.initialize_native_asmprinter()
 
-    try:
-        # Create module from IR
-        module = llvm.parse_assembly(ir_code)
+class JITSession:
+    """
+    Long-lived MCJIT session.
+
+    LLVM initialization, the target machine, the execution engine and the C
+    library are set up once, so a process running many small programs only pays
+    that cost on the first one. Modules can be added and removed incrementally;
+    symbols defined in one module are resolved from every other module loaded
+    into the session.
+    """
+
+    def __init__(self, target_machine=None):
+        """
+        Parameters:
+        target_machine (TargetMachine): Target to compile for (defaults to a new host target). The
+            execution engine takes ownership of it, so it must not be shared with another engine.
+        """
+        initialize_llvm()
+        # MCJIT owns (and eventually deletes) its target machine: never hand it the shared one
+        self.target_machine = target_machine or create_target_machine()
+
+        # Create execution engine from an empty backing module
+        backing_mod = llvm.parse_assembly("")
+        self.engine = llvm.create_mcjit_compiler(backing_mod, self.target_machine)
+
+        # Get C library for printf and for flushing stdio after each run
+        self.c_lib = load_c_library()
+        self.printf = self.c_lib.printf
+        self.printf.argtypes = [c_char_p]
+        self.printf.restype = c_int32
+
+        self.modules = {}  # Loaded modules by handle
+        self.module_counter = 0
+        self.finalized = True
+        self.finalize_time = 0.0  # Seconds spent in the most recent MCJIT finalize
+
+    def add_module(self, ir_code, name=None):
+        """
+        Add a module to the session.
+
+        Parameters:
+        ir_code (str or ModuleRef): LLVM IR text or an already parsed module.
+        name (str): Optional handle; a unique one is generated when omitted.
+
+        Returns:
+        str: The handle to pass to remove_module().
+        """
+        # Modules parsed here belong to the session; modules passed in stay the caller's
+        owned = isinstance(ir_code, str)
+        module = llvm.parse_assembly(ir_code) if owned else ir_code
         module.verify()  # Verify the module
-        
-        # Create execution engine
-        target = llvm.Target.from_default_triple()
-        target_machine = target.create_target_machine()
-        target_machine.set_asm_verbosity(True)
-        
-        # Create execution engine
+
+        if name is None:
+            name = f"module_{self.module_counter}"
+            self.module_counter += 1
+        if name in self.modules:
+            raise ValueError(f"Module '{name}' is already loaded in this JIT session")
+
+        self.engine.add_module(module)
+        self.modules[name] = (module, owned)
+        self.finalized = False
+        return name
+
+    def remove_module(self, name):
+        """Remove a previously added module, releasing its symbols (caller-provided modules stay usable)."""
+        module, owned = self.modules.pop(name)
+        self.engine.remove_module(module)
+        if owned:
+            module.close()
+
+    def add_symbol(self, name, address):
+        """Make a host symbol (e.g. a ctypes callback) resolvable from the loaded modules."""
+        llvm.add_symbol(name, address)
+
+    def get_function_address(self, name):
+        """Return the address of a function defined in any loaded module."""
+        if not self.finalized:
+            start = time.perf_counter()
+            self.engine.finalize_object()
+            self.finalize_time = time.perf_counter() - start
+            self.finalized = True
+        address = self.engine.get_function_address(name)
+        if not address:
+            raise LookupError(f"Symbol '{name}' is not defined in this JIT session")
+        return address
+
+    def run(self, entry="main"):
+        """Call a `void()` entry point and flush the C stdio buffers afterwards."""
+        func_ptr = self.get_function_address(entry)
+
+        # Create callable and call it
+        cfunc = CFUNCTYPE(None)(func_ptr)
+        cfunc()
+        self.c_lib.fflush(None)
+
+    def run_ir(self, ir_code, entry="main"):
+        """Load a module, call its entry point and unload it again."""
+        name = self.add_module(ir_code)
+        try:
+            self.run(entry)
+        finally:
+            self.remove_module(name)
+
+    def run_object(self, object_code, entry="main"):
+        """
+        Call the entry point of native object code.
+
+        MCJIT cannot unload object files, so each object runs in its own
+        short-lived engine. That engine deletes its target machine when it is
+        collected, so it gets a new one rather than this session's.
+        """
         backing_mod = llvm.parse_assembly("")
-        engine = llvm.create_mcjit_compiler(backing_mod, target_machine)
-        
-        # Add the module and make sure it is ready for execution
-        engine.add_module(module)
+        engine = llvm.create_mcjit_compiler(backing_mod, create_target_machine())
+        engine.add_object_file(llvm.ObjectFileRef.from_data(object_code))
+        start = time.perf_counter()
         engine.finalize_object()
-        
-        # Get C library for printf
-        if platform.system() == 'Windows':
-            c_lib = ctypes.CDLL('msvcrt')
-        else:
-            if platform.system() == 'Darwin':
-                c_lib = ctypes.CDLL('libc.dylib')
-            else:
-                c_lib = ctypes.CDLL('libc.so.6')
-        
-        # Set up printf
-        printf = c_lib.printf
-        printf.argtypes = [c_char_p]
-        printf.restype = c_int32
-        
-        # Get main function pointer
-        func_ptr = engine.get_function_address("main")
-        
-        # Create callable
-        cfunc = CFUNCTYPE(None)(func_ptr)
-        
-        # Call main function
+        self.finalize_time = time.perf_counter() - start
+
+        cfunc = CFUNCTYPE(None)(engine.get_function_address(entry))
         cfunc()
-        
+        self.c_lib.fflush(None)
+
+
+_default_session = None
+
+
+def get_default_session():
+    """Return the process-wide JIT session (created on first use)."""
+    global _default_session
+    if _default_session is None:
+        _default_session = JITSession()
+    return _default_session
+
+
+def execute_ir(ir_code):
+    """
+    Execute a program in the process-wide JIT session.
+
+    Parameters:
+    ir_code (str or ModuleRef): Optimized LLVM IR text or an already parsed module (not re-parsed).
+    """
+    try:
+        # Run the module in the shared session, then unload it
+        get_default_session().run_ir(ir_code)
+    except Exception as e:
+        print(f"Error during execution: {str(e)}")
+        raise
+
+
+def emit_object_code(ir_code):
+    """
+    Compile optimized LLVM IR down to native object code for the host target.
+
+    Parameters:
+    ir_code (str or ModuleRef): The LLVM IR to compile, as text or as a parsed module.
+
+    Returns:
+    bytes: The contents of a relocatable object file.
+    """
+    target_machine = get_target_machine()
+    if isinstance(ir_code, str):
+        module = llvm.parse_assembly(ir_code)
+        module.verify()
+    else:
+        module = ir_code
+    module.triple = target_machine.triple
+    return target_machine.emit_object(module)
+
+
+def execute_object(object_code):
+    """
+    Execute previously compiled native object code (e.g. from the compilation cache).
+
+    Parameters:
+    object_code (bytes): The contents of an object file defining `main`.
+    """
+    try:
+        get_default_session().run_object(object_code)
     except Exception as e:
         print(f"Error during execution: {str(e)}")
-        raise
\ No newline at end of file
+        raise
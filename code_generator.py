@@ -1,17 +1,224 @@
 from llvmlite import ir
 import llvmlite.binding as llvm
+import logging
+import math
+import runtime
+from node_dispatch import dispatch_table
+from semantic_analyzer import SymbolTable
+
+logger = logging.getLogger('compiler.codegen')
+
+# Inlining heuristics for user-defined functions (sizes in AST nodes)
+ALWAYS_INLINE_SIZE = 12  # Tiny helpers are always inlined
+INLINE_HINT_SIZE = 40    # Small helpers get an inline hint
+
+# Largest right operand of and/or (in AST nodes) evaluated unconditionally instead of short-circuited
+CHEAP_OPERAND_SIZE = 8
+
+
+def count_nodes(node):
+    """Count the AST nodes of a subtree."""
+    if isinstance(node, (list, tuple)):
+        return 1 + sum(count_nodes(child) for child in node)
+    return 1
+
+
+def calls_function(node, func_name):
+    """Whether a subtree contains a call to the given function."""
+    if isinstance(node, tuple) and node and node[0] == 'function_call' and node[1] == func_name:
+        return True
+    if isinstance(node, (list, tuple)):
+        return any(calls_function(child, func_name) for child in node)
+    return False
+
+
+def contains_loop(node):
+    """Whether a subtree contains a loop (walked iteratively: elif chains nest deeply)."""
+    pending = [node]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, tuple) and node and node[0] in ('for', 'while'):
+            return True
+        if isinstance(node, (list, tuple)):
+            pending.extend(node)
+    return False
+
+
+def inline_attributes(func_name, body):
+    """
+    Pick inlining attributes for a user-defined function.
+
+    Small, loop-free, non-recursive helpers are forced inline so they cost
+    nothing in hot loops; slightly larger ones get a hint and the optimizer's
+    inliner decides. Recursive functions are left to the inliner's cost model.
+    """
+    if calls_function(body, func_name):
+        return ()
+    size = count_nodes(body)
+    if size <= ALWAYS_INLINE_SIZE and not contains_loop(body):
+        return ('alwaysinline',)
+    if size <= INLINE_HINT_SIZE:
+        return ('inlinehint',)
+    return ()
+
+
+def iterator_indexed_lists(body, iterator):
+    """
+    Lists a counted loop body always indexes with the loop counter, as in `values[i]`.
+
+    Only innermost loops whose body never assigns the counter, never assigns
+    or appends to those lists and defines no function qualify: one check of
+    the whole range against the list lengths before the loop then covers every
+    access. Accesses under an if or the right of and/or may not run (the list
+    may not even exist yet), so only unconditional ones count.
+    """
+    if contains_loop(body) or iterator in assigned_names(body):
+        return []
+    indexed = set()
+    modified = set(assigned_names(body))
+
+    pending = [(body, False)]
+    while pending:
+        node, conditional = pending.pop()
+        if isinstance(node, list):
+            pending.extend((item, conditional) for item in node)
+        elif isinstance(node, tuple) and node:
+            kind = node[0]
+            if kind == 'function_def':
+                modified.add(None)  # Never duplicated: the body is generated twice
+                break
+            if kind == 'list_append':
+                modified.add(node[1])
+            if kind == 'list_access' and node[2] == iterator and not conditional:
+                indexed.add(node[1])
+            for position, child in enumerate(node[1:], 1):
+                if isinstance(child, (list, tuple)):
+                    branch = kind == 'if_stmt' or (kind in ('and', 'or') and position == 2)
+                    pending.append((child, conditional or branch))
+    if None in modified:
+        return []
+    return sorted(indexed - modified)
+
+
+# Branch weights (taken, not taken) of checks that practically never fail
+UNLIKELY_BRANCH_WEIGHTS = [1, 1048575]
+LIKELY_BRANCH_WEIGHTS = UNLIKELY_BRANCH_WEIGHTS[::-1]
+
+
+def assigned_names(node):
+    """Count the definitions of every variable name in a function body (nested functions excluded)."""
+    counts = {}
+    pending = [node]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, list):
+            pending.extend(node)
+        elif isinstance(node, tuple) and node:
+            kind = node[0]
+            if kind == 'function_def':
+                continue  # Separate scope
+            if kind in ('assign', 'input', 'list_create', 'for'):
+                counts[node[1]] = counts.get(node[1], 0) + 1
+            elif kind == 'input_multiple':
+                for name in node[1]:
+                    counts[name] = counts.get(name, 0) + 1
+            pending.extend(child for child in node[1:] if isinstance(child, (list, tuple)))
+    return counts
+
+
+def constant_nonzero_variables(body, symbols):
+    """Variables assigned exactly once, to a nonzero constant, in a function body (definitions from its symbols)."""
+    nonzero = set()
+
+    def visit(node):
+        if isinstance(node, list):
+            for item in node:
+                visit(item)
+        elif isinstance(node, tuple) and node and node[0] != 'function_def':
+            slot = symbols.slots.get(node[1]) if node[0] == 'assign' else None
+            if slot is not None and symbols.definitions[slot] == 1:
+                value = node[2]
+                if isinstance(value, (int, float)) and not isinstance(value, bool) and value != 0:
+                    nonzero.add(node[1])
+            for child in node[1:]:
+                if isinstance(child, (list, tuple)):
+                    visit(child)
+
+    visit(body)
+    return nonzero
+
+
+def appended_lists(node):
+    """Names of the lists a function body appends to (nested functions excluded)."""
+    names = set()
+    pending = [node]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, list):
+            pending.extend(node)
+        elif isinstance(node, tuple) and node and node[0] != 'function_def':
+            if node[0] == 'list_append':
+                names.add(node[1])
+            pending.extend(child for child in node[1:] if isinstance(child, (list, tuple)))
+    return names
+
+
+def range_excludes_zero(start, end, step=1):
+    """Whether every value of range(start, end, step) is provably nonzero (constant bounds and step)."""
+    def constant(value):
+        # The loop runs on the bounds truncated to i64 (fptosi), so a float bound counts as its integer part
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return None
+        if isinstance(value, float):
+            return int(value) if math.isfinite(value) else None
+        return value
+
+    start, end, step = constant(start), constant(end), constant(step)
+    if step is None or step == 0:
+        return False
+    if step < 0:
+        # A reverse range: every value lies in (end, start]
+        return (start is not None and start < 0) or (end is not None and end >= 0)
+    if start is not None:
+        if start > 0:
+            return True  # The counter only grows from a positive start
+        if end is not None and end <= 0:
+            return True  # Every value lies in [start, end) with end <= 0
+    return False
+
 
 class CodeGenerator:
-    def __init__(self):
+    def __init__(self, symbols=None, function_symbols=None, external_functions=None,
+                 function_linkage='internal', entry=True):
+        """
+        Parameters:
+        symbols (SymbolTable): Resolved variables of the main program (from the semantic analyzer).
+        function_symbols (dict): Resolved variables of every user function, by function.
+        external_functions (dict): Parameter counts of user functions defined in other modules, by name.
+        function_linkage (str): Linkage of the user functions defined here ('external' when other modules call them).
+        entry (bool): Whether to generate the `main` entry point.
+        """
+        # Variables resolved by the semantic analyzer: one stack slot each, 'int' ones with native i64 storage
+        self.symbols = symbols or SymbolTable()
+        self.function_symbols = function_symbols or {}  # Same, per user function
+        self.slots = []  # Stack slots of the current function's variables, by slot index
+        self.function_linkage = function_linkage
         self.module = ir.Module(name="main")
         self.builder = None
         self.declare_printf()
-        self.declare_scanf()
         self.func_ty = ir.FunctionType(ir.VoidType(), [])
-        self.main = ir.Function(self.module, self.func_ty, name="main")
-        self.entry_block = self.main.append_basic_block(name="entry")
-        self.builder = ir.IRBuilder(self.entry_block)
-        self.variables = {}
+        self.main = None
+        if entry:
+            self.main = ir.Function(self.module, self.func_ty, name="main")
+            self.entry_block = self.main.append_basic_block(name="entry")
+            self.builder = ir.IRBuilder(self.entry_block)
+        self.function = self.main  # Function currently being generated
+        self.user_functions = {}  # Compiled (or declared) user-defined functions by name
+        for func_name, param_count in (external_functions or {}).items():
+            self.declare_user_function(func_name, param_count)
+        self.error_blocks = {}  # Shared runtime error blocks of the current function, by handler
+        self.nonzero_variables = set()  # Variables proven to never hold zero at the current point
+        self.unchecked_indices = set()  # (list, index variable) accesses proven in bounds at the current point
         self.string_counter = 0
         self.strings = {}
         self.loop_stack = []
@@ -22,25 +229,95 @@ class CodeGenerator:
         self.printf = ir.Function(self.module, printf_ty, name="printf")
 
     def declare_exit(self):
-        exit_ty = ir.FunctionType(ir.VoidType(), [])
-        self.exit = ir.Function(self.module, exit_ty, name="exit")
+        if 'exit' in self.module.globals:
+            return self.module.globals['exit']
+        exit_ty = ir.FunctionType(ir.VoidType(), [ir.IntType(32)])
+        return ir.Function(self.module, exit_ty, name="exit")
 
-    def declare_scanf(self):
-        scanf_ty = ir.FunctionType(ir.IntType(32), [ir.PointerType(ir.IntType(8))], var_arg=True)
-        self.scanf = ir.Function(self.module, scanf_ty, name="scanf")
-    
     def create_error_handling_printf(self, error_msg):
         """Create a printf for error messages"""
+        # Everything printed before the error comes first
+        self.builder.call(runtime.declare_runtime_function(self.module, '__out_flush'), [])
         error_str = self.create_string_constant(error_msg + "\n")
         error_ptr = self.builder.bitcast(error_str, ir.PointerType(ir.IntType(8)))
         self.builder.call(self.printf, [error_ptr])
         # Create an exit function call to terminate the program
-        exit_ty = ir.FunctionType(ir.VoidType(), [])
-        if 'exit' not in self.module.globals:
-            exit_func = ir.Function(self.module, exit_ty, 'exit')
+        self.builder.call(self.declare_exit(), [ir.Constant(ir.IntType(32), 1)])
+
+    def declare_error_handler(self, name, error_msg):
+        """Define a cold, out-of-line handler that reports a runtime error and exits."""
+        if name in self.module.globals:
+            return self.module.globals[name]
+        handler = ir.Function(self.module, ir.FunctionType(ir.VoidType(), []), name=name)
+        handler.linkage = 'internal'
+        for attribute in ('cold', 'noreturn', 'noinline', 'nounwind'):
+            handler.attributes.add(attribute)
+
+        saved_builder = self.builder
+        self.builder = ir.IRBuilder(handler.append_basic_block(name="entry"))
+        self.create_error_handling_printf(error_msg)
+        self.builder.unreachable()
+        self.builder = saved_builder
+        return handler
+
+    def get_error_block(self, handler_name, error_msg, block_name):
+        """Return the current function's shared block calling a runtime error handler."""
+        if handler_name not in self.error_blocks:
+            handler = self.declare_error_handler(handler_name, error_msg)
+            block = self.function.append_basic_block(name=block_name)
+            with self.builder.goto_block(block):
+                self.builder.call(handler, [])
+                self.builder.unreachable()
+            self.error_blocks[handler_name] = block
+        return self.error_blocks[handler_name]
+
+    def get_division_error_block(self):
+        """Return the shared division-by-zero error block of the current function."""
+        return self.get_error_block("__division_by_zero", "Error: Division by zero!", "div.error")
+
+    def check_divisor(self, divisor):
+        """Branch to the shared error block when the divisor is zero (predicted never taken)."""
+        if self.is_integer(divisor):
+            is_zero = self.builder.icmp_signed('==', divisor, ir.Constant(divisor.type, 0))
         else:
-            exit_func = self.module.globals['exit']
-        self.builder.call(exit_func, [])
+            divisor = self.convert(divisor, ir.DoubleType())
+            is_zero = self.builder.fcmp_ordered('==', divisor, ir.Constant(ir.DoubleType(), 0.0))
+        div_ok_block = self.function.append_basic_block(name="div.ok")
+        branch = self.builder.cbranch(is_zero, self.get_division_error_block(), div_ok_block)
+        branch.set_weights(UNLIKELY_BRANCH_WEIGHTS)
+        self.builder.position_at_start(div_ok_block)
+
+    def is_nonzero(self, node):
+        """Range check: whether an expression can be proven to never evaluate to zero."""
+        if isinstance(node, bool):
+            return node
+        if isinstance(node, (int, float)):
+            return node != 0
+        if isinstance(node, str):
+            return node in self.nonzero_variables
+        if isinstance(node, tuple) and len(node) == 2 and node[0] == '-':
+            return self.is_nonzero(node[1])
+        return False
+
+    def is_cheap_and_pure(self, node):
+        """
+        Whether an expression is small and safe to evaluate even when its value is not needed.
+
+        Calls, list accesses (bounds-checked), exponentiation and divisions by a
+        possibly zero divisor (checked) are neither cheap nor free of effects.
+        """
+        if count_nodes(node) > CHEAP_OPERAND_SIZE:
+            return False
+        pending = [node]
+        while pending:
+            node = pending.pop()
+            if isinstance(node, tuple):
+                if node[0] in ('function_call', 'list_access', 'list_append', '**', '^'):
+                    return False
+                if node[0] in ('/', '//') and not self.is_nonzero(node[2]):
+                    return False
+                pending.extend(node[1:])
+        return True
 
     def create_string_constant(self, string):
         if string in self.strings:
@@ -50,14 +327,121 @@ class CodeGenerator:
         string_const = ir.Constant(ir.ArrayType(ir.IntType(8), len(string) + 1),
                                    bytearray(string.encode('utf8')) + b'\0')
         global_string = ir.GlobalVariable(self.module, string_const.type, name=name)
+        global_string.linkage = 'private'
+        global_string.unnamed_addr = True
         global_string.global_constant = True
         global_string.initializer = string_const
         self.strings[string] = global_string
         return global_string
 
+    def variable_type(self, var_name):
+        """LLVM storage type of a variable: i64 for integers, a list header pointer for lists, double otherwise."""
+        return self.get_variable(var_name).type.pointee
+
+    def slot_type(self, slot):
+        """LLVM storage type of a slot of the current function's symbol table."""
+        var_type = self.symbols.types[slot]
+        if var_type == 'int':
+            return ir.IntType(64)
+        if var_type is not None and var_type.startswith('list['):
+            return runtime.list_pointer_type(self.list_element_type(self.symbols.names[slot]))
+        return ir.DoubleType()
+
+    def list_element_type(self, var_name):
+        """LLVM type of the unboxed elements of a list variable: i64 for int lists, double otherwise."""
+        slot = self.symbols.slots.get(var_name)
+        element_type = 'unknown' if slot is None else (self.symbols.types[slot] or 'list[unknown]')[5:-1]
+        if element_type == 'int':
+            return ir.IntType(64)
+        if element_type == 'str':
+            raise Exception(f"Code Generation Error: Lists of strings ('{var_name}') are not supported")
+        return ir.DoubleType()
+
+    def list_field(self, header, index):
+        """Pointer to a field of a list header (0: length, 1: capacity, 2: data)."""
+        zero = ir.Constant(ir.IntType(32), 0)
+        return self.builder.gep(header, [zero, ir.Constant(ir.IntType(32), index)])
+
+    def allocate_slots(self):
+        """Allocate the stack slots of the current function's variables (those not allocated yet) in its entry block."""
+        with self.builder.goto_entry_block():
+            for slot in range(len(self.slots), len(self.symbols.names)):
+                self.slots.append(self.builder.alloca(self.slot_type(slot), name=self.symbols.names[slot]))
+
+    def get_variable(self, var_name):
+        """Return the stack slot of a variable."""
+        slot = self.symbols.slots.get(var_name)
+        if slot is None:
+            # Not resolved by the semantic analyzer (code generated from a bare AST)
+            slot = self.symbols.declare(var_name, None)
+            self.allocate_slots()
+        return self.slots[slot]
+
+    def store_variable(self, value, var_addr):
+        """Store a value in a variable's stack slot, converted to the slot type."""
+        if isinstance(value.type, ir.DoubleType) and var_addr.type.pointee == ir.IntType(64):
+            # The analyzer widens every slot a float reaches; truncating here would lose the fraction
+            raise Exception(f"Code Generation Error: float value stored in integer variable '{var_addr.name}'")
+        self.builder.store(self.convert(value, var_addr.type.pointee), var_addr)
+
+    def convert(self, value, target_type):
+        """Convert a value at a type boundary (integer <-> double, i1 -> wider)."""
+        if value.type == target_type:
+            return value
+        if isinstance(target_type, ir.DoubleType) and isinstance(value.type, ir.IntType):
+            if value.type.width == 1:
+                return self.builder.uitofp(value, target_type)
+            return self.builder.sitofp(value, target_type)
+        if isinstance(target_type, ir.IntType) and isinstance(value.type, ir.DoubleType):
+            return self.builder.fptosi(value, target_type)
+        if isinstance(target_type, ir.IntType) and isinstance(value.type, ir.IntType):
+            if value.type.width < target_type.width:
+                return self.builder.zext(value, target_type)
+            return self.builder.trunc(value, target_type)
+        return value
+
+    def is_integer(self, value):
+        """Whether a value is a native (i64) integer."""
+        return isinstance(value.type, ir.IntType) and value.type.width == 64
+
+    def to_condition(self, value):
+        """Turn a numeric value into an i1 branch condition (non-zero is true)."""
+        if isinstance(value.type, ir.IntType):
+            if value.type.width == 1:
+                return value
+            return self.builder.icmp_signed('!=', value, ir.Constant(value.type, 0))
+        zero = ir.Constant(ir.DoubleType(), 0.0)
+        return self.builder.fcmp_ordered('!=', value, zero)
+
+    def branch_on_condition(self, condition, true_block, false_block):
+        """
+        Branch on a condition expression without materializing it as a number.
+
+        Comparisons are branched on as the i1 they produce. `not` swaps the
+        targets, and an and/or whose right side must be short-circuited becomes
+        a branch on each side instead of a merged boolean value.
+        """
+        while isinstance(condition, tuple) and len(condition) == 2 and condition[0] == 'not':
+            condition = condition[1]
+            true_block, false_block = false_block, true_block
+        if (isinstance(condition, tuple) and len(condition) == 3 and condition[0] in ('and', 'or')
+                and not self.is_cheap_and_pure(condition[2])):
+            op, left, right = condition
+            right_block = self.function.append_basic_block(name=f"{op}.rhs")
+            if op == 'and':
+                self.branch_on_condition(left, right_block, false_block)
+            else:
+                self.branch_on_condition(left, true_block, right_block)
+            self.builder.position_at_start(right_block)
+            self.branch_on_condition(right, true_block, false_block)
+            return
+        self.builder.cbranch(self.to_condition(self.visit_expression(condition)), true_block, false_block)
+
 
     def generate_code(self, ast):
         """Enhanced code generation with better block handling"""
+        self.allocate_slots()
+        self.nonzero_variables = constant_nonzero_variables(ast, self.symbols)
         if isinstance(ast, list):
             for node in ast:
                 if not self.builder.block.is_terminated:
@@ -67,7 +451,7 @@ class CodeGenerator:
         
         # Only add return if we're at the end of the main function
         if not self.builder.block.is_terminated:
-            self.builder.ret_void()
+            self.return_from_main()
 
     def visit(self, node):
         """Enhanced visit method with better handling of nested structures"""
@@ -79,130 +463,337 @@ class CodeGenerator:
             return last_result
         
         if isinstance(node, tuple):
-            method_name = f'visit_{node[0]}'
-            if hasattr(self, method_name):
-                return getattr(self, method_name)(node)
+            visitor = NODE_VISITORS.get(node[0])
+            if visitor is not None:
+                return visitor(self, node)
         return None
     
     def visit_print(self, node):
-        """Enhanced print implementation to avoid duplicate outputs."""
-        _, args = node
-        format_parts = []
-        value_parts = []
+        """
+        Append one line to the runtime output buffer with a single runtime call.
 
+        The line's literal text (with the separating spaces) becomes a constant
+        template with a slot byte per value; the values are formatted by the
+        runtime's integer and float fast paths, which match printf's "%.2f".
+        """
+        _, args = node
+        i64 = ir.IntType(64)
+        template = []
+        values = []
         for arg in args:
             if isinstance(arg, str) and arg.startswith('"') and arg.endswith('"'):
-                # String literal
-                format_parts.append(arg[1:-1])  # Remove quotes
+                template.append(arg[1:-1])  # Remove quotes
             else:
-                # Float or variable to print
                 value = self.visit_expression(arg)
-                format_parts.append("%.2f")
-                value_parts.append(value)
-
-        # Combine format parts into a single format string
-        combined_format = " ".join(format_parts) + "\n"
-        format_str = self.create_string_constant(combined_format)
-        format_ptr = self.builder.bitcast(format_str, ir.PointerType(ir.IntType(8)))
+                if self.is_integer(value):
+                    template.append(runtime.OUTPUT_INT_SLOT)
+                    values.append(value)
+                else:
+                    # Booleans print as 1.00 or 0.00
+                    template.append(runtime.OUTPUT_FLOAT_SLOT)
+                    values.append(self.builder.bitcast(self.convert(value, ir.DoubleType()), i64))  # Passed as its bits
+        line = " ".join(template) + "\n"
 
-        # Call printf with the combined format string and all values
-        self.builder.call(self.printf, [format_ptr, *value_parts])
+        text = self.builder.bitcast(self.create_string_constant(line), ir.PointerType(ir.IntType(8)))
+        size = ir.Constant(i64, len(line.encode('utf8')))
+        self.builder.call(runtime.get_output_line(self.module, len(values)), [text, size, *values])
 
+    def return_from_main(self):
+        """Leave `main`, writing out whatever is still buffered."""
+        self.builder.call(runtime.declare_runtime_function(self.module, '__out_flush'), [])
+        self.builder.ret_void()
 
     def visit_input(self, node):
         """Generate code for input statements"""
-        print(f"visit_input node: {node}")  # Debugging line
+        logger.debug("visit_input node: %s", node)
         # Check the structure of the node
         if len(node) == 3:
             _, var_name, prompt = node
         else:
             raise ValueError(f"Unexpected input node structure: {node}")
-        
-        # Print the prompt
-        prompt_str = self.create_string_constant(prompt)
-        prompt_ptr = self.builder.bitcast(prompt_str, ir.PointerType(ir.IntType(8)))
-        self.builder.call(self.printf, [prompt_ptr])
-        
-        # Create format string for scanf
-        format_str = self.create_string_constant("%lf")  # Use %lf for double
-        format_ptr = self.builder.bitcast(format_str, ir.PointerType(ir.IntType(8)))
-        
-        # Create variable if it doesn't exist
-        if var_name not in self.variables:
-            with self.builder.goto_entry_block():
-                var_addr = self.builder.alloca(ir.DoubleType(), name=var_name)
-            self.variables[var_name] = var_addr
-        
-        # Get pointer to variable
-        var_ptr = self.variables[var_name]
-        
-        # Call scanf
-        self.builder.call(self.scanf, [format_ptr, var_ptr])
+        self.read_numbers(node, [var_name], prompt)
+
+    def visit_input_multiple(self, node):
+        """Generate code for `a, b = input(prompt)`: one prompt, then a number per variable"""
+        _, var_names, prompt = node
+        self.read_numbers(node, var_names, prompt)
+
+    def read_numbers(self, node, var_names, prompt):
+        """
+        Print the prompt and read a number into each variable from the runtime input buffer.
+
+        The prompt goes to the output buffer, which the input runtime writes out
+        before it waits for input. When no number could be read, a variable keeps
+        its value (like scanf("%lf") leaving its target untouched), or is 0 if
+        this statement defines it first.
+        """
+        prompt = prompt[1:-1]  # Remove quotes
+        if prompt:
+            text = self.builder.bitcast(self.create_string_constant(prompt), ir.PointerType(ir.IntType(8)))
+            size = ir.Constant(ir.IntType(64), len(prompt.encode('utf8')))
+            self.builder.call(runtime.get_output_line(self.module, 0), [text, size])
+
+        read_number = runtime.declare_runtime_function(self.module, '__in_f64')
+        for var_name in var_names:
+            var_ptr = self.get_variable(var_name)
+            if self.symbols.first_definitions[self.symbols.slots[var_name]] not in (id(node), None):
+                current = self.convert(self.builder.load(var_ptr), ir.DoubleType())
+            else:
+                current = ir.Constant(ir.DoubleType(), 0.0)
+            value = self.builder.call(read_number, [current])
+            self.store_variable(value, var_ptr)
 
     def visit_assign(self, node):
         _, var_name, value = node
-        if var_name not in self.variables:
-            with self.builder.goto_entry_block():
-                var_addr = self.builder.alloca(ir.DoubleType(), name=var_name)
-            self.variables[var_name] = var_addr
-        
+        var_addr = self.get_variable(var_name)
+
         value_val = self.visit_expression(value)
-        self.builder.store(value_val, self.variables[var_name])
+        self.store_variable(value_val, var_addr)
 
     def visit_for(self, node):
-        """Fixed for loop implementation with proper block handling"""
-        _, iterator, range_info, body = node
-        
-        # Extract range start and end
-        _, start, end = range_info
-        
-        # Save current block
-        current_block = self.builder.block
-        
-        # Allocate iterator variable in entry block
+        """
+        Lower a for loop to a canonical counted loop.
+
+        For `for i in range(start, end)` the bounds are evaluated once in the
+        preheader and the loop counts with its own i64 induction variable. A
+        guard skips the loop when the range is empty; otherwise the body runs
+        and the latch increments the induction variable (nsw) and compares it
+        with the hoisted end. This rotated shape with a single latch is what
+        LLVM's loop passes and vectorizer expect. Stepped ranges and lists get
+        the same shape with a computed trip count (emit_stepped_loop,
+        emit_list_loop).
+
+        An innermost loop that indexes lists with its counter is versioned: when
+        the whole range lies within those lists, a copy of the loop without the
+        per-access bounds checks runs instead, leaving a branch-free body the
+        loop vectorizer can handle.
+        """
+        _, iterator, iterable, body = node
+        if iterable[0] == 'list':
+            return self.emit_list_loop(node)
+        if len(iterable) > 3 and not (isinstance(iterable[3], int) and not isinstance(iterable[3], bool)
+                                      and iterable[3] == 1):
+            return self.emit_stepped_loop(node)
+        start, end = iterable[1], iterable[2]
+        i64 = ir.IntType(64)
+
+        # The loop variable itself may be stored as a float; the induction variable is always i64
+        iter_var = self.get_variable(iterator)
+        induction_var = self.allocate_induction_variable(iterator)
+
+        # Preheader: evaluate the bounds once and guard against an empty range
+        start_val = self.convert(self.visit_expression(start), i64)
+        end_val = self.convert(self.visit_expression(end), i64)
+        self.builder.store(start_val, induction_var)
+        loop_end = self.function.append_basic_block(name="for.end")
+        non_empty = self.builder.icmp_signed('<', start_val, end_val)
+
+        # A counter whose range excludes zero is a provably nonzero divisor
+        counter_nonzero = range_excludes_zero(start, end) and iterator not in assigned_names(body)
+        self.emit_loop_versions(node, non_empty, lambda: (start_val, end_val), loop_end,
+                                lambda loop_body: self.emit_loop_body(loop_body, loop_end, iterator, iter_var,
+                                                                      induction_var, end_val, body, counter_nonzero))
+
+    def emit_stepped_loop(self, node):
+        """
+        Lower `for i in range(start, end, step)` to a counted loop (any step but 1).
+
+        start, end and step are evaluated once. With a positive step the range
+        is non-empty when start < end and runs (end - start - 1) / step + 1
+        times; a negative step (a reverse range) swaps the roles of start and
+        end. The trip count is computed in unsigned arithmetic, so no range of
+        i64 values overflows. The induction variable counts from 0 to the trip
+        count and the loop variable is start + count * step. A constant step
+        picks its case up front; one known only at run time is checked against
+        zero and its case is chosen with selects.
+        """
+        _, iterator, (_, start, end, step), body = node
+        i64 = ir.IntType(64)
+        zero = ir.Constant(i64, 0)
+        one = ir.Constant(i64, 1)
+
+        iter_var = self.get_variable(iterator)
+        induction_var = self.allocate_induction_variable(iterator)
+
+        # Preheader: evaluate the range once and compute its trip count
+        start_val = self.convert(self.visit_expression(start), i64)
+        end_val = self.convert(self.visit_expression(end), i64)
+        step_val = self.convert(self.visit_expression(step), i64)
+        constant_step = isinstance(step, (int, float)) and not isinstance(step, bool) and int(step) != 0
+        if constant_step:
+            counts_up = int(step) > 0
+            if counts_up:
+                non_empty = self.builder.icmp_signed('<', start_val, end_val)
+                distance = self.builder.sub(end_val, start_val)
+            else:
+                non_empty = self.builder.icmp_signed('>', start_val, end_val)
+                distance = self.builder.sub(start_val, end_val)
+            magnitude = ir.Constant(i64, abs(int(step)))
+        else:
+            # range() rejects a zero step
+            is_zero = self.builder.icmp_signed('==', step_val, zero)
+            step_ok_block = self.function.append_basic_block(name="range.ok")
+            error_block = self.get_error_block("__range_zero_step", "Error: range() step must not be zero!",
+                                               "range.error")
+            branch = self.builder.cbranch(is_zero, error_block, step_ok_block)
+            branch.set_weights(UNLIKELY_BRANCH_WEIGHTS)
+            self.builder.position_at_start(step_ok_block)
+            counts_up = self.builder.icmp_signed('>', step_val, zero)
+            non_empty = self.builder.select(counts_up, self.builder.icmp_signed('<', start_val, end_val),
+                                            self.builder.icmp_signed('>', start_val, end_val))
+            distance = self.builder.select(counts_up, self.builder.sub(end_val, start_val),
+                                           self.builder.sub(start_val, end_val))
+            magnitude = self.builder.select(counts_up, step_val, self.builder.neg(step_val))
+        trip_count = self.builder.add(self.builder.udiv(self.builder.sub(distance, one), magnitude), one)
+        self.builder.store(zero, induction_var)
+        loop_end = self.function.append_basic_block(name="for.end")
+
+        def index_range():
+            """Lowest value of the loop variable and its highest value plus one."""
+            last = self.builder.add(start_val, self.builder.mul(self.builder.sub(trip_count, one), step_val))
+            if counts_up is True:
+                return start_val, self.builder.add(last, one)
+            if counts_up is False:
+                return last, self.builder.add(start_val, one)
+            return (self.builder.select(counts_up, start_val, last),
+                    self.builder.add(self.builder.select(counts_up, last, start_val), one))
+
+        def loop_value(count):
+            return self.builder.add(start_val, self.builder.mul(count, step_val))
+
+        counter_nonzero = range_excludes_zero(start, end, step) and iterator not in assigned_names(body)
+        self.emit_loop_versions(node, non_empty, index_range, loop_end,
+                                lambda loop_body: self.emit_loop_body(loop_body, loop_end, iterator, iter_var,
+                                                                      induction_var, trip_count, body,
+                                                                      counter_nonzero, loop_value, unsigned=True))
+
+    def emit_list_loop(self, node):
+        """
+        Lower `for x in values` to a counted loop over the list's buffer.
+
+        The list is loaded once and the loop counts from 0 to its length; the
+        loop variable takes each element with a plain load, as the counter never
+        leaves the list, so there are no bounds checks. Reassigning the list in
+        the body does not change the loop (the original list is walked, as in
+        Python). A body appending to the list re-reads its length and buffer
+        every iteration instead, so the appended elements are visited too and a
+        grown buffer is followed.
+        """
+        _, iterator, (_, list_name), body = node
+        i64 = ir.IntType(64)
+        zero = ir.Constant(i64, 0)
+
+        iter_var = self.get_variable(iterator)
+        induction_var = self.allocate_induction_variable(iterator)
+
+        header = self.builder.load(self.get_variable(list_name))
+        length = self.builder.load(self.list_field(header, 0))
+        if list_name in appended_lists(body):
+            def bound():
+                return self.builder.load(self.list_field(header, 0))
+
+            def loop_value(count):
+                data = self.builder.load(self.list_field(header, 2))
+                return self.builder.load(self.builder.gep(data, [count]))
+        else:
+            bound = length
+            data = self.builder.load(self.list_field(header, 2))
+
+            def loop_value(count):
+                return self.builder.load(self.builder.gep(data, [count]))
+        self.builder.store(zero, induction_var)
+        loop_end = self.function.append_basic_block(name="for.end")
+        non_empty = self.builder.icmp_signed('>', length, zero)
+        self.emit_loop_versions(node, non_empty, None, loop_end,
+                                lambda loop_body: self.emit_loop_body(loop_body, loop_end, iterator, iter_var,
+                                                                      induction_var, bound, body, False,
+                                                                      loop_value, unsigned=True))
+
+    def allocate_induction_variable(self, iterator):
+        """Allocate the i64 induction variable of a loop in the entry block."""
         with self.builder.goto_entry_block():
-            iter_var = self.builder.alloca(ir.DoubleType(), name=iterator)
-        self.variables[iterator] = iter_var
-        
-        # Create the loop blocks
-        loop_cond = self.main.append_basic_block(name="for.cond")
-        loop_body = self.main.append_basic_block(name="for.body")
-        loop_inc = self.main.append_basic_block(name="for.inc")
-        loop_end = self.main.append_basic_block(name="for.end")
-        
-        # Save loop info for break statements
-        self.loop_stack.append((loop_cond, loop_end))
-        
-        # Initialize iterator
-        start_val = self.visit_expression(start)
-        self.builder.store(start_val, iter_var)
-        
-        # Branch from current block to condition
-        self.builder.branch(loop_cond)
-        
-        # Condition block
-        self.builder.position_at_start(loop_cond)
-        current_val = self.builder.load(iter_var)
-        end_val = self.visit_expression(end)
-        cond = self.builder.fcmp_ordered('<', current_val, end_val)
-        self.builder.cbranch(cond, loop_body, loop_end)
-        
-        # Body block
-        self.builder.position_at_start(loop_body)
-        self.visit(body)
-        if not self.builder.block.is_terminated:
-            self.builder.branch(loop_inc)
-        
-        # Increment block
-        self.builder.position_at_start(loop_inc)
-        current_val = self.builder.load(iter_var)
-        one = ir.Constant(ir.DoubleType(), 1.0)
-        next_val = self.builder.fadd(current_val, one)
-        self.builder.store(next_val, iter_var)
-        self.builder.branch(loop_cond)
-        
+            return self.builder.alloca(ir.IntType(64), name=f"{iterator}.iv")
+
+    def emit_loop_versions(self, node, non_empty, index_range, loop_end, emit_body):
+        """
+        Branch from the preheader into a counted loop, or to `loop_end` when it is empty.
+
+        `emit_body(loop_body)` emits the body and latch starting at `loop_body`.
+        When the loop variable indexes lists in an innermost loop and
+        `index_range` is given (a function emitting the lowest value of the loop
+        variable and its highest value plus one), a second copy without those
+        bounds checks is emitted and taken when the whole range is within the
+        lists. Lists never shrink, so a range within their lengths before the
+        loop stays in bounds.
+        """
+        _, iterator, _, body = node
+        i64 = ir.IntType(64)
+        checked_body = self.function.append_basic_block(name="for.body")
+        indexed_lists = iterator_indexed_lists(body, iterator) if index_range is not None else []
+        if indexed_lists:
+            range_check = self.function.append_basic_block(name="for.check")
+            unchecked_body = self.function.append_basic_block(name="for.body.nocheck")
+            self.builder.cbranch(non_empty, range_check, loop_end)
+            self.builder.position_at_start(range_check)
+            low, high = index_range()
+            in_bounds = self.builder.icmp_signed('>=', low, ir.Constant(i64, 0))
+            for list_name in indexed_lists:
+                header = self.builder.load(self.get_variable(list_name))
+                length = self.builder.load(self.list_field(header, 0))
+                in_bounds = self.builder.and_(in_bounds, self.builder.icmp_signed('<=', high, length))
+            branch = self.builder.cbranch(in_bounds, unchecked_body, checked_body)
+            branch.set_weights(LIKELY_BRANCH_WEIGHTS)
+
+            unchecked = {(list_name, iterator) for list_name in indexed_lists}
+            self.unchecked_indices |= unchecked
+            emit_body(unchecked_body)
+            self.unchecked_indices -= unchecked
+        else:
+            self.builder.cbranch(non_empty, checked_body, loop_end)
+        emit_body(checked_body)
+
         # Continue building after loop
         self.builder.position_at_start(loop_end)
+
+    def emit_loop_body(self, loop_body, loop_end, iterator, iter_var, induction_var, end_val, body,
+                       counter_nonzero, loop_value=None, unsigned=False):
+        """
+        Emit the body and latch of a counted loop, starting at `loop_body`.
+
+        The loop variable takes the induction value, or `loop_value(induction value)`
+        when given. With `unsigned` the induction variable counts from 0 to a
+        trip count (nuw, unsigned compare); `end_val` may then be a function
+        re-reading the count at the latch.
+        """
+        i64 = ir.IntType(64)
+        loop_latch = self.function.append_basic_block(name="for.latch")
+        self.loop_stack.append((loop_latch, loop_end))
+
+        # Body: the loop variable takes the induction value (assignments to it do not change the count)
+        self.builder.position_at_start(loop_body)
+        count = self.builder.load(induction_var)
+        value = count if loop_value is None else loop_value(count)
+        self.store_variable(value, iter_var)
+        if counter_nonzero and iterator not in self.nonzero_variables:
+            self.nonzero_variables.add(iterator)
+            self.visit(body)
+            self.nonzero_variables.discard(iterator)
+        else:
+            self.visit(body)
+        if not self.builder.block.is_terminated:
+            self.builder.branch(loop_latch)
+
+        # Latch: the induction variable is below the end here, so the increment cannot overflow
+        self.builder.position_at_start(loop_latch)
+        next_val = self.builder.add(self.builder.load(induction_var), ir.Constant(i64, 1),
+                                    flags=['nuw' if unsigned else 'nsw'])
+        self.builder.store(next_val, induction_var)
+        bound = end_val() if callable(end_val) else end_val
+        if unsigned:
+            continues = self.builder.icmp_unsigned('<', next_val, bound)
+        else:
+            continues = self.builder.icmp_signed('<', next_val, bound)
+        self.builder.cbranch(continues, loop_body, loop_end)
         self.loop_stack.pop()
 
     def visit_while(self, node):
@@ -213,9 +804,9 @@ class CodeGenerator:
         current_block = self.builder.block
         
         # Create the basic blocks for the loop
-        while_cond = self.main.append_basic_block(name="while.cond")
-        while_body = self.main.append_basic_block(name="while.body")
-        while_end = self.main.append_basic_block(name="while.end")
+        while_cond = self.function.append_basic_block(name="while.cond")
+        while_body = self.function.append_basic_block(name="while.body")
+        while_end = self.function.append_basic_block(name="while.end")
         
         # Save loop info for break statements
         self.loop_stack.append((while_cond, while_end))
@@ -225,11 +816,7 @@ class CodeGenerator:
         
         # Emit condition
         self.builder.position_at_start(while_cond)
-        cond_val = self.visit_expression(condition)
-        if isinstance(cond_val.type, ir.DoubleType):
-            zero = ir.Constant(ir.DoubleType(), 0.0)
-            cond_val = self.builder.fcmp_ordered('!=', cond_val, zero)
-        self.builder.cbranch(cond_val, while_body, while_end)
+        self.branch_on_condition(condition, while_body, while_end)
         
         # Emit loop body
         self.builder.position_at_start(while_body)
@@ -242,38 +829,163 @@ class CodeGenerator:
         self.loop_stack.pop()
 
 
+    def declare_user_function(self, func_name, param_count):
+        """Declare a user-defined function: doubles in, double out, fast calling convention."""
+        func_ty = ir.FunctionType(ir.DoubleType(), [ir.DoubleType()] * param_count)
+        func = ir.Function(self.module, func_ty, name=func_name)
+        func.calling_convention = 'fastcc'
+        self.user_functions[func_name] = func
+        return func
+
+    def visit_function_def(self, node):
+        """Compile a function definition into its own internal, fastcc LLVM function"""
+        _, func_name, params, body = node
+
+        # Declare the function first so that its body can call it recursively
+        func = self.declare_user_function(func_name, len(params))
+        func.linkage = self.function_linkage
+        for arg, param in zip(func.args, params):
+            arg.name = param
+        for attribute in inline_attributes(func_name, body):
+            func.attributes.add(attribute)
+
+        # Generate the body with its own builder, variables, loop stack and error block
+        saved_state = (self.function, self.builder, self.slots, self.symbols, self.loop_stack,
+                       self.error_blocks, self.nonzero_variables)
+        self.function = func
+        self.builder = ir.IRBuilder(func.append_basic_block(name="entry"))
+        self.symbols = self.function_symbols.get(func_name) or SymbolTable()
+        for param in params:
+            if param not in self.symbols.slots:
+                self.symbols.declare(param, 'float')
+        self.slots = []
+        self.allocate_slots()
+        self.loop_stack = []
+        self.error_blocks = {}
+        self.nonzero_variables = constant_nonzero_variables(body, self.symbols)
+
+        # Parameters live in stack slots like any other variable
+        for arg, param in zip(func.args, params):
+            var_addr = self.get_variable(param)
+            self.store_variable(arg, var_addr)
+
+        self.visit(body)
+
+        # Falling off the end of a function returns 0
+        if not self.builder.block.is_terminated:
+            self.builder.ret(ir.Constant(ir.DoubleType(), 0.0))
+
+        (self.function, self.builder, self.slots, self.symbols, self.loop_stack,
+         self.error_blocks, self.nonzero_variables) = saved_state
+
+    def visit_return(self, node):
+        """Return from the current function"""
+        _, value = node
+        if self.function is self.main:
+            self.return_from_main()
+        elif value is None:
+            self.builder.ret(ir.Constant(ir.DoubleType(), 0.0))
+        else:
+            self.builder.ret(self.convert(self.visit_expression(value), ir.DoubleType()))
+
     def visit_function_call(self, node):
         _, func_name, args = node
+        if func_name in self.user_functions:
+            # User-defined functions use the fast calling convention
+            func = self.user_functions[func_name]
+            arg_values = [self.convert(self.visit_expression(arg), ir.DoubleType()) for arg in args]
+            return self.builder.call(func, arg_values, cconv='fastcc')
+
+        # Anything else is an external C function taking and returning doubles
         param_types = [ir.DoubleType()] * len(args)
         func_ty = ir.FunctionType(ir.DoubleType(), param_types)
         func = self.module.get_global(func_name)
         if func is None:
             func = ir.Function(self.module, func_ty, name=func_name)
-        arg_values = [self.visit_expression(arg) for arg in args]
+        arg_values = [self.convert(self.visit_expression(arg), ir.DoubleType()) for arg in args]
         return self.builder.call(func, arg_values)
     
+    def visit_list_create(self, node):
+        """Allocate a native list and store its initial elements"""
+        _, var_name, elements = node
+        element_type = self.list_element_type(var_name)
+        list_new = runtime.get_list_new(self.module, element_type)
+        header = self.builder.call(list_new, [ir.Constant(ir.IntType(64), len(elements))])
+
+        # The buffer is large enough for the initial elements
+        data = self.builder.load(self.list_field(header, 2))
+        for index, element in enumerate(elements):
+            value = self.convert(self.visit_expression(element), element_type)
+            self.builder.store(value, self.builder.gep(data, [ir.Constant(ir.IntType(64), index)]))
+        self.builder.store(ir.Constant(ir.IntType(64), len(elements)), self.list_field(header, 0))
+        self.builder.store(header, self.get_variable(var_name))
+
+    def visit_list_append(self, node):
+        """Append in place; the buffer only grows (out of line) when it is full"""
+        _, var_name, element = node
+        element_type = self.list_element_type(var_name)
+        value = self.convert(self.visit_expression(element), element_type)
+        header = self.builder.load(self.get_variable(var_name))
+        length_ptr = self.list_field(header, 0)
+        length = self.builder.load(length_ptr)
+        capacity = self.builder.load(self.list_field(header, 1))
+
+        grow_block = self.function.append_basic_block(name="append.grow")
+        store_block = self.function.append_basic_block(name="append.store")
+        full = self.builder.icmp_unsigned('>=', length, capacity)
+        branch = self.builder.cbranch(full, grow_block, store_block)
+        branch.set_weights(UNLIKELY_BRANCH_WEIGHTS)
+
+        self.builder.position_at_start(grow_block)
+        self.builder.call(runtime.get_list_grow(self.module, element_type), [header])
+        self.builder.branch(store_block)
+
+        self.builder.position_at_start(store_block)
+        data = self.builder.load(self.list_field(header, 2))
+        self.builder.store(value, self.builder.gep(data, [length]))
+        self.builder.store(self.builder.add(length, ir.Constant(ir.IntType(64), 1)), length_ptr)
+        return None
+
+    def visit_list_access(self, node):
+        """Bounds-checked load of a list element"""
+        _, var_name, index = node
+        header = self.builder.load(self.get_variable(var_name))
+        index_val = self.convert(self.visit_expression(index), ir.IntType(64))
+        if (var_name, index) in self.unchecked_indices:
+            # Indexed by a loop counter whose whole range was checked before the loop
+            data = self.builder.load(self.list_field(header, 2))
+            return self.builder.load(self.builder.gep(data, [index_val]))
+        length = self.builder.load(self.list_field(header, 0))
+
+        # One unsigned compare also rejects negative indices
+        in_range = self.builder.icmp_unsigned('<', index_val, length)
+        ok_block = self.function.append_basic_block(name="index.ok")
+        error_block = self.get_error_block("__index_out_of_range", "Error: List index out of range!", "index.error")
+        branch = self.builder.cbranch(in_range, ok_block, error_block)
+        branch.set_weights(LIKELY_BRANCH_WEIGHTS)
+
+        self.builder.position_at_start(ok_block)
+        data = self.builder.load(self.list_field(header, 2))
+        return self.builder.load(self.builder.gep(data, [index_val]))
+
     def visit_if_stmt(self, node):
         """Implementation of if-elif-else that handles multiple elif statements"""
         _, if_part, elif_parts, else_body = node
         
         # Create basic blocks
-        if_then_bb = self.main.append_basic_block(name="if.then")
-        merge_bb = self.main.append_basic_block(name="if.end")
-        next_block = self.main.append_basic_block(name="if.next")
+        if_then_bb = self.function.append_basic_block(name="if.then")
+        merge_bb = self.function.append_basic_block(name="if.end")
+        next_block = self.function.append_basic_block(name="if.next")
 
         # Generate if condition and branch
         if_condition = if_part[1]  # Get condition
         if_body = if_part[2]      # Get body
         
-        cond_val = self.visit_expression(if_condition)
-        if isinstance(cond_val.type, ir.DoubleType):
-            zero = ir.Constant(ir.DoubleType(), 0.0)
-            cond_val = self.builder.fcmp_ordered('!=', cond_val, zero)
-        self.builder.cbranch(cond_val, if_then_bb, next_block)
+        self.branch_on_condition(if_condition, if_then_bb, next_block)
 
         # Generate if body
         self.builder.position_at_start(if_then_bb)
-        self.generate_code(if_body)
+        self.visit(if_body)
         if not self.builder.block.is_terminated:
             self.builder.branch(merge_bb)
 
@@ -288,20 +1000,16 @@ class CodeGenerator:
                 next_elif = elif_part[3] if len(elif_part) > 3 else []
                 
                 # Create blocks for this elif
-                elif_then_bb = self.main.append_basic_block(name="elif.then")
-                next_block = self.main.append_basic_block(name="elif.next")
+                elif_then_bb = self.function.append_basic_block(name="elif.then")
+                next_block = self.function.append_basic_block(name="elif.next")
 
                 # Generate elif condition code
                 self.builder.position_at_start(current_block)
-                elif_cond_val = self.visit_expression(elif_cond)
-                if isinstance(elif_cond_val.type, ir.DoubleType):
-                    zero = ir.Constant(ir.DoubleType(), 0.0)
-                    elif_cond_val = self.builder.fcmp_ordered('!=', elif_cond_val, zero)
-                self.builder.cbranch(elif_cond_val, elif_then_bb, next_block)
+                self.branch_on_condition(elif_cond, elif_then_bb, next_block)
 
                 # Generate elif body
                 self.builder.position_at_start(elif_then_bb)
-                self.generate_code(elif_body)
+                self.visit(elif_body)
                 if not self.builder.block.is_terminated:
                     self.builder.branch(merge_bb)
 
@@ -317,7 +1025,7 @@ class CodeGenerator:
         self.builder.position_at_start(current_block)
         if else_body:
             else_statements = else_body[1]
-            self.generate_code(else_statements)
+            self.visit(else_statements)
             if not self.builder.block.is_terminated:
                 self.builder.branch(merge_bb)
         else:
@@ -330,15 +1038,23 @@ class CodeGenerator:
     def visit_expression(self, node):
         """Enhanced expression handling"""
         if isinstance(node, tuple):
+            visitor = EXPRESSION_VISITORS.get(node[0])
+            if visitor is not None:
+                return visitor(self, node)
             if len(node) == 3:  # Binary operations
                 return self.visit_binop(node)
             elif len(node) == 2:  # Unary operations
                 return self.visit_unary(node)
+        elif isinstance(node, bool):
+            return ir.Constant(ir.IntType(1), node)
+        elif isinstance(node, int):
+            return ir.Constant(ir.IntType(64), node)
         elif isinstance(node, (int, float)):
             return ir.Constant(ir.DoubleType(), float(node))
         elif isinstance(node, str):
-            if node in self.variables:
-                return self.builder.load(self.variables[node])
+            slot = self.symbols.slots.get(node)
+            if slot is not None:
+                return self.builder.load(self.slots[slot])
             try:
                 return ir.Constant(ir.DoubleType(), float(node))
             except ValueError:
@@ -352,45 +1068,35 @@ class CodeGenerator:
         if op in ['==', '!=', '>', '>=', '<', '<=']:
             # Handle comparison operators
             return self.visit_comparison((op, left, right))
+        if op in ('and', 'or'):
+            return self.visit_logical(node)
         
         # Handle arithmetic operators
        # Handle arithmetic operators
         left_val = self.visit_expression(left)
         right_val = self.visit_expression(right)
-        
+
+        # Native integer arithmetic when both operands are integers
+        if self.is_integer(left_val) and self.is_integer(right_val):
+            if op == '+':
+                return self.builder.add(left_val, right_val)
+            elif op == '-':
+                return self.builder.sub(left_val, right_val)
+            elif op == '*':
+                return self.builder.mul(left_val, right_val)
+
         if op == '/':
-            # Create basic blocks for division
-            div_check_block = self.main.append_basic_block(name="div_check")
-            div_ok_block = self.main.append_basic_block(name="div_ok")
-            div_error_block = self.main.append_basic_block(name="div_error")
-            div_continue_block = self.main.append_basic_block(name="div_continue")
-            
-            # Branch to division check
-            self.builder.branch(div_check_block)
-            
-            # Division by zero check
-            self.builder.position_at_start(div_check_block)
-            zero = ir.Constant(ir.DoubleType(), 0.0)
-            is_zero = self.builder.fcmp_ordered('==', right_val, zero)
-            self.builder.cbranch(is_zero, div_error_block, div_ok_block)
-            
-            # Division error block
-            self.builder.position_at_start(div_error_block)
-            self.create_error_handling_printf("Error: Division by zero!")
-            self.builder.branch(div_continue_block)
-            
-            # OK block - perform division
-            self.builder.position_at_start(div_ok_block)
-            div_result = self.builder.fdiv(left_val, right_val)
-            self.builder.branch(div_continue_block)
-            
-            # Continue block
-            self.builder.position_at_start(div_continue_block)
-            phi = self.builder.phi(ir.DoubleType())
-            phi.add_incoming(ir.Constant(ir.DoubleType(), 0.0), div_error_block)
-            phi.add_incoming(div_result, div_ok_block)
-            return phi
-        
+            # Only divisors that may be zero are checked, out of line
+            if not self.is_nonzero(right):
+                self.check_divisor(right_val)
+
+        # Everything else is computed in floating point
+        left_val = self.convert(left_val, ir.DoubleType())
+        right_val = self.convert(right_val, ir.DoubleType())
+
+        if op == '/':
+            return self.builder.fdiv(left_val, right_val)
+
         # Handle other arithmetic operations
         if op == '+':
             return self.builder.fadd(left_val, right_val)
@@ -411,12 +1117,14 @@ class CodeGenerator:
         # Get the values for comparison
         left_val = self.visit_expression(left_val)
         right_val = self.visit_expression(right_val)
-        
-        # Ensure we're comparing doubles
-        if not isinstance(left_val.type, ir.DoubleType):
-            left_val = self.builder.sitofp(left_val, ir.DoubleType())
-        if not isinstance(right_val.type, ir.DoubleType):
-            right_val = self.builder.sitofp(right_val, ir.DoubleType())
+
+        # Compare integers natively
+        if self.is_integer(left_val) and self.is_integer(right_val):
+            return self.builder.icmp_signed(op, left_val, right_val)
+
+        # Otherwise ensure we're comparing doubles
+        left_val = self.convert(left_val, ir.DoubleType())
+        right_val = self.convert(right_val, ir.DoubleType())
         
         # Map comparison operators to LLVM fcmp predicates
         op_map = {
@@ -428,20 +1136,54 @@ class CodeGenerator:
             '>=': 'oge'   # ordered and greater than or equal
         }
         
-        # Perform the comparison and return a double (1.0 for true, 0.0 for false)
-        comparison = self.builder.fcmp_ordered(op_map[op], left_val, right_val)
-        result = self.builder.uitofp(comparison, ir.DoubleType())
-        return result
+        # Perform the comparison; the i1 result is only widened where a number is needed (see convert)
+        return self.builder.fcmp_ordered(op_map[op], left_val, right_val)
+
+    def visit_logical(self, node):
+        """
+        and/or producing an i1.
+
+        A cheap, pure right side is evaluated unconditionally and combined with
+        a bitwise and/or, keeping the code straight-line; any other right side
+        is only evaluated when the left side does not decide the result, and
+        the two outcomes meet in a phi.
+        """
+        op, left, right = node
+        left_val = self.to_condition(self.visit_expression(left))
+        if self.is_cheap_and_pure(right):
+            right_val = self.to_condition(self.visit_expression(right))
+            if op == 'and':
+                return self.builder.and_(left_val, right_val)
+            return self.builder.or_(left_val, right_val)
+
+        left_block = self.builder.block
+        right_block = self.function.append_basic_block(name=f"{op}.rhs")
+        end_block = self.function.append_basic_block(name=f"{op}.end")
+        if op == 'and':
+            self.builder.cbranch(left_val, right_block, end_block)
+        else:
+            self.builder.cbranch(left_val, end_block, right_block)
+        self.builder.position_at_start(right_block)
+        right_val = self.to_condition(self.visit_expression(right))
+        right_block = self.builder.block  # The right side may have added blocks
+        self.builder.branch(end_block)
 
+        self.builder.position_at_start(end_block)
+        result = self.builder.phi(ir.IntType(1))
+        result.add_incoming(ir.Constant(ir.IntType(1), op == 'or'), left_block)
+        result.add_incoming(right_val, right_block)
+        return result
     
     def visit_unary(self, node):
         op, operand = node
         expr_val = self.visit_expression(operand)
+        if op == '-' and self.is_integer(expr_val):
+            return self.builder.neg(expr_val)
         if op == '-':
             zero = ir.Constant(ir.DoubleType(), 0.0)
             return self.builder.fsub(zero, expr_val)
         elif op == 'not':
-            return self.builder.not_(expr_val)
+            return self.builder.not_(self.to_condition(expr_val))
         return None
     
     def visit_break(self, node):
@@ -449,7 +1191,41 @@ class CodeGenerator:
             _, end_block = self.loop_stack[-1]
             self.builder.branch(end_block)
 
-def compile_code(ast):
-    codegen = CodeGenerator()
+
+# Visitor of each node type, looked up once per node by visit()
+NODE_VISITORS = dispatch_table(CodeGenerator, 'visit_')
+# Expression nodes named by a keyword; the rest are operators (binary or unary by arity)
+EXPRESSION_VISITORS = dispatch_table(CodeGenerator, 'visit_', ('function_call', 'list_access', 'list_append'))
+
+def compile_code(ast, symbols=None, function_symbols=None):
+    codegen = CodeGenerator(symbols, function_symbols)
     codegen.generate_code(ast)
+    return str(codegen.module)
+
+
+def compile_unit(node, symbols=None, function_symbols=None, external_functions=None):
+    """
+    Generate the IR of one separately compiled unit of a program.
+
+    A unit is either a single function definition, or the list of the main
+    program's statements (which becomes `main`). Functions get external linkage
+    and calls to functions of other units go through declarations, so the
+    modules of all units can be linked together.
+
+    Parameters:
+    node (tuple or list): A 'function_def' node, or the main body's statements.
+    symbols (SymbolTable): Resolved variables of the main program.
+    function_symbols (dict): Resolved variables of every user function, by function.
+    external_functions (dict): Parameter counts of the user functions defined in other units.
+
+    Returns:
+    str: The unit's LLVM IR.
+    """
+    is_function = isinstance(node, tuple) and node[0] == 'function_def'
+    codegen = CodeGenerator(symbols, function_symbols, external_functions,
+                            function_linkage='external', entry=not is_function)
+    if is_function:
+        codegen.visit(node)
+    else:
+        codegen.generate_code(node)
     return str(codegen.module)
\ No newline at end of file
@@ -1,27 +1,111 @@
 import llvmlite.binding as llvm
+import runtime
+from llvm_target import get_target_machine, initialize_llvm, target_description
+from profiling import parse_pass_timings
+
+# Optimization levels: (pass manager opt_level, size_level, inliner cost threshold).
+# The thresholds are clang's; O0 runs no pipeline at all.
+OPT_LEVELS = {
+    'O0': (0, 0, None),
+    'O1': (1, 0, 225),
+    'O2': (2, 0, 225),
+    'O3': (3, 0, 275),
+    'Os': (2, 1, 75),
+}
+
+# Levels whose pipeline runs the loop and SLP (straight-line) vectorizers, as in clang
+VECTORIZING_LEVELS = ('O2', 'O3')
+
+# Optimization level used by the pipeline (also part of the compilation cache key)
+DEFAULT_OPT_LEVEL = 'O3'
+
+# Inliner cost threshold of the O3 pipeline; without one no function is ever inlined
+INLINING_THRESHOLD = OPT_LEVELS['O3'][2]
+
+
+# Optimized IR of the runtime modules, by target and module (built once per process)
+_runtime_ir = {}
+
+
+def link_runtime(module):
+    """
+    Link the runtime modules a program module uses into it.
+
+    The runtime is optimized once per process and target at DEFAULT_OPT_LEVEL,
+    so compiling a program only pays for its own code. Its symbols become
+    internal: every program module carries a private copy of the buffers.
+    """
+    for function_types, state, build in runtime.RUNTIME_MODULES:
+        declared = {function.name for function in module.functions if function.is_declaration}
+        if not declared.intersection(function_types):
+            continue
+        key = (target_description(), build.__name__)
+        if key not in _runtime_ir:
+            _runtime_ir[key] = CodeOptimizer(str(build()), link=False).optimize()
+        module.link_in(llvm.parse_assembly(_runtime_ir[key]))
+        for name in function_types:
+            module.get_function(name).linkage = 'internal'
+        for name in state:
+            module.get_global_variable(name).linkage = 'internal'
+
+
+def resolve_opt_level(opt_level):
+    """Normalize an optimization level given as 'O2', '2', 2 or 's'."""
+    name = str(opt_level)
+    if not name.startswith('O'):
+        name = 'O' + name
+    if name not in OPT_LEVELS:
+        raise ValueError(f"Unknown optimization level '{opt_level}'. Expected one of: {', '.join(OPT_LEVELS)}")
+    return name
+
 
 class CodeOptimizer:
-    def __init__(self, llvm_ir_code):
+    def __init__(self, llvm_ir_code, opt_level=DEFAULT_OPT_LEVEL, passes=None, vectorize=None, link=True):
         """
         Initialize the code optimizer with LLVM IR code.
 
         Parameters:
-        llvm_ir_code (str): The input LLVM Intermediate Representation (IR) code.
+        llvm_ir_code (str or ModuleRef): The input LLVM IR, as text or as an already parsed module
+            (which is then optimized in place).
+        opt_level (str): One of OPT_LEVELS.
+        passes (iterable): Extra passes run after the level's pipeline, by llvmlite name without
+            the add_/_pass affixes (e.g. 'gvn', 'licm', 'loop_unroll'). With O0 they are the only passes.
+        vectorize (bool): Run the loop and SLP vectorizers (default: at O2 and O3).
+        link (bool): Link the output runtime into the optimized module (see link_runtime); separately
+            compiled units leave that to the step linking them.
         """
-        # Initialize LLVM components
-        llvm.initialize()
-        llvm.initialize_native_target()
-        llvm.initialize_native_asmprinter()
+        # Initialize LLVM components (once per process)
+        initialize_llvm()
 
         # Parse and verify the input LLVM IR
-        self.llvm_ir_code = llvm_ir_code
-        self.module = llvm.parse_assembly(llvm_ir_code)
+        if isinstance(llvm_ir_code, str):
+            self.llvm_ir_code = llvm_ir_code
+            self.module = llvm.parse_assembly(llvm_ir_code)
+        else:
+            self.llvm_ir_code = None
+            self.module = llvm_ir_code
         self.module.verify()
+        self.opt_level = resolve_opt_level(opt_level)
+        self.vectorize = self.opt_level in VECTORIZING_LEVELS if vectorize is None else vectorize
+        self.link = link
+
+        # The vectorizers' cost model needs the target's vector widths and the module's data layout
+        target_machine = get_target_machine()
+        self.module.triple = target_machine.triple
+        self.module.data_layout = str(target_machine.target_data)
+        self.passes = list(passes or ())
+        self.pass_timings = []  # (pass name, seconds) of the last timed run
 
         # Create the pass manager for module-level optimizations
         self.pass_manager = llvm.create_module_pass_manager()
         self.pass_manager_builder = llvm.create_pass_manager_builder()
-        self.pass_manager_builder.opt_level = 3  # Use -O3 optimizations
+        level, size_level, inlining_threshold = OPT_LEVELS[self.opt_level]
+        self.pass_manager_builder.opt_level = level
+        self.pass_manager_builder.size_level = size_level
+        if inlining_threshold is not None:
+            self.pass_manager_builder.inlining_threshold = inlining_threshold  # Enable the function inliner
+        self.pass_manager_builder.loop_vectorize = self.vectorize
+        self.pass_manager_builder.slp_vectorize = self.vectorize
 
         # Configure optimization passes
         self.add_optimizations()
@@ -30,38 +114,67 @@ class CodeOptimizer:
         """
         Configure and add optimization passes to the pass manager.
         """
+        # Target-specific analyses (costs of vector instructions) for the passes below
+        get_target_machine().add_analysis_passes(self.pass_manager)
+
         # Populate the pass manager with standard passes at the chosen optimization level
-        self.pass_manager_builder.populate(self.pass_manager)
-
-        # Add supported passes for further optimizations
-        self.pass_manager.add_constant_merge_pass()            # Merge duplicate constants (constant folding)
-        self.pass_manager.add_instruction_combining_pass()     # Simplify instructions
-        self.pass_manager.add_cfg_simplification_pass()        # Simplify control flow graph
-        self.pass_manager.add_dead_code_elimination_pass()     # Eliminate unused or dead code
-        self.pass_manager.add_gvn_pass()                       # Global value numbering
-        self.pass_manager.add_licm_pass()                      # Loop-invariant code motion
-        self.pass_manager.add_loop_unroll_pass()               # Unroll loops where possible
-        self.pass_manager.add_sccp_pass()                      # Sparse conditional constant propagation
-        self.pass_manager.add_tail_call_elimination_pass()     # Eliminate tail recursion where possible
-
-    def optimize(self):
+        if self.opt_level != 'O0':
+            self.pass_manager_builder.populate(self.pass_manager)
+
+        # Add the requested extra passes
+        for name in self.passes:
+            add_pass = getattr(self.pass_manager, f'add_{name}_pass', None)
+            if add_pass is None:
+                raise ValueError(f"Unknown optimization pass '{name}'")
+            if name == 'function_inlining':
+                add_pass(INLINING_THRESHOLD)
+            else:
+                add_pass()
+
+    def optimize_module(self, time_passes=False):
+        """
+        Apply optimization passes to the LLVM module in place, then link the output runtime.
+
+        Parameters:
+        time_passes (bool): Record the time spent in every pass in `pass_timings`.
+
+        Returns:
+        ModuleRef: The optimized module.
+        """
+        if time_passes:
+            llvm.set_time_passes(True)
+            try:
+                self.pass_manager.run(self.module)
+            finally:
+                self.pass_timings = parse_pass_timings(llvm.report_and_reset_timings())
+                llvm.set_time_passes(False)
+        else:
+            self.pass_manager.run(self.module)
+        if self.link:
+            link_runtime(self.module)
+        return self.module
+
+    def optimize(self, time_passes=False):
         """
         Apply optimization passes to the LLVM module.
 
+        Parameters:
+        time_passes (bool): Record the time spent in every pass in `pass_timings`.
+
         Returns:
         str: The optimized LLVM IR code as a string.
         """
-        # Run the optimizations on the module
-        self.pass_manager.run(self.module)
+        # Run the optimizations on the module and return the optimized LLVM IR as a string
+        return str(self.optimize_module(time_passes))
 
-        # Return the optimized LLVM IR as a string
-        return str(self.module)
-
-    def run(self):
+    def run(self, time_passes=False):
         """
         Execute the optimizer and get the optimized LLVM IR code.
 
+        Parameters:
+        time_passes (bool): Record per-pass timings (see optimize()).
+
         Returns:
         str: Optimized LLVM IR code.
         """
-        return self.optimize()
+        return self.optimize(time_passes)
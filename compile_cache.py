@@ -0,0 +1,269 @@
+import hashlib
+import json
+import os
+
+# Bump this whenever the on-disk layout of cache entries changes
+CACHE_FORMAT_VERSION = 1
+
+# Default location and size budget of the cache (overridable via environment)
+DEFAULT_CACHE_DIR = os.environ.get(
+    'PYCOMPILER_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'pycompiler')
+)
+DEFAULT_MAX_SIZE = int(os.environ.get('PYCOMPILER_CACHE_MAX_SIZE', 64 * 1024 * 1024))
+
+# Compiler modules whose source takes part in the cache key, so that any change
+# to the pipeline driver, front end, folder, code generator or optimizer
+# invalidates stale entries
+PIPELINE_MODULES = (
+    'compiler.py',
+    'lexer.py',
+    'lextab.py',
+    'parser.py',
+    'parsetab.py',
+    'node_dispatch.py',
+    'semantic_analyzer.py',
+    'constant_folder.py',
+    'code_generator.py',
+    'code_optimizer.py',
+    'runtime.py',
+    'llvm_target.py',
+)
+
+_compiler_fingerprint = None
+
+
+def compiler_fingerprint():
+    """Hash the source of the compiler pipeline modules (computed once per process)."""
+    global _compiler_fingerprint
+    if _compiler_fingerprint is None:
+        digest = hashlib.sha256()
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        for name in PIPELINE_MODULES:
+            digest.update(name.encode('utf8'))
+            try:
+                with open(os.path.join(base_dir, name), 'rb') as f:
+                    digest.update(f.read())
+            except OSError:
+                digest.update(b'<missing>')
+        _compiler_fingerprint = digest.hexdigest()
+    return _compiler_fingerprint
+
+
+def toolchain_fingerprint():
+    """Describe the LLVM build and the target (triple, CPU and CPU features) the code is compiled for."""
+    import llvmlite
+    import llvmlite.binding as llvm
+    from llvm_target import target_description
+
+    version = '.'.join(str(part) for part in llvm.llvm_version_info)
+    return f"llvmlite={llvmlite.__version__};llvm={version};triple={llvm.get_default_triple()};{target_description()}"
+
+
+class CacheEntry:
+    def __init__(self, key, optimized_ir, object_code):
+        self.key = key
+        self.optimized_ir = optimized_ir  # Optimized LLVM IR as text
+        self.object_code = object_code    # Native object code (bytes) or None
+
+
+class CompilationCache:
+    """
+    Persistent, content-addressed cache of compilation results.
+
+    Entries are keyed by a hash of the source code, the optimizer settings, the
+    compiler itself, the LLVM version and the target CPU with its features.
+    Each entry stores the optimized IR and the native object code. The total size on disk is bounded and the
+    least recently used entries are evicted first.
+    """
+
+    def __init__(self, cache_dir=None, max_size=None):
+        """
+        Parameters:
+        cache_dir (str): Directory holding the cache (created on demand).
+        max_size (int): Maximum total size of the cached artifacts in bytes.
+        """
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.max_size = DEFAULT_MAX_SIZE if max_size is None else max_size
+        self.entries_dir = os.path.join(self.cache_dir, 'entries')
+        # Statistics counters, one file per process so that concurrent processes never lose updates
+        self.stats_dir = os.path.join(self.cache_dir, 'stats')
+
+    def make_key(self, source, optimizer_settings=None):
+        """Compute the cache key for a source program and its compilation settings."""
+        digest = hashlib.sha256()
+        digest.update(f"format={CACHE_FORMAT_VERSION}\n".encode('utf8'))
+        digest.update(f"compiler={compiler_fingerprint()}\n".encode('utf8'))
+        digest.update(f"toolchain={toolchain_fingerprint()}\n".encode('utf8'))
+        settings = json.dumps(optimizer_settings or {}, sort_keys=True)
+        digest.update(f"optimizer={settings}\n".encode('utf8'))
+        digest.update(source.encode('utf8'))
+        return digest.hexdigest()
+
+    def _entry_paths(self, key):
+        """Return the paths of the IR and object files of an entry."""
+        base = os.path.join(self.entries_dir, key)
+        return base + '.ll', base + '.o'
+
+    def get(self, key):
+        """
+        Look up a cache entry.
+
+        Returns:
+        CacheEntry: The cached artifacts, or None on a miss.
+        """
+        ir_path, obj_path = self._entry_paths(key)
+        try:
+            with open(ir_path, 'r') as f:
+                optimized_ir = f.read()
+        except OSError:
+            self._record('misses')
+            return None
+
+        object_code = None
+        try:
+            with open(obj_path, 'rb') as f:
+                object_code = f.read()
+        except OSError:
+            pass  # Object code is optional, the IR alone is enough to execute
+
+        # Touch the entry so that LRU eviction sees it as recently used
+        for path in (ir_path, obj_path):
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+
+        self._record('hits')
+        return CacheEntry(key, optimized_ir, object_code)
+
+    def put(self, key, optimized_ir, object_code=None):
+        """Store the artifacts of a compilation and evict old entries if needed."""
+        os.makedirs(self.entries_dir, exist_ok=True)
+        ir_path, obj_path = self._entry_paths(key)
+        if object_code is not None:
+            self._atomic_write(obj_path, object_code)
+        # The IR is written last: its presence marks the entry as complete
+        self._atomic_write(ir_path, optimized_ir.encode('utf8'))
+        self.evict()
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits its size budget."""
+        entries = self._scan_entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_size:
+            return 0
+
+        evicted = 0
+        for key, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if total <= self.max_size:
+                break
+            for path in self._entry_paths(key):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+            evicted += 1
+        self._record('evictions', evicted)
+        return evicted
+
+    def clear(self):
+        """Remove every entry and reset the statistics."""
+        for key, _, _ in self._scan_entries():
+            for path in self._entry_paths(key):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        for path in self._stats_files():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def stats(self):
+        """
+        Collect cache statistics.
+
+        Returns:
+        dict: Hit/miss/eviction counters (summed over every process) along with the entry count and total size.
+        """
+        counters = {'hits': 0, 'misses': 0, 'evictions': 0}
+        for path in self._stats_files():
+            for counter, value in self._load_stats(path).items():
+                counters[counter] += value
+        entries = self._scan_entries()
+        lookups = counters['hits'] + counters['misses']
+        return {
+            'cache_dir': self.cache_dir,
+            'hits': counters['hits'],
+            'misses': counters['misses'],
+            'evictions': counters['evictions'],
+            'hit_rate': counters['hits'] / lookups if lookups else 0.0,
+            'entries': len(entries),
+            'size': sum(size for _, size, _ in entries),
+            'max_size': self.max_size,
+        }
+
+    def _scan_entries(self):
+        """List (key, size, last_used) for every complete entry on disk."""
+        entries = {}
+        try:
+            names = os.listdir(self.entries_dir)
+        except OSError:
+            return []
+        for name in names:
+            key, ext = os.path.splitext(name)
+            if ext not in ('.ll', '.o'):
+                continue
+            try:
+                st = os.stat(os.path.join(self.entries_dir, name))
+            except OSError:
+                continue
+            size, last_used = entries.get(key, (0, 0.0))
+            entries[key] = (size + st.st_size, max(last_used, st.st_mtime))
+        return [(key, size, last_used) for key, (size, last_used) in entries.items()]
+
+    def _stats_files(self):
+        """List the counter files of every process that used the cache."""
+        try:
+            names = os.listdir(self.stats_dir)
+        except OSError:
+            return []
+        return [os.path.join(self.stats_dir, name) for name in names if name.endswith('.json')]
+
+    def _load_stats(self, path):
+        counters = {'hits': 0, 'misses': 0, 'evictions': 0}
+        try:
+            with open(path, 'r') as f:
+                counters.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+        return counters
+
+    def _record(self, counter, amount=1):
+        """
+        Bump a persistent statistics counter.
+
+        Each process only updates its own counter file (named after its pid),
+        so batch workers sharing the cache never overwrite each other's counts.
+        """
+        if not amount:
+            return
+        path = os.path.join(self.stats_dir, f"{os.getpid()}.json")
+        try:
+            os.makedirs(self.stats_dir, exist_ok=True)
+            counters = self._load_stats(path)
+            counters[counter] += amount
+            self._atomic_write(path, json.dumps(counters).encode('utf8'))
+        except OSError:
+            pass  # A full or read-only disk must never break compilation
+
+    @staticmethod
+    def _atomic_write(path, data):
+        """Write a file so that concurrent readers never observe a partial entry."""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
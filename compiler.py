@@ -0,0 +1,303 @@
+import logging
+
+logger = logging.getLogger('compiler')
+
+# Log level for the very chatty per-expression traces of the semantic analyzer
+TRACE = 5
+logging.addLevelName(TRACE, 'TRACE')
+
+# Verbosity levels understood by compile()
+QUIET = 0    # No diagnostics at all
+NORMAL = 1   # Stage banners
+VERBOSE = 2  # Stage banners plus token, AST and IR dumps
+DEBUG = 3    # Everything, including semantic analyzer traces
+
+# Pipeline stages in execution order
+STAGES = ('lex', 'parse', 'analyze', 'fold', 'codegen', 'optimize', 'object', 'execute')
+
+# Stages run by default: a full compilation without executing the program
+DEFAULT_STAGES = ('optimize',)
+
+# Stages whose results are not stored in the compilation cache
+FRONT_END_STAGES = ('lex', 'parse', 'analyze', 'fold', 'codegen')
+
+# Stage each stage depends on ('lex' is only run on request: the parser tokenizes by itself)
+STAGE_REQUIRES = {
+    'lex': None,
+    'parse': None,
+    'analyze': 'parse',
+    'fold': 'analyze',
+    'codegen': 'fold',
+    'optimize': 'codegen',
+    'object': 'optimize',
+    'execute': 'optimize',
+}
+
+
+class CompilationResult:
+    """Artifacts produced by the stages of one compile() call."""
+
+    def __init__(self, source):
+        self.source = source
+        self.tokens = None        # List of LexTokens ('lex' or 'parse' stage)
+        self.ast = None           # Abstract syntax tree ('parse' stage, constant folded by the 'fold' stage)
+        self.analyzer = None      # SemanticAnalyzer holding the symbol tables ('analyze' stage)
+        self.removed_nodes = None  # AST nodes removed by constant folding ('fold' stage)
+        self.ir = None            # Unoptimized LLVM IR ('codegen' stage)
+        self.optimized_module = None  # Optimized, parsed LLVM module ('optimize' stage)
+        self._optimized_ir = None     # Optimized LLVM IR text (from the cache or serialized on demand)
+        self.object_code = None   # Native object code ('object' stage)
+        self.cache_hit = False    # Whether the artifacts came from the compilation cache
+        self.stages_run = []      # Stages actually executed, in order
+        self.units = None         # Unit name -> 'reused' or 'compiled' (incremental compilation only)
+
+    @property
+    def optimized_ir(self):
+        """Optimized LLVM IR text; modules pass between stages unserialized, so this is built on first use."""
+        if self._optimized_ir is None and self.optimized_module is not None:
+            self._optimized_ir = str(self.optimized_module)
+        return self._optimized_ir
+
+    @optimized_ir.setter
+    def optimized_ir(self, optimized_ir):
+        self._optimized_ir = optimized_ir
+
+    @property
+    def optimized(self):
+        """The optimized program in the cheapest available form: the parsed module, else its IR text."""
+        return self.optimized_module if self.optimized_module is not None else self._optimized_ir
+
+
+def resolve_stages(stages):
+    """Expand the requested stages with everything they depend on, in pipeline order."""
+    requested = set()
+    for stage in stages:
+        if stage not in STAGE_REQUIRES:
+            raise ValueError(f"Unknown compilation stage '{stage}'. Expected one of: {', '.join(STAGES)}")
+        while stage is not None and stage not in requested:
+            requested.add(stage)
+            stage = STAGE_REQUIRES[stage]
+    return [stage for stage in STAGES if stage in requested]
+
+
+def compile(source, stages=DEFAULT_STAGES, verbosity=QUIET, cache=None, profiler=None, opt_level=None, passes=None):
+    """
+    Compile a program through the requested pipeline stages.
+
+    Diagnostics (stage banners, token/AST/IR dumps and analyzer traces) are
+    emitted through the `compiler` logger, and only when `verbosity` asks for
+    them and the logger is enabled for their level: the default quiet path does
+    no formatting work at all.
+
+    Parameters:
+    source (str): The program source code.
+    stages (iterable): Stages to run (see STAGES); prerequisites are added automatically.
+        The cache is only consulted when no front-end stage is explicitly requested.
+    verbosity (int): QUIET, NORMAL, VERBOSE or DEBUG.
+    cache (CompilationCache): Optional cache used to skip unchanged compilations.
+    profiler (PipelineProfiler): Optional profiler measuring every stage that runs.
+    opt_level (str): Optimization level, one of code_optimizer.OPT_LEVELS (defaults to O3).
+    passes (iterable): Extra optimization passes (see CodeOptimizer).
+
+    Returns:
+    CompilationResult: The artifacts of every stage that ran.
+    """
+    requested = list(stages)
+    stages = resolve_stages(requested)
+    result = CompilationResult(source)
+
+    banners = verbosity >= NORMAL and logger.isEnabledFor(logging.INFO)
+    dumps = verbosity >= VERBOSE and logger.isEnabledFor(logging.DEBUG)
+    traces = verbosity >= DEBUG and logger.isEnabledFor(TRACE)
+
+    def run_stage(stage):
+        profile = profiler.start_stage(stage) if profiler is not None else None
+        if stage == 'lex':
+            _run_lex(result, banners, dumps)
+        elif stage == 'parse':
+            _run_parse(result, banners, dumps)
+        elif stage == 'analyze':
+            _run_analyze(result, banners, traces)
+        elif stage == 'fold':
+            _run_fold(result, banners, dumps)
+        elif stage == 'codegen':
+            _run_codegen(result, banners, dumps)
+        elif stage == 'optimize':
+            _run_optimize(result, banners, dumps, opt_level, passes, profile,
+                          profiler is not None and profiler.time_passes)
+        elif stage == 'object':
+            _run_object(result)
+        elif stage == 'execute':
+            # Store the artifacts before running: the program may exit the process
+            if not result.cache_hit:
+                _store_in_cache(cache, cache_key, result)
+            _run_execute(result, banners, profile)
+        result.stages_run.append(stage)
+        if profile is not None:
+            profiler.end_stage(profile, lambda: _stage_metrics(stage, result))
+
+    # Only back-end artifacts are cached, so the cache is usable when no front-end output is wanted
+    cache_key = None
+    wants_front_end = any(stage in FRONT_END_STAGES for stage in requested)
+    if cache is not None and not wants_front_end:
+        from code_optimizer import DEFAULT_OPT_LEVEL, resolve_opt_level
+
+        profile = profiler.start_stage('cache') if profiler is not None else None
+        settings = {'opt_level': resolve_opt_level(opt_level or DEFAULT_OPT_LEVEL), 'passes': list(passes or ())}
+        cache_key = cache.make_key(source, settings)
+        entry = cache.get(cache_key)
+        if profile is not None:
+            profiler.end_stage(profile, lambda: {'hit': entry is not None})
+        if entry is not None:
+            if banners:
+                logger.info("============== Cached Compilation Found ==================")
+            result.cache_hit = True
+            result.optimized_ir = entry.optimized_ir
+            result.object_code = entry.object_code
+            if 'object' in stages and result.object_code is None:
+                run_stage('object')
+            if 'execute' in stages:
+                run_stage('execute')
+            return result
+
+    if banners:
+        logger.info("================ Compilation Process Stated ==============")
+
+    for stage in stages:
+        if stage == 'execute' and cache_key is not None and result.object_code is None:
+            run_stage('object')  # Emitted for the cache entry; measured as a stage of its own
+        run_stage(stage)
+
+    if 'execute' not in stages:
+        _store_in_cache(cache, cache_key, result)
+    return result
+
+
+def _stage_metrics(stage, result):
+    """Sizes of the artifacts a stage produced (measured after its timers stopped)."""
+    if stage == 'lex':
+        return {'tokens': len(result.tokens)}
+    if stage == 'parse':
+        from profiling import count_ast_nodes
+
+        return {'tokens': len(result.tokens), 'ast_nodes': count_ast_nodes(result.ast)}
+    if stage == 'fold':
+        return {'removed_nodes': result.removed_nodes}
+    if stage == 'codegen':
+        return {'ir_bytes': len(result.ir)}
+    if stage == 'object':
+        return {'object_bytes': len(result.object_code)}
+    return {}
+
+
+def _store_in_cache(cache, cache_key, result):
+    """Store the optimized IR and object code of a fresh compilation."""
+    if cache is None or cache_key is None or result.optimized_ir is None:
+        return
+    if result.object_code is None:
+        _run_object(result)
+    cache.put(cache_key, result.optimized_ir, result.object_code)
+
+
+def _run_lex(result, banners, dumps):
+    import lexer
+
+    if banners:
+        logger.info("================ Tokenizing Source Code ===================")
+    result.tokens = lexer.tokenize(result.source)
+    if dumps:
+        for tok in result.tokens:
+            logger.debug("%s", tok)
+
+
+def _run_parse(result, banners, dumps):
+    import lexer
+    from parser import parser
+
+    if banners:
+        logger.info("=============== Parsing Source Code =========================")
+    # Reuse the tokens of the 'lex' stage so the source is only scanned once
+    if result.tokens is None:
+        result.tokens = lexer.tokenize(result.source)
+    result.ast = parser.parse(lexer=lexer.TokenStream(result.tokens))
+    if dumps:
+        logger.debug("Abstract Syntax Tree:\n%s", result.ast)
+
+
+def _run_analyze(result, banners, traces):
+    from semantic_analyzer import SemanticAnalyzer
+
+    if banners:
+        logger.info("============== Semantically Analyzing Source Code ==================")
+    result.analyzer = SemanticAnalyzer(trace=traces).analyze_program(result.ast)
+    if banners:
+        logger.info("Semantic Analysis Successful")
+
+
+def _run_fold(result, banners, dumps):
+    from constant_folder import fold_constants
+
+    analyzer = result.analyzer
+    function_symbols = {name: info['symbols'] for name, info in analyzer.functions.items()}
+    result.ast, result.removed_nodes = fold_constants(result.ast, analyzer.symbols, function_symbols)
+    if banners:
+        logger.info("Constant folding removed %d AST nodes", result.removed_nodes)
+    if dumps and result.removed_nodes:
+        logger.debug("Folded Abstract Syntax Tree:\n%s", result.ast)
+
+
+def _run_codegen(result, banners, dumps):
+    from code_generator import compile_code
+
+    if banners:
+        logger.info("============== Generating Intermediate Representation ==================")
+    analyzer = result.analyzer
+    function_symbols = {name: info['symbols'] for name, info in analyzer.functions.items()}
+    result.ir = compile_code(result.ast, analyzer.symbols, function_symbols)
+    if dumps:
+        logger.debug("%s", result.ir)
+
+
+def _run_optimize(result, banners, dumps, opt_level=None, passes=None, profile=None, time_passes=False):
+    from code_optimizer import CodeOptimizer, DEFAULT_OPT_LEVEL
+
+    if banners:
+        logger.info("============== Optimizing Intermediate representation ====================")
+    # The IR text is parsed once here; later stages use the optimized module directly
+    optimizer = CodeOptimizer(result.ir, opt_level or DEFAULT_OPT_LEVEL, passes)
+    if profile is None:
+        result.optimized_module = optimizer.optimize_module()
+    else:
+        from profiling import module_statistics
+
+        before = module_statistics(optimizer.module)
+        result.optimized_module = optimizer.optimize_module(time_passes)
+        after = module_statistics(optimizer.module)
+        for name in ('functions', 'blocks', 'instructions'):
+            profile.metrics[f'ir_{name}_before'] = before[name]
+            profile.metrics[f'ir_{name}_after'] = after[name]
+        profile.metrics['passes'] = optimizer.pass_timings
+    if dumps:
+        logger.debug("Optimized IR:\n%s", result.optimized_ir)
+
+
+def _run_object(result):
+    from code_executor import emit_object_code
+
+    result.object_code = emit_object_code(result.optimized)
+
+
+def _run_execute(result, banners, profile=None):
+    from code_executor import execute_ir, execute_object, get_default_session
+
+    if banners:
+        logger.info("============== Compilation and Execution Completed ==================")
+    # Flush our own diagnostics before the native code starts writing to stdout
+    for handler in logging.getLogger().handlers + logger.handlers:
+        handler.flush()
+    if result.object_code is not None:
+        execute_object(result.object_code)
+    else:
+        execute_ir(result.optimized)
+    if profile is not None:
+        profile.metrics['jit_finalize_time'] = get_default_session().finalize_time
@@ -0,0 +1,331 @@
+import math
+from node_dispatch import dispatch_table
+from profiling import count_ast_nodes
+from semantic_analyzer import SymbolTable
+
+# Range of the native integers: a folded integer that would wrap at run time is left to run time
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+COMPARISONS = {
+    '==': lambda a, b: a == b,
+    '!=': lambda a, b: a != b,
+    '<': lambda a, b: a < b,
+    '<=': lambda a, b: a <= b,
+    '>': lambda a, b: a > b,
+    '>=': lambda a, b: a >= b,
+}
+
+
+def is_number(value):
+    """Whether an AST node is a numeric literal (booleans are not numbers)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def constant_truth(value):
+    """Truth value of a constant condition as the generated code tests it, or None when it is not constant."""
+    if isinstance(value, bool):
+        return value
+    if is_number(value):
+        return value != 0 and not math.isnan(value)  # NaN compares unequal to everything, zero included
+    return None
+
+
+class ConstantFolder:
+    """
+    Fold constant expressions and prune constant branches of an analyzed AST.
+
+    Runs between the semantic analyzer and code generation, so constant
+    arithmetic, comparisons and and/or/not never reach the IR and neither do
+    branches that cannot run. Folding follows the generated code: integer
+    arithmetic stays in i64 (results that would wrap are not folded), anything
+    mixed is computed in doubles, and identities such as x*1 and x+0 are only
+    dropped where they cannot change the value or the type of x. Subtrees
+    that do not change are kept as they are.
+    """
+
+    def __init__(self, symbols=None, function_symbols=None):
+        """
+        Parameters:
+        symbols (SymbolTable): Resolved variables of the main program (from the semantic analyzer).
+        function_symbols (dict): Resolved variables of every user function, by function.
+        """
+        self.symbols = symbols or SymbolTable()  # Symbols of the function being folded
+        self.function_symbols = function_symbols or {}
+        self.removed_nodes = 0  # AST nodes the last fold_program() call removed
+
+    def fold_program(self, ast):
+        """Return the folded AST, counting the nodes removed in `removed_nodes`."""
+        self.removed_nodes = 0
+        return self.fold(ast, count_removed=True)
+
+    def fold(self, statements, count_removed=False):
+        """
+        Fold a list of statements; pruned statements are dropped and constant if bodies spliced in.
+
+        With `count_removed` (the top level) the nodes removed from every
+        statement that changed are added to `removed_nodes`; only changed
+        statements are measured, so unchanged code costs no extra walk.
+        """
+        if not isinstance(statements, list):
+            return statements
+        folded = []
+        changed = False
+        for statement in statements:
+            folder = STATEMENT_FOLDERS.get(statement[0]) if isinstance(statement, tuple) else None
+            result = statement if folder is None else folder(self, statement)
+            if result is statement:
+                folded.append(statement)
+                continue
+            changed = True
+            if isinstance(result, list):
+                folded.extend(result)
+            else:
+                folded.append(result)
+            if count_removed:
+                # A spliced body loses its list node along with the statement
+                self.removed_nodes += count_ast_nodes(statement) - count_ast_nodes(result) + isinstance(result, list)
+        return folded if changed else statements
+
+    def fold_function_def(self, node):
+        _, func_name, params, body = node
+        saved_symbols = self.symbols
+        self.symbols = self.function_symbols.get(func_name) or SymbolTable()
+        folded_body = self.fold(body)
+        self.symbols = saved_symbols
+        return node if folded_body is body else (node[0], func_name, params, folded_body)
+
+    def fold_return(self, node):
+        value = node[1] if node[1] is None else self.simplify(node[1])
+        return node if value is node[1] else (node[0], value)
+
+    def fold_assign(self, node):
+        value = self.simplify(node[2])
+        return node if value is node[2] else (node[0], node[1], value)
+
+    fold_list_append = fold_assign
+    fold_list_access = fold_assign
+
+    def fold_print(self, node):
+        args = self.simplify_all(node[1])
+        return node if args is node[1] else (node[0], args)
+
+    def fold_function_call(self, node):
+        args = self.simplify_all(node[2])
+        return node if args is node[2] else (node[0], node[1], args)
+
+    fold_list_create = fold_function_call
+
+    def fold_while(self, node):
+        _, condition, body = node
+        condition = self.simplify(condition)
+        if constant_truth(condition) is False:
+            return []  # Never entered
+        folded_body = self.fold(body)
+        if condition is node[1] and folded_body is body:
+            return node
+        return (node[0], condition, folded_body)
+
+    def fold_for(self, node):
+        _, iterator_var, range_expr, body = node
+        bounds = self.simplify_all(list(range_expr[1:]))
+        folded_range = range_expr if all(new is old for new, old in zip(bounds, range_expr[1:])) \
+            else (range_expr[0], *bounds)
+        folded_body = self.fold(body)
+        if folded_range is range_expr and folded_body is body:
+            return node
+        return (node[0], iterator_var, folded_range, folded_body)
+
+    def fold_if_stmt(self, node):
+        """
+        Drop the clauses whose condition is constantly false; a constantly true
+        one becomes the else body and ends the chain. With no clause left the
+        statement is replaced by its else body (if any).
+        """
+        _, (_, condition, body), elif_part, else_part = node
+        clauses = [(condition, body)]
+        while elif_part:
+            clauses.append((elif_part[1], elif_part[2]))
+            elif_part = elif_part[3]
+        else_body = else_part[1] if else_part else None
+
+        kept = []
+        always_taken = False
+        for condition, body in clauses:
+            folded_condition = self.simplify(condition)
+            truth = constant_truth(folded_condition)
+            if truth is False:
+                continue
+            if truth is True:
+                else_body = self.fold(body)
+                always_taken = True
+                break
+            kept.append((folded_condition, self.fold(body)))
+        folded_else_body = else_body if always_taken or else_body is None else self.fold(else_body)
+
+        if len(kept) == len(clauses) and folded_else_body is else_body and \
+                all(new is old for pair, clause in zip(kept, clauses) for new, old in zip(pair, clause)):
+            return node
+        else_body = folded_else_body
+        if not kept:
+            return else_body or []
+        folded_elifs = []
+        for condition, body in reversed(kept[1:]):
+            folded_elifs = ('elif', condition, body, folded_elifs)
+        return (node[0], ('if', *kept[0]), folded_elifs, [] if else_body is None else ('else', else_body))
+
+    def simplify_all(self, expressions):
+        """Simplify a list of expressions, returning the same list when none changed."""
+        simplified = [self.simplify(expression) for expression in expressions]
+        if all(new is old for new, old in zip(simplified, expressions)):
+            return expressions
+        return simplified
+
+    def simplify(self, node):
+        """Return the folded form of an expression."""
+        if not isinstance(node, tuple):
+            return node
+        if node[0] == 'function_call':
+            args = self.simplify_all(node[2])
+            return node if args is node[2] else (node[0], node[1], args)
+        if node[0] in ('list_access', 'list_append'):
+            operand = self.simplify(node[2])
+            return node if operand is node[2] else (node[0], node[1], operand)
+        if len(node) == 3:
+            return self.simplify_binary(node)
+        if len(node) == 2:
+            return self.simplify_unary(node)
+        return node
+
+    def simplify_binary(self, node):
+        op, left, right = node
+        left = self.simplify(left)
+        right = self.simplify(right)
+        if op in ('and', 'or'):
+            return self.simplify_logical(node, left, right)
+        if is_number(left) and is_number(right):
+            value = self.evaluate(op, left, right)
+            if value is not None:
+                return value
+        simplified = self.simplify_identity(op, left, right)
+        if simplified is not None:
+            return simplified
+        if left is node[1] and right is node[2]:
+            return node
+        return (op, left, right)
+
+    def simplify_identity(self, op, left, right):
+        """
+        The operand left of an identity operation (x*1, 1*x, x-0, x+0, x/1), or None.
+
+        x*1, 1*x and x-0 (integer literals) are exact for every x. x+0 is only
+        dropped for integers (-0.0 + 0 is 0.0); with 1.0 or 0.0, or for x/1, the
+        result is a double, so x must already be one.
+        """
+        for operand, constant, constant_on_right in ((left, right, True), (right, left, False)):
+            if not is_number(constant) or (op in ('-', '/') and not constant_on_right):
+                continue
+            integer_constant = isinstance(constant, int)
+            if op == '*' and constant == 1 and (integer_constant or not self.is_integer(operand)):
+                return operand
+            if op == '/' and constant == 1 and not self.is_integer(operand):
+                return operand
+            if op == '-' and constant == 0 and (integer_constant or not self.is_integer(operand)):
+                return operand
+            if op == '+' and constant == 0 and integer_constant and self.is_integer(operand):
+                return operand
+        return None
+
+    def simplify_logical(self, node, left, right):
+        """and/or with a constant side; the left side is kept whenever it has to run."""
+        op = node[0]
+        left_truth = constant_truth(left)
+        if left_truth is not None:
+            if left_truth == (op == 'or'):
+                return left_truth  # Decided without evaluating the right side
+            return right
+        right_truth = constant_truth(right)
+        if right_truth is not None and right_truth == (op == 'and'):
+            return left  # x and True, x or False
+        if left is node[1] and right is node[2]:
+            return node
+        return (op, left, right)
+
+    def simplify_unary(self, node):
+        op, operand = node
+        operand = self.simplify(operand)
+        if op == 'not':
+            truth = constant_truth(operand)
+            if truth is not None:
+                return not truth
+        elif op == '-' and is_number(operand):
+            if isinstance(operand, int):
+                if INT64_MIN <= -operand <= INT64_MAX:
+                    return -operand
+            else:
+                return 0.0 - operand  # Like the generated fsub: -(0.0) is 0.0
+        return node if operand is node[1] else (op, operand)
+
+    def evaluate(self, op, left, right):
+        """Value of an operation on two numeric literals, or None when it has to be left to run time."""
+        if not all(INT64_MIN <= value <= INT64_MAX for value in (left, right) if isinstance(value, int)):
+            return None
+        integers = isinstance(left, int) and isinstance(right, int)
+        if op in COMPARISONS:
+            # Integers compare natively, anything mixed as doubles
+            if not integers:
+                left, right = float(left), float(right)
+            return COMPARISONS[op](left, right)
+        if integers and op in ('+', '-', '*'):
+            value = left + right if op == '+' else left - right if op == '-' else left * right
+            return value if INT64_MIN <= value <= INT64_MAX else None
+
+        left, right = float(left), float(right)
+        try:
+            if op == '+':
+                value = left + right
+            elif op == '-':
+                value = left - right
+            elif op == '*':
+                value = left * right
+            elif op == '/':
+                if right == 0:
+                    return None  # Reported by the division check at run time
+                value = left / right
+            elif op in ('**', '^'):
+                value = math.pow(left, right)  # The C library pow() the generated code calls
+            else:
+                return None
+        except (ValueError, OverflowError):
+            return None
+        return value if math.isfinite(value) else None
+
+    def is_integer(self, node):
+        """Whether the generated code computes an expression as a native integer (see CodeGenerator.is_integer)."""
+        if isinstance(node, bool):
+            return False
+        if isinstance(node, int):
+            return True
+        if isinstance(node, str):
+            slot = self.symbols.slots.get(node)
+            return slot is not None and self.symbols.types[slot] == 'int'
+        if isinstance(node, tuple):
+            if node[0] == 'list_access':
+                slot = self.symbols.slots.get(node[1])
+                return slot is not None and self.symbols.types[slot] == 'list[int]'
+            if len(node) == 3 and node[0] in ('+', '-', '*'):
+                return self.is_integer(node[1]) and self.is_integer(node[2])
+            if len(node) == 2 and node[0] == '-':
+                return self.is_integer(node[1])
+        return False
+
+
+# Folder of each statement node type; statements of other types are kept as they are
+STATEMENT_FOLDERS = dispatch_table(ConstantFolder, 'fold_')
+
+
+def fold_constants(ast, symbols=None, function_symbols=None):
+    """Fold an analyzed AST, returning the folded AST and the number of nodes removed."""
+    folder = ConstantFolder(symbols, function_symbols)
+    folded = folder.fold_program(ast)
+    return folded, folder.removed_nodes
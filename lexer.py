@@ -1,4 +1,5 @@
 import ply.lex as lex  # Import the PLY lex module for lexical analysis
+import os
 
 # Define reserved words and their corresponding token types
 reserved = { 
@@ -32,7 +33,7 @@ tokens = (
     'LPAREN', 'RPAREN', 'EQUALS', 'GREATER', 'COLON', 'LBRACE', 
     'RBRACE', 'COMMENT', 'NEWLINE', 'LESS', 'GREATER_EQUAL', 
     'LESS_EQUAL', 'NOT_EQUAL', 'EQUAL_EQUAL', 'COMMA', 'LBRACKET', 
-    'RBRACKET', 'NEW', 'SEMICOLON', 'DOT'
+    'RBRACKET', 'NEW', 'SEMICOLON', 'DOT', 'DEDENT'
 ) + tuple(reserved.values())  # Add reserved words to the list of tokens
 
 # Regular expression rules for simple tokens
@@ -112,6 +113,12 @@ def t_newline(t):
     t.type = 'NEWLINE'
     return t
 
+# Single new lines only separate tokens; matching them here (instead of falling
+# through to t_error, which slices the remaining input) keeps lexing linear
+def t_single_newline(t):
+    r'\n'
+    t.lexer.lineno += 1
+
 # Token for multi-line comments
 def t_MULTILINE_STRING(t):
     r'"""(.|\n)*?"""'
@@ -122,16 +129,134 @@ def t_MULTILINE_STRING(t):
 # Ignore spaces and tabs
 t_ignore = ' \t'
 
-# Error handling rule
+# Error handling rule: an illegal character stops tokenizing, the caller reports it
 def t_error(t):
-    if t.value[0] == '\n':
-        t.lexer.lineno += 1  # Increment line count for new lines
-    else:
-        print(f"Illegal character '{t.value[0]}' at line {t.lineno}")
+    if t.value[0] != '\n':
+        raise SyntaxError(f"Illegal character '{t.value[0]}' at line {t.lineno}")
+    t.lexer.lineno += 1  # Increment line count for new lines
     t.lexer.skip(1)
 
+# Master lexer, built once per process from the persisted lextab module
+_master_lexer = None
+
+def get_lexer():
+    """Return the shared master lexer, building it on first use."""
+    global _master_lexer
+    if _master_lexer is None:
+        if lextab_is_current():
+            # Optimized mode skips rule validation and loads the master regex from lextab.py
+            _master_lexer = lex.lex(optimize=True, lextab='lextab')
+        else:
+            _master_lexer = write_lextab()
+    return _master_lexer
+
+def lextab_is_current():
+    """Check that the persisted lextab module was generated for the current tokens and rules."""
+    try:
+        import lextab
+    except ImportError:
+        return False
+    if getattr(lextab, '_lextokens', None) != set(tokens):
+        return False
+    if lextab._lexstateignore.get('INITIAL') != t_ignore:
+        return False
+    # Every rule must appear, with its current regex, in the persisted master regex
+    master_regex = ''.join(regex for regex, _ in lextab._lexstatere['INITIAL'])
+    for name, rule in globals().items():
+        if not name.startswith('t_') or name in ('t_ignore', 't_error'):
+            continue
+        regex = rule.__doc__ if callable(rule) else rule
+        if f'(?P<{name}>{regex})' not in master_regex:
+            return False
+    return True
+
+def write_lextab():
+    """Build the lexer from the rules in this module and persist its tables to lextab.py."""
+    lexer = lex.lex()
+    try:
+        lexer.writetab('lextab', os.path.dirname(os.path.abspath(__file__)))
+    except IOError:
+        pass  # Read-only installation: the lexer still works, it is just rebuilt next time
+    return lexer
+
 # Function to build the lexer
 def build_lexer(data):
-    lexer = lex.lex()  # Create a lexer instance
+    lexer = get_lexer().clone()  # Create a lexer instance without rebuilding the master regex
     lexer.input(data)  # Input data to the lexer
-    return lexer  # Return the lexer instance
\ No newline at end of file
+    return lexer  # Return the lexer instance
+
+# Tokenize the whole input in a single pass
+def tokenize(data):
+    lexer = build_lexer(data)
+    return mark_blocks(list(iter(lexer.token, None)), data)
+
+# Brackets inside which line breaks do not start a new logical line
+OPENING_BRACKETS = ('LPAREN', 'LBRACKET', 'LBRACE')
+CLOSING_BRACKETS = ('RPAREN', 'RBRACKET', 'RBRACE')
+
+def mark_blocks(toks, data):
+    """
+    Insert a DEDENT token wherever a block body ends.
+
+    Every COLON opens a block owned by the line holding it. The block ends
+    before the first later line indented no deeper than that line (an `elif`,
+    an `else` or the next statement), and at the end of the input.
+    """
+    marked = []
+    block_indents = []  # Indentation of the header line of every open block
+    line_indent = 0
+    current_line = None
+    bracket_depth = 0
+    for tok in toks:
+        if tok.type != 'NEWLINE' and tok.lineno != current_line and bracket_depth == 0:
+            # First token of a logical line: close the blocks it dedents out of
+            current_line = tok.lineno
+            line_indent = tok.lexpos - (data.rfind('\n', 0, tok.lexpos) + 1)
+            while block_indents and line_indent <= block_indents[-1]:
+                block_indents.pop()
+                marked.append(make_token('DEDENT', tok.lineno, tok.lexpos))
+        if tok.type == 'COLON':
+            block_indents.append(line_indent)
+        elif tok.type in OPENING_BRACKETS:
+            bracket_depth += 1
+        elif tok.type in CLOSING_BRACKETS and bracket_depth:
+            bracket_depth -= 1
+        marked.append(tok)
+
+    # Close the blocks still open at the end of the input
+    end_line = toks[-1].lineno if toks else 1
+    for _ in block_indents:
+        marked.append(make_token('DEDENT', end_line, len(data)))
+    return marked
+
+def make_token(token_type, lineno, lexpos):
+    """Create a synthetic token."""
+    tok = lex.LexToken()
+    tok.type = token_type
+    tok.value = ''
+    tok.lineno = lineno
+    tok.lexpos = lexpos
+    return tok
+
+class TokenStream:
+    """Feeds an already materialized token list to the parser through the lexer interface."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.index = 0
+
+    def input(self, data):
+        """Tokens are materialized up front, so there is nothing to (re)scan."""
+        self.index = 0
+
+    def token(self):
+        """Return the next token, or None at the end of the stream."""
+        if self.index >= len(self.tokens):
+            return None
+        tok = self.tokens[self.index]
+        self.index += 1
+        return tok
+
+# Regenerate lextab.py after changing the token rules: python lexer.py
+if __name__ == '__main__':
+    write_lextab()
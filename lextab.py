@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'APPEND', 'BREAK', 'COLON', 'COMMA', 'COMMENT', 'DEDENT', 'DEF', 'DIVIDE', 'DOT', 'ELIF', 'ELSE', 'EQUALS', 'EQUAL_EQUAL', 'FALSE', 'FLOAT', 'FOR', 'GREATER', 'GREATER_EQUAL', 'ID', 'IF', 'IN', 'INPUT', 'INT', 'LBRACE', 'LBRACKET', 'LESS', 'LESS_EQUAL', 'LPAREN', 'MINUS', 'NEW', 'NEWLINE', 'NOT', 'NOT_EQUAL', 'NUMBER', 'OR', 'PLUS', 'POWER', 'PRINT', 'RANGE', 'RBRACE', 'RBRACKET', 'RETURN', 'RPAREN', 'SEMICOLON', 'STRING', 'TIMES', 'TRUE', 'TYPE', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_IDENTIFIER>[a-zA-Z_][a-zA-Z_0-9]*)|(?P<t_NUMBER>\\d+(\\.\\d+)?)|(?P<t_TRUE>true)|(?P<t_FALSE>false)|(?P<t_FSTRING>f"([^"\\\\]*(\\\\.[^"\\\\]*)*(\\{[^{}]*\\}[^"\\\\]*)*)")|(?P<t_STRING>"([^"\\\\]|\\\\.)*")|(?P<t_COMMENT>\\#.*)|(?P<t_newline>\\n\\n)|(?P<t_single_newline>\\n)|(?P<t_MULTILINE_STRING>"""(.|\\n)*?""")|(?P<t_POWER>\\*\\*)|(?P<t_PLUS>\\+)|(?P<t_TIMES>\\*)|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))|(?P<t_GREATER_EQUAL>>=)|(?P<t_LESS_EQUAL><=)|(?P<t_NOT_EQUAL>!=)|(?P<t_EQUAL_EQUAL>==)|(?P<t_LBRACKET>\\[)|(?P<t_RBRACKET>\\])|(?P<t_DOT>\\.)|(?P<t_MINUS>-)|(?P<t_DIVIDE>/)|(?P<t_EQUALS>=)|(?P<t_GREATER>>)|(?P<t_LESS><)|(?P<t_COLON>:)|(?P<t_LBRACE>{)|(?P<t_RBRACE>})|(?P<t_SEMICOLON>;)|(?P<t_COMMA>,)', [None, ('t_IDENTIFIER', 'IDENTIFIER'), ('t_NUMBER', 'NUMBER'), None, ('t_TRUE', 'TRUE'), ('t_FALSE', 'FALSE'), ('t_FSTRING', 'FSTRING'), None, None, None, ('t_STRING', 'STRING'), None, ('t_COMMENT', 'COMMENT'), ('t_newline', 'newline'), ('t_single_newline', 'single_newline'), ('t_MULTILINE_STRING', 'MULTILINE_STRING'), None, (None, 'POWER'), (None, 'PLUS'), (None, 'TIMES'), (None, 'LPAREN'), (None, 'RPAREN'), (None, 'GREATER_EQUAL'), (None, 'LESS_EQUAL'), (None, 'NOT_EQUAL'), (None, 'EQUAL_EQUAL'), (None, 'LBRACKET'), (None, 'RBRACKET'), (None, 'DOT'), (None, 'MINUS'), (None, 'DIVIDE'), (None, 'EQUALS'), (None, 'GREATER'), (None, 'LESS'), (None, 'COLON'), (None, 'LBRACE'), (None, 'RBRACE'), (None, 'SEMICOLON'), (None, 'COMMA')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
@@ -0,0 +1,83 @@
+import llvmlite.binding as llvm
+
+# CPU the code is optimized and emitted for: 'native' (the host CPU and its features),
+# 'generic' (the baseline of the target architecture) or an LLVM CPU name such as 'skylake'
+DEFAULT_CPU = 'native'
+
+_initialized = False
+_default_target_machine = None
+_target_cpu = DEFAULT_CPU
+_target_description = None
+
+
+def initialize_llvm():
+    """Initialize the LLVM native target and asm printer (only the first call does any work)."""
+    global _initialized
+    if not _initialized:
+        llvm.initialize()
+        llvm.initialize_native_target()
+        llvm.initialize_native_asmprinter()
+        _initialized = True
+
+
+def set_target_cpu(cpu):
+    """
+    Select the CPU every later optimization and code emission targets.
+
+    Target machines created earlier (e.g. by a running JIT session) keep their CPU.
+    """
+    global _target_cpu, _target_description, _default_target_machine
+    cpu = cpu or DEFAULT_CPU
+    if cpu != _target_cpu:
+        _target_cpu = cpu
+        _target_description = None
+        _default_target_machine = None
+
+
+def resolve_cpu(cpu=None):
+    """
+    Return the (CPU name, feature string) pair of a --cpu value (default: the selected CPU).
+
+    'native' asks LLVM for the host CPU and every feature it supports, so e.g.
+    AVX2 or AVX-512 is used even where the CPU name alone does not imply it.
+    Other names get the features LLVM associates with them.
+    """
+    cpu = cpu or _target_cpu
+    if cpu == 'native':
+        initialize_llvm()
+        return llvm.get_host_cpu_name(), llvm.get_host_cpu_features().flatten()
+    return cpu, ''
+
+
+def target_description():
+    """Describe the selected target CPU and its features (part of the compilation cache key)."""
+    global _target_description
+    if _target_description is None:
+        name, features = resolve_cpu()
+        _target_description = f"cpu={name};features={features}"
+    return _target_description
+
+
+def create_target_machine(cpu=None, **options):
+    """
+    Create a target machine for the host triple.
+
+    Parameters:
+    cpu (str): 'native', 'generic' or an LLVM CPU name (default: the selected CPU).
+    options: Keyword arguments forwarded to Target.create_target_machine().
+
+    Returns:
+    TargetMachine: A new target machine.
+    """
+    initialize_llvm()
+    name, features = resolve_cpu(cpu)
+    target = llvm.Target.from_default_triple()
+    return target.create_target_machine(cpu=name, features=features, **options)
+
+
+def get_target_machine():
+    """Return the shared target machine of the selected CPU (created on first use)."""
+    global _default_target_machine
+    if _default_target_machine is None:
+        _default_target_machine = create_target_machine()
+    return _default_target_machine
@@ -1,17 +1,95 @@
-import lexer
-from parser import parser
-from code_generator import compile_code
-from code_executor import execute_ir
-from semantic_analyzer import SemanticAnalyzer
-from code_optimizer import CodeOptimizer
+import compiler
+from compile_cache import CompilationCache
+import argparse
+import logging
+import os
 import sys
 
-if len(sys.argv) < 2:
-    print("Usage: python test.py <file_path>")
+arg_parser = argparse.ArgumentParser(description="Compile and run a source file, or compile many in parallel.")
+arg_parser.add_argument('file_paths', nargs='*', metavar='file_path',
+                        help="Source file to compile; several files or a directory compile in batch mode")
+arg_parser.add_argument('-j', '--jobs', type=int, help="Worker processes of batch mode (default: CPU count)")
+arg_parser.add_argument('--pattern', default='*.src', help="Files picked up from directories in batch mode")
+arg_parser.add_argument('-q', '--quiet', action='store_true', help="Only show the program's own output and errors")
+arg_parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help="Dump tokens, AST and IR (-v) and semantic analyzer traces (-vv)")
+arg_parser.add_argument('--check', action='store_true',
+                        help="Only lex, parse and analyze the program (no LLVM back end is loaded)")
+arg_parser.add_argument('--emit', choices=('object', 'executable', 'shared'),
+                        help="Compile ahead of time to an object file, executable or shared library instead of running")
+arg_parser.add_argument('-o', '--output', help="Output path of the --emit artifact")
+arg_parser.add_argument('-O', dest='opt_level', choices=('0', '1', '2', '3', 's'), default='3',
+                        help="Optimization level (-O0 skips optimization entirely for fast edit-run cycles)")
+arg_parser.add_argument('--cpu', help="CPU to optimize and emit code for: native (default: the host CPU and "
+                        "its features), generic, or an LLVM CPU name such as skylake")
+arg_parser.add_argument('--passes', help="Comma-separated extra optimization passes, e.g. gvn,licm,loop_unroll")
+arg_parser.add_argument('--incremental', action='store_true',
+                        help="Compile functions and the main body separately, reusing unchanged ones from the cache")
+arg_parser.add_argument('--no-cache', action='store_true', help="Always recompile, bypassing the compilation cache")
+arg_parser.add_argument('--cache-dir', help="Directory of the compilation cache")
+arg_parser.add_argument('--cache-max-size', type=int, help="Maximum size of the compilation cache in bytes")
+arg_parser.add_argument('--cache-stats', action='store_true', help="Print compilation cache statistics and exit")
+arg_parser.add_argument('--clear-cache', action='store_true', help="Remove every compilation cache entry and exit")
+arg_parser.add_argument('--profile', action='store_true',
+                        help="Report time, memory and IR size of every stage (combine with --no-cache)")
+arg_parser.add_argument('--profile-json', metavar='PATH', help="Write the --profile report to a JSON file")
+args = arg_parser.parse_args()
+
+cache = CompilationCache(args.cache_dir, args.cache_max_size)
+
+if args.cache_stats:
+    stats = cache.stats()
+    print(f"Cache directory: {stats['cache_dir']}")
+    print(f"Entries:         {stats['entries']}")
+    print(f"Size:            {stats['size']} / {stats['max_size']} bytes")
+    print(f"Hits:            {stats['hits']}")
+    print(f"Misses:          {stats['misses']}")
+    print(f"Hit rate:        {stats['hit_rate']:.1%}")
+    print(f"Evictions:       {stats['evictions']}")
+    sys.exit(0)
+
+if args.clear_cache:
+    cache.clear()
+    print(f"Cleared compilation cache at {cache.cache_dir}")
+    sys.exit(0)
+
+if not args.file_paths:
+    print("Usage: python main.py <file_path>")
     sys.exit(1)
 
+passes = args.passes.split(',') if args.passes else None
+if args.cpu and not args.check:
+    from llvm_target import set_target_cpu
+
+    set_target_cpu(args.cpu)
+
+# Batch mode: compile (without running) every file across a process pool
+if len(args.file_paths) > 1 or os.path.isdir(args.file_paths[0]):
+    import time
+    from batch import compile_batch, find_sources
+
+    sources = find_sources(args.file_paths, args.pattern)
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+    start = time.perf_counter()
+    failed = 0
+    for file_result in compile_batch(sources, args.jobs, stages=['analyze' if args.check else 'optimize'],
+                                     opt_level='O' + args.opt_level, passes=passes, cpu=args.cpu, emit=args.emit,
+                                     output_dir=args.output, cache_dir=args.cache_dir,
+                                     cache_max_size=args.cache_max_size, use_cache=not args.no_cache):
+        if not file_result.ok:
+            failed += 1
+            print(f"FAIL {file_result.path}: {file_result.error}")
+        elif not args.quiet:
+            note = ' (cached)' if file_result.cache_hit else ''
+            print(f"ok   {file_result.total_time * 1000:9.1f} ms  {file_result.path}{note}")
+    elapsed = time.perf_counter() - start
+    print(f"{len(sources)} files: {len(sources) - failed} ok, {failed} failed in {elapsed:.2f} s "
+          f"({len(sources) / elapsed if elapsed else 0:.1f} files/s)")
+    sys.exit(1 if failed else 0)
+
 # Read the file sent from Sublime Text
-file_path = sys.argv[1]
+file_path = args.file_paths[0]
 try:
     with open(file_path, 'r') as f:
         data = f.read()
@@ -19,52 +97,65 @@ except FileNotFoundError:
     print(f"Error: File '{file_path}' not found.")
     sys.exit(1)
 
-print("================ Compilation Process Stated ==============")
-print("")
-print("================ Tokenizing Source Code ===================")
-# Build lexer
-lexer_ins = lexer.build_lexer(data=data)
-while True:
-    tok = lexer_ins.token()
-    if not tok:
-        break
-    print(tok)
-
-print("\n")
-print("\n")
-print("=============== Parsing Source Code =========================")
-# Parse the input data
-result = parser.parse(data)
-
-print("Abstract Syntax Tree:")
-print(result)
-
-print("\n")
-# Perform semantic analysis
-analyzer = SemanticAnalyzer()
+# Diagnostics go through the logging module; dumps are opt-in with -v
+logging.basicConfig(stream=sys.stdout, format='%(message)s')
+verbosity = compiler.QUIET if args.quiet else compiler.NORMAL + args.verbose
+compiler.logger.setLevel({
+    compiler.QUIET: logging.WARNING,
+    compiler.NORMAL: logging.INFO,
+    compiler.VERBOSE: logging.DEBUG,
+}.get(verbosity, compiler.TRACE))
+
+# Token dumps need the lexer stage; everything else is implied by the last stage
+if args.check:
+    last_stage = 'analyze'
+elif args.emit:
+    last_stage = 'optimize'
+else:
+    last_stage = 'execute'
+stages = ['lex', last_stage] if verbosity >= compiler.VERBOSE else [last_stage]
+
+profiler = None
+if args.profile or args.profile_json:
+    from profiling import PipelineProfiler
+
+    profiler = PipelineProfiler()
+
 try:
-    print("============== Semantically Analyzing Source Code ==================")
-    analyzer.analyze(result)
-    print("\nSemantic Analysis Successful")
-    
-    print("\n")
-    print("============== Generating Intermediate Representation ==================")
-    # Compile the AST to IR
-    code_gen = compile_code(result)
-    print(code_gen)
-
-    print("\n")
-    print("============== Optimizing Intermediate representation ====================")
-    optimizer = CodeOptimizer(code_gen)
-    optimized_ir = optimizer.run()
-    print("\n Optimized IR:")
-    print(optimized_ir)
-
-
-    print("\n")
-    print("============== Compilation and Execution Completed ==================")
-    # Execute the generated IR
-    execute_ir(optimized_ir)
-    print("\n")
+    if args.incremental and not args.check:
+        from incremental import IncrementalCompiler
+
+        incremental_compiler = IncrementalCompiler(None if args.no_cache else cache, 'O' + args.opt_level, passes)
+        result = incremental_compiler.compile(data, verbosity)
+        if not args.emit:
+            from code_executor import execute_ir
+
+            execute_ir(result.optimized_module)
+    else:
+        result = compiler.compile(data, stages=stages, verbosity=verbosity, cache=None if args.no_cache else cache,
+                                  profiler=profiler, opt_level='O' + args.opt_level,
+                                  passes=passes)
+    if args.emit:
+        from aot_compiler import compile_native
+
+        default_output = {'object': '.o', 'executable': '', 'shared': '.so'}[args.emit]
+        output_path = args.output or os.path.splitext(file_path)[0] + default_output
+        compile_native(result.optimized, output_path, kind=args.emit)
+        if verbosity >= compiler.NORMAL:
+            print(f"Wrote {args.emit} to {output_path}")
+except SyntaxError as e:
+    print("\n" + str(e))
+    sys.exit(1)
 except Exception as e:
     print("\nSemantic Analysis Error:", e)
+    sys.exit(1)
+
+if profiler is not None:
+    profiler.close()
+    if args.profile:
+        print(profiler.format_report())
+    if args.profile_json:
+        import json
+
+        with open(args.profile_json, 'w') as f:
+            json.dump(profiler.report(), f, indent=2)
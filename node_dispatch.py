@@ -0,0 +1,39 @@
+# Tags of the statement nodes the parser builds (the first element of each node tuple)
+STATEMENT_TYPES = (
+    'function_def',
+    'return',
+    'function_call',
+    'list_create',
+    'list_append',
+    'list_access',
+    'input',
+    'input_multiple',
+    'assign',
+    'print',
+    'if_stmt',
+    'while',
+    'for',
+    'break',
+)
+
+
+def dispatch_table(cls, prefix, node_types=STATEMENT_TYPES):
+    """
+    Map every node type a class handles to its handler method.
+
+    The table is built once per class from the methods named `<prefix><node type>`,
+    so dispatching a node costs one dictionary lookup instead of formatting the
+    method name and looking it up on the instance (or testing its type against
+    every known kind in turn). Only the given node types are looked up: helpers
+    sharing the prefix (e.g. visit_binop) never become handlers of a node.
+
+    Parameters:
+    cls (type): The class defining the handlers (e.g. CodeGenerator).
+    prefix (str): The handler name prefix (e.g. 'visit_').
+    node_types (iterable): The node types to dispatch (default: every statement type).
+
+    Returns:
+    dict: The handler function of each node type the class handles, called as handler(instance, node).
+    """
+    return {node_type: getattr(cls, prefix + node_type)
+            for node_type in node_types if callable(getattr(cls, prefix + node_type, None))}
@@ -18,20 +18,18 @@ def p_program(p):
     p[0] = p[1]  # A program consists of multiple statements
 
 # Define rules for multiple statements
+# Left recursion reduces each statement as soon as it is complete, so the parser
+# stack stays bounded and the list is extended in place (linear time overall)
 def p_statements(p):
-    '''statements : statement NEWLINE statements
-                  | statement statements
-                  | statement
+    '''statements : statements statement NEWLINE
+                  | statements statement
                   | empty'''
     # Build a list of statements based on the input
-    if len(p) == 4:
-        p[0] = [p[1]] + p[3]
-    elif len(p) == 3:
-        p[0] = [p[1]] + p[2]
-    elif len(p) == 2:
-        p[0] = [p[1]]
+    if len(p) == 2:
+        p[0] = p[1]  # Start from the empty list
     else:
-        p[0] = []
+        p[1].append(p[2])
+        p[0] = p[1]
 
 # Handle empty productions
 def p_empty(p):
@@ -48,31 +46,46 @@ def p_statement(p):
                  | for_stmt
                  | list_stmt
                  | function_def
-                 | function_call
                  | return_stmt
                  | break_stmt
                  | expression'''
     p[0] = p[1]  # Delegate processing to specific statement rules
 
+# Define the body of a compound statement
+# The lexer closes every block with a DEDENT, so a body ends where its indentation does
+def p_suite(p):
+    '''suite : NEWLINE statements DEDENT
+             | statements DEDENT'''
+    if len(p) == 4:
+        p[0] = p[2]  # Body starting after a blank line
+    else:
+        p[0] = p[1]  # Body starting on the next line or inline
+
 # Define a function definition
 def p_function_def(p):
-    '''function_def : DEF ID LPAREN parameter_list RPAREN COLON NEWLINE statements
-                   | DEF ID LPAREN RPAREN COLON NEWLINE statements'''
+    '''function_def : DEF ID LPAREN parameter_list RPAREN COLON suite
+                   | DEF ID LPAREN RPAREN COLON suite'''
     # Functions can have parameters or be parameter-less
-    if len(p) == 9:
-        p[0] = ('function_def', p[2], p[4], p[8])  # Function name, parameters, body
+    if len(p) == 8:
+        p[0] = ('function_def', p[2], p[4], p[7])  # Function name, parameters, body
     else:
-        p[0] = ('function_def', p[2], [], p[7])  # Function with no parameters
+        p[0] = ('function_def', p[2], [], p[6])  # Function with no parameters
 
 # Define a parameter list for functions
 def p_parameter_list(p):
     '''parameter_list : ID
-                     | ID COMMA parameter_list'''
+                     | parameter_list COMMA ID'''
     # Build a list of parameters
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = [p[1]] + p[3]
+        p[1].append(p[3])
+        p[0] = p[1]
+
+# Function calls are expressions (and expression statements)
+def p_expression_function_call(p):
+    '''expression : function_call'''
+    p[0] = p[1]
 
 # Define function call syntax
 def p_function_call(p):
@@ -87,12 +100,13 @@ def p_function_call(p):
 # Define arguments for function calls
 def p_argument_list(p):
     '''argument_list : expression
-                    | expression COMMA argument_list'''
+                    | argument_list COMMA expression'''
     # Build a list of arguments
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = [p[1]] + p[3]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 # Define return statement syntax
 def p_return_stmt(p):
@@ -112,11 +126,12 @@ def p_print_stmt(p):
 # Define print arguments to support strings, variables, and expressions
 def p_print_arguments(p):
     '''print_arguments : expression
-                       | expression COMMA print_arguments'''
+                       | print_arguments COMMA expression'''
     if len(p) == 2:
         p[0] = [p[1]]  # Single argument
     else:
-        p[0] = [p[1]] + p[3]  # Combine the first argument with the rest
+        p[1].append(p[3])  # Extend the arguments parsed so far
+        p[0] = p[1]
 
 # Define assignment statements
 def p_assignment_stmt(p):
@@ -140,11 +155,12 @@ def p_input_multiple(p):
 # Define a list of IDs
 def p_id_list(p):
     '''id_list : ID COMMA ID
-               | ID COMMA id_list'''
-    if len(p) == 4:
-        p[0] = [p[1], p[3]]  # Build a list of IDs
+               | id_list COMMA ID'''
+    if isinstance(p[1], list):
+        p[1].append(p[3])  # Extend the IDs parsed so far
+        p[0] = p[1]
     else:
-        p[0] = [p[1]] + p[3]
+        p[0] = [p[1], p[3]]  # Build a list of IDs
 # Define list creation and operations
 def p_list_stmt(p):
     '''list_stmt : ID EQUALS LBRACKET list_elements RBRACKET
@@ -158,12 +174,13 @@ def p_list_stmt(p):
 # Define elements inside a list
 def p_list_elements(p):
     '''list_elements : expression
-                    | expression COMMA list_elements'''
+                    | list_elements COMMA expression'''
     # Build a list of expressions
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = [p[1]] + p[3]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 # Define list access and modification operations
 def p_list_operation(p):
@@ -182,49 +199,46 @@ def p_break_stmt(p):
 
 # Define if-elif-else statements
 def p_if_stmt(p):
-    '''if_stmt : IF expression COLON NEWLINE statements elif_stmt else_stmt
-               | IF expression COLON statements elif_stmt else_stmt'''
+    '''if_stmt : IF expression COLON suite elif_stmt else_stmt'''
     # Group condition, if body, elif clauses, and else body
-    if len(p) == 8:
-        p[0] = ('if_stmt', ('if', p[2], p[5]), p[6], p[7])  # Multi-line if body
-    else:
-        p[0] = ('if_stmt', ('if', p[2], p[4]), p[5], p[6])  # Inline if body
+    p[0] = ('if_stmt', ('if', p[2], p[4]), p[5], p[6])
 
 # Define elif clauses
 def p_elif_stmt(p):
-    '''elif_stmt : ELIF expression COLON NEWLINE statements elif_stmt
-                 | ELIF expression COLON statements elif_stmt
+    '''elif_stmt : ELIF expression COLON suite elif_stmt
                  | empty'''
     # Handle nested elif clauses
-    if len(p) == 7:
-        p[0] = ('elif', p[2], p[5], p[6])  # Multi-line elif body
-    elif len(p) == 6:
-        p[0] = ('elif', p[2], p[4], p[5])  # Inline elif body
+    if len(p) == 6:
+        p[0] = ('elif', p[2], p[4], p[5])
     else:
         p[0] = []  # No elif
 
 # Define else clause
 def p_else_stmt(p):
-    '''else_stmt : ELSE COLON NEWLINE statements
-                 | ELSE COLON statements
+    '''else_stmt : ELSE COLON suite
                  | empty'''
     # Else clause with or without a body
-    if len(p) == 5:
-        p[0] = ('else', p[4])  # Multi-line else body
-    elif len(p) == 4:
-        p[0] = ('else', p[3])  # Inline else body
+    if len(p) == 4:
+        p[0] = ('else', p[3])
     else:
         p[0] = []  # No else
 
 # Define while loop statement
 def p_while_stmt(p):
-    '''while_stmt : WHILE expression COLON NEWLINE statements'''
-    p[0] = ('while', p[2], p[5])  # While loop with condition and body
+    '''while_stmt : WHILE expression COLON suite'''
+    p[0] = ('while', p[2], p[4])  # While loop with condition and body
 
 # Define for loop statement
 def p_for_stmt(p):
-    '''for_stmt : FOR ID IN RANGE LPAREN expression COMMA expression RPAREN COLON NEWLINE statements'''
-    p[0] = ('for', p[2], ('range', p[6], p[8]), p[12])  # For loop with range and body
+    '''for_stmt : FOR ID IN RANGE LPAREN expression COMMA expression RPAREN COLON suite
+                | FOR ID IN RANGE LPAREN expression COMMA expression COMMA expression RPAREN COLON suite
+                | FOR ID IN ID COLON suite'''
+    if len(p) == 12:
+        p[0] = ('for', p[2], ('range', p[6], p[8]), p[11])  # For loop with range and body
+    elif len(p) == 14:
+        p[0] = ('for', p[2], ('range', p[6], p[8], p[10]), p[13])  # Stepped range (a negative step counts down)
+    else:
+        p[0] = ('for', p[2], ('list', p[4]), p[6])  # Loop over the elements of a list
 
 # Define binary operations for expressions
 def p_expression_binop(p):
@@ -277,14 +291,40 @@ def p_expression_identifier(p):
     '''expression : ID'''
     p[0] = p[1]  # Return the identifier
 
-# Handle syntax errors
+# Handle syntax errors: parsing stops at the first one, the caller reports it
 def p_error(p):
     if p and p.type == 'NEWLINE':
         return  # Ignore isolated newline errors
     elif p:
-        print(f"Syntax error at line {p.lineno}: {p.type} - {p.value}")
+        raise SyntaxError(f"Syntax error at line {p.lineno}: {p.type} - {p.value}")
     else:
-        print("Syntax error at EOF")
+        raise SyntaxError("Syntax error at EOF")
+
+# Module holding the prebuilt LALR tables. PLY versions it with its table format
+# (_tabversion) and a signature of this grammar (_lr_signature); stale tables
+# are detected and regenerated automatically.
+TABLE_MODULE = 'parsetab'
+
+def build_parser(debug=False):
+    """
+    Build the parser from the prebuilt tables.
+
+    With debug off (the default) loading the tables never writes parser.out;
+    pass debug=True (or run `python parser.py`) to regenerate the tables
+    together with the parser.out grammar report.
+    """
+    return yacc.yacc(debug=debug, tabmodule=TABLE_MODULE)
 
 # Build the parser
-parser = yacc.yacc()
+parser = build_parser()
+
+# Regenerate parsetab.py and parser.out after changing the grammar: python parser.py
+if __name__ == '__main__':
+    import os
+    import sys
+
+    table_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), TABLE_MODULE + '.py')
+    if os.path.exists(table_file):
+        os.remove(table_file)
+    sys.modules.pop(TABLE_MODULE, None)
+    build_parser(debug=True)
@@ -0,0 +1,192 @@
+import re
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+# One row of LLVM's pass timing report: "(seconds (percent%))+ pass name"
+PASS_TIMING_ROW = re.compile(r'^\s*((?:[\d.]+\s+\(\s*[\d.]+%\)\s+)+)(\S.*?)\s*$')
+
+
+def count_ast_nodes(node):
+    """Count the nodes of an AST (every tuple, list and leaf value), walked iteratively: elif chains nest deeply."""
+    count = 0
+    pending = [node]
+    while pending:
+        node = pending.pop()
+        count += 1
+        if isinstance(node, (list, tuple)):
+            pending.extend(node)
+    return count
+
+
+def module_statistics(module):
+    """
+    Measure the size of a parsed LLVM module.
+
+    Parameters:
+    module (ModuleRef): The module to measure.
+
+    Returns:
+    dict: Counts of defined functions, basic blocks and instructions.
+    """
+    functions = blocks = instructions = 0
+    for function in module.functions:
+        if function.is_declaration:
+            continue
+        functions += 1
+        for block in function.blocks:
+            blocks += 1
+            instructions += sum(1 for _ in block.instructions)
+    return {'functions': functions, 'blocks': blocks, 'instructions': instructions}
+
+
+def parse_pass_timings(report):
+    """
+    Extract per-pass wall times from an LLVM pass timing report.
+
+    Returns:
+    list: (pass name, wall seconds) pairs, slowest first, as LLVM orders them.
+    """
+    timings = []
+    for line in report.splitlines():
+        match = PASS_TIMING_ROW.match(line)
+        if match is None or match.group(2).startswith('Total'):
+            continue
+        # The wall time is the last column LLVM prints
+        seconds = re.findall(r'([\d.]+)\s+\(', match.group(1))
+        timings.append((match.group(2), float(seconds[-1])))
+    return timings
+
+
+def max_rss():
+    """Peak resident set size of the process in bytes, or None when unknown."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class StageProfile:
+    """Measurements of one pipeline stage."""
+
+    def __init__(self, stage):
+        self.stage = stage
+        self.wall_time = 0.0     # Elapsed seconds
+        self.cpu_time = 0.0      # Process CPU seconds
+        self.peak_memory = None  # Peak Python heap allocated on top of the stage's starting point, in bytes
+        self.max_rss = None      # Process resident set high-water mark after the stage, in bytes
+        self.metrics = {}        # Stage specific sizes and sub-timings (token count, IR size, pass times...)
+        self._start_wall = None
+        self._start_cpu = None
+        self._start_memory = 0
+
+    def as_dict(self):
+        return {
+            'stage': self.stage,
+            'wall_time': self.wall_time,
+            'cpu_time': self.cpu_time,
+            'peak_memory': self.peak_memory,
+            'max_rss': self.max_rss,
+            'metrics': self.metrics,
+        }
+
+
+class PipelineProfiler:
+    """
+    Collects per-stage measurements of compiler.compile().
+
+    Every stage that runs gets a StageProfile with its wall and CPU time, the
+    peak memory it allocated and stage specific metrics: token and AST node
+    counts, IR function/block/instruction counts before and after optimization,
+    per-pass optimization times and the JIT finalize time. Callbacks registered
+    with add_callback() receive each StageProfile as soon as its stage ends;
+    report() returns everything as plain data (e.g. for JSON).
+
+    Memory tracing (tracemalloc) slows the Python stages down noticeably, so it
+    can be turned off when only the timings matter.
+    """
+
+    def __init__(self, trace_memory=True, time_passes=True):
+        """
+        Parameters:
+        trace_memory (bool): Measure the peak Python memory of each stage.
+        time_passes (bool): Collect per-pass timings of the LLVM optimizer.
+        """
+        self.trace_memory = trace_memory
+        self.time_passes = time_passes
+        self.stages = []     # Finished StageProfiles in execution order
+        self.callbacks = []  # Called with each finished StageProfile
+        self._started_tracing = False
+
+    def add_callback(self, callback):
+        """Register a function called with the StageProfile of every finished stage."""
+        self.callbacks.append(callback)
+
+    def start_stage(self, stage):
+        """Start measuring a stage and return its StageProfile."""
+        profile = StageProfile(stage)
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            tracemalloc.reset_peak()
+            profile._start_memory = tracemalloc.get_traced_memory()[0]
+        profile._start_cpu = time.process_time()
+        profile._start_wall = time.perf_counter()
+        return profile
+
+    def end_stage(self, profile, collect_metrics=None):
+        """
+        Stop measuring a stage, record its metrics and notify the callbacks.
+
+        Parameters:
+        profile (StageProfile): The profile returned by start_stage().
+        collect_metrics (callable): Returns a dict of metrics; called once the timers stopped.
+        """
+        profile.wall_time = time.perf_counter() - profile._start_wall
+        profile.cpu_time = time.process_time() - profile._start_cpu
+        if self.trace_memory and tracemalloc.is_tracing():
+            profile.peak_memory = tracemalloc.get_traced_memory()[1] - profile._start_memory
+        profile.max_rss = max_rss()
+        if collect_metrics is not None:
+            profile.metrics.update(collect_metrics())
+        self.stages.append(profile)
+        for callback in self.callbacks:
+            callback(profile)
+        return profile
+
+    def close(self):
+        """Stop memory tracing if this profiler started it."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def report(self):
+        """
+        Returns:
+        dict: The measurements of every stage along with totals.
+        """
+        return {
+            'stages': [profile.as_dict() for profile in self.stages],
+            'total_wall_time': sum(profile.wall_time for profile in self.stages),
+            'total_cpu_time': sum(profile.cpu_time for profile in self.stages),
+        }
+
+    def format_report(self, top_passes=5):
+        """Render the report as a human readable table."""
+        lines = [f"{'stage':<10} {'wall (ms)':>10} {'cpu (ms)':>10} {'peak mem (KiB)':>15}  metrics"]
+        for profile in self.stages:
+            peak = f"{profile.peak_memory / 1024:.1f}" if profile.peak_memory is not None else '-'
+            metrics = ', '.join(f"{name}={value:.4g}" if isinstance(value, float) else f"{name}={value}"
+                                for name, value in profile.metrics.items() if not isinstance(value, (list, dict)))
+            lines.append(f"{profile.stage:<10} {profile.wall_time * 1000:>10.2f} "
+                         f"{profile.cpu_time * 1000:>10.2f} {peak:>15}  {metrics}")
+            for name, seconds in profile.metrics.get('passes', [])[:top_passes]:
+                lines.append(f"{'':<10} {seconds * 1000:>10.2f} {'':>10} {'':>15}  pass: {name}")
+        return '\n'.join(lines)
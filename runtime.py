@@ -0,0 +1,780 @@
+import platform
+
+from llvmlite import ir
+
+# Capacity of a list's first buffer, and the factor its capacity grows by when full
+LIST_MIN_CAPACITY = 8
+LIST_GROWTH_FACTOR = 2
+
+# Size of the output buffer print writes to; the environment variable overrides it when the program starts
+OUTPUT_BUFFER_SIZE = 64 * 1024
+OUTPUT_BUFFER_ENV = 'PYCOMPILER_OUTPUT_BUFFER'
+
+# Longest number the fast formatting paths produce: sign, 20 digits, '.', 2 decimals
+NUMBER_MAX_WIDTH = 24
+
+# Floats below this print through the exact fast path; the scaled value stays below 2**52
+FAST_FLOAT_LIMIT = 1e13
+
+# Longest %.2f rendering of a double: sign, 309 digits, '.', 2 decimals, NUL
+FLOAT_TEXT_SIZE = 320
+
+# Bytes marking where the values go in a print line's template
+OUTPUT_INT_SLOT = '\x01'
+OUTPUT_FLOAT_SLOT = '\x02'
+
+# Size of the input buffer; one read() fills it with as many numbers as are available
+INPUT_BUFFER_SIZE = 64 * 1024
+
+# Numbers with at most this many digits (and no exponent) are parsed without strtod: their
+# mantissa is below 2**53 and their power of ten exact, so one division rounds them correctly
+FAST_NUMBER_DIGITS = 15
+
+I64 = ir.IntType(64)
+I8_PTR = ir.IntType(8).as_pointer()
+
+
+def list_struct_type(element_type):
+    """
+    Native list header: { i64 length, i64 capacity, T* data }.
+
+    The elements live unboxed in one contiguous heap buffer of `capacity`
+    slots; the first `length` are in use.
+    """
+    return ir.LiteralStructType([I64, I64, element_type.as_pointer()])
+
+
+def list_pointer_type(element_type):
+    """Storage type of a list variable: a pointer to its header."""
+    return list_struct_type(element_type).as_pointer()
+
+
+def element_size(element_type):
+    """Size of one element in bytes, as a target-independent constant expression."""
+    null = ir.Constant(element_type.as_pointer(), None)
+    return null.gep([ir.Constant(I64, 1)]).ptrtoint(I64)
+
+
+def declare_c_function(module, name, return_type, param_types, var_arg=False):
+    """Return the declaration of a C library function, adding it on first use."""
+    if name in module.globals:
+        return module.globals[name]
+    return ir.Function(module, ir.FunctionType(return_type, param_types, var_arg=var_arg), name=name)
+
+
+def _define_helper(module, name, return_type, param_types, attributes=(), linkage='internal'):
+    function = ir.Function(module, ir.FunctionType(return_type, param_types), name=name)
+    function.linkage = linkage
+    for attribute in ('nounwind',) + tuple(attributes):
+        function.attributes.add(attribute)
+    return function, ir.IRBuilder(function.append_basic_block(name="entry"))
+
+
+def _suffix(element_type):
+    return 'i64' if isinstance(element_type, ir.IntType) else 'f64'
+
+
+def get_list_new(module, element_type):
+    """
+    Define (once per module) `list* __list_new_<T>(i64 capacity)`.
+
+    Allocates the header and a buffer of at least LIST_MIN_CAPACITY elements.
+    """
+    name = f"__list_new_{_suffix(element_type)}"
+    if name in module.globals:
+        return module.globals[name]
+    malloc = declare_c_function(module, 'malloc', I8_PTR, [I64])
+    header_type = list_struct_type(element_type)
+    function, builder = _define_helper(module, name, header_type.as_pointer(), [I64])
+    requested = function.args[0]
+
+    minimum = ir.Constant(I64, LIST_MIN_CAPACITY)
+    capacity = builder.select(builder.icmp_signed('<', requested, minimum), minimum, requested)
+    header_size = ir.Constant(header_type.as_pointer(), None).gep([ir.Constant(I64, 1)]).ptrtoint(I64)
+    header = builder.bitcast(builder.call(malloc, [header_size]), header_type.as_pointer())
+    data = builder.call(malloc, [builder.mul(capacity, element_size(element_type))])
+
+    zero = ir.Constant(ir.IntType(32), 0)
+    builder.store(ir.Constant(I64, 0), builder.gep(header, [zero, ir.Constant(ir.IntType(32), 0)]))
+    builder.store(capacity, builder.gep(header, [zero, ir.Constant(ir.IntType(32), 1)]))
+    builder.store(builder.bitcast(data, element_type.as_pointer()),
+                  builder.gep(header, [zero, ir.Constant(ir.IntType(32), 2)]))
+    builder.ret(header)
+    return function
+
+
+def get_list_grow(module, element_type):
+    """
+    Define (once per module) `void __list_grow_<T>(list*)`.
+
+    Multiplies the capacity by LIST_GROWTH_FACTOR and reallocates the buffer,
+    so appends run in amortized constant time. It is only called when an
+    append finds the buffer full, so it is kept out of line.
+    """
+    name = f"__list_grow_{_suffix(element_type)}"
+    if name in module.globals:
+        return module.globals[name]
+    realloc = declare_c_function(module, 'realloc', I8_PTR, [I8_PTR, I64])
+    header_type = list_struct_type(element_type)
+    function, builder = _define_helper(module, name, ir.VoidType(), [header_type.as_pointer()],
+                                       attributes=('noinline', 'cold'))
+    header = function.args[0]
+
+    zero = ir.Constant(ir.IntType(32), 0)
+    capacity_ptr = builder.gep(header, [zero, ir.Constant(ir.IntType(32), 1)])
+    data_ptr = builder.gep(header, [zero, ir.Constant(ir.IntType(32), 2)])
+    capacity = builder.mul(builder.load(capacity_ptr), ir.Constant(I64, LIST_GROWTH_FACTOR))
+    data = builder.bitcast(builder.load(data_ptr), I8_PTR)
+    data = builder.call(realloc, [data, builder.mul(capacity, element_size(element_type))])
+    builder.store(capacity, capacity_ptr)
+    builder.store(builder.bitcast(data, element_type.as_pointer()), data_ptr)
+    builder.ret_void()
+    return function
+
+
+# Output buffer
+#
+# print formats straight into one process-wide byte buffer that is written to
+# file descriptor 1 in bulk, instead of calling printf (which parses its format
+# and locks stdout) once per line. The buffer and its formatting code form a
+# separate runtime module (build_output_runtime) that is optimized once and
+# linked into every program after the program itself was optimized; generated
+# code only declares its entry points (declare_runtime_function).
+
+I32 = ir.IntType(32)
+I8 = ir.IntType(8)
+DOUBLE = ir.DoubleType()
+
+# Entry points and state of the output runtime, by name: the symbols programs link against
+OUTPUT_FUNCTION_TYPES = {
+    '__out_flush': ir.FunctionType(ir.VoidType(), []),
+    '__out_template': ir.FunctionType(ir.VoidType(), [I8_PTR, I64, I64.as_pointer()]),
+}
+OUTPUT_STATE = ('__out_buffer', '__out_length', '__out_capacity')
+
+
+def _output_global(module, name, value_type, initializer):
+    if name in module.globals:
+        return module.globals[name]
+    variable = ir.GlobalVariable(module, value_type, name=name)
+    variable.initializer = initializer
+    return variable
+
+
+def _output_state(module):
+    """Return the (buffer, length, capacity) globals of the output buffer."""
+    buffer_name, length_name, capacity_name = OUTPUT_STATE
+    return (_output_global(module, buffer_name, I8_PTR, ir.Constant(I8_PTR, None)),
+            _output_global(module, length_name, I64, ir.Constant(I64, 0)),
+            _output_global(module, capacity_name, I64, ir.Constant(I64, 0)))
+
+
+def _constant_text(module, name, text):
+    """A NUL-terminated string constant for the runtime's own use."""
+    if name in module.globals:
+        return module.globals[name]
+    data = bytearray(text.encode('utf8')) + b'\0'
+    variable = ir.GlobalVariable(module, ir.ArrayType(I8, len(data)), name=name)
+    variable.linkage = 'private'
+    variable.global_constant = True
+    variable.initializer = ir.Constant(variable.value_type, data)
+    return variable
+
+
+def _copy_bytes(module, builder, destination, source, size):
+    memcpy = module.declare_intrinsic('llvm.memcpy', [I8_PTR, I8_PTR, I64])
+    builder.call(memcpy, [destination, source, size, ir.Constant(ir.IntType(1), 0)])
+
+
+def _define_output_flush(module):
+    """
+    Define `void __out_flush()`.
+
+    Writes the buffered bytes to file descriptor 1, retrying partial writes.
+    Called when the program ends, before it reads input and before runtime errors.
+    """
+    name = '__out_flush'
+    if name in module.globals:
+        return module.globals[name]
+    write = declare_c_function(module, '_write' if platform.system() == 'Windows' else 'write',
+                               I64, [I32, I8_PTR, I64])
+    buffer_ptr, length_ptr, _ = _output_state(module)
+    function, builder = _define_helper(module, name, ir.VoidType(), [], linkage='external')
+    write_block = function.append_basic_block(name="write")
+    done_block = function.append_basic_block(name="done")
+
+    length = builder.load(length_ptr)
+    entry_block = builder.block
+    builder.cbranch(builder.icmp_signed('>', length, ir.Constant(I64, 0)), write_block, done_block)
+
+    builder.position_at_end(write_block)
+    written = builder.phi(I64, name="written")
+    written.add_incoming(ir.Constant(I64, 0), entry_block)
+    data = builder.gep(builder.load(buffer_ptr), [written])
+    count = builder.call(write, [ir.Constant(I32, 1), data, builder.sub(length, written)])
+    total = builder.add(written, count)
+    written.add_incoming(total, write_block)
+    # Stop on an error (count <= 0) as well as when everything was written
+    progress = builder.icmp_signed('>', count, ir.Constant(I64, 0))
+    builder.cbranch(builder.and_(progress, builder.icmp_signed('<', total, length)), write_block, done_block)
+
+    builder.position_at_end(done_block)
+    builder.store(ir.Constant(I64, 0), length_ptr)
+    builder.ret_void()
+    return function
+
+
+def _get_output_reserve(module):
+    """
+    Define (once per module) `void __out_reserve(i64 size)`.
+
+    Makes room for `size` more bytes: flushes the buffer and, on first use,
+    allocates it with OUTPUT_BUFFER_SIZE bytes (or the size given by the
+    OUTPUT_BUFFER_ENV environment variable). A line longer than the buffer
+    grows it. Callers check the free space inline and only call this when
+    the buffer is full, so it is kept out of line.
+    """
+    name = '__out_reserve'
+    if name in module.globals:
+        return module.globals[name]
+    getenv = declare_c_function(module, 'getenv', I8_PTR, [I8_PTR])
+    atol = declare_c_function(module, 'atol', I64, [I8_PTR])
+    realloc = declare_c_function(module, 'realloc', I8_PTR, [I8_PTR, I64])
+    flush = _define_output_flush(module)
+    buffer_ptr, _, capacity_ptr = _output_state(module)
+    function, builder = _define_helper(module, name, ir.VoidType(), [I64], attributes=('noinline', 'cold'))
+    size = function.args[0]
+    builder.call(flush, [])
+
+    # The configured size applies when the buffer is first allocated
+    buffer = builder.load(buffer_ptr)
+    unallocated = builder.icmp_unsigned('==', buffer, ir.Constant(I8_PTR, None))
+    with builder.if_then(unallocated):
+        variable_name = _constant_text(module, '__out_buffer_env', OUTPUT_BUFFER_ENV)
+        setting = builder.call(getenv, [builder.bitcast(variable_name, I8_PTR)])
+        builder.store(ir.Constant(I64, OUTPUT_BUFFER_SIZE), capacity_ptr)
+        with builder.if_then(builder.icmp_unsigned('!=', setting, ir.Constant(I8_PTR, None))):
+            builder.store(builder.call(atol, [setting]), capacity_ptr)
+    capacity = builder.load(capacity_ptr)
+    wanted = builder.select(builder.icmp_signed('<', capacity, size), size, capacity)
+    grow = builder.or_(unallocated, builder.icmp_signed('>', wanted, capacity))
+    with builder.if_then(grow):
+        builder.store(builder.call(realloc, [buffer, wanted]), buffer_ptr)
+        builder.store(wanted, capacity_ptr)
+    builder.ret_void()
+    return function
+
+
+def _reserve_output(module, builder, size):
+    """Emit the inline check that the output buffer has `size` free bytes, calling __out_reserve when not."""
+    _, length_ptr, capacity_ptr = _output_state(module)
+    needed = builder.add(builder.load(length_ptr), size)
+    full = builder.icmp_signed('>', needed, builder.load(capacity_ptr))
+    with builder.if_then(full, likely=False):
+        builder.call(_get_output_reserve(module), [size])
+
+
+def _append(module, builder, text, size):
+    """Copy `size` bytes to the end of the output buffer (the space must be reserved)."""
+    buffer_ptr, length_ptr, _ = _output_state(module)
+    length = builder.load(length_ptr)
+    _copy_bytes(module, builder, builder.gep(builder.load(buffer_ptr), [length]), text, size)
+    builder.store(builder.add(length, size), length_ptr)
+
+
+def _get_output_fixed(module):
+    """
+    Define (once per module) `void __out_fixed(i1 negative, i64 units, i64 hundredths)`.
+
+    Appends [-]units.hh to the output buffer. Digits are produced right to
+    left into a small stack buffer, then copied in one go.
+    """
+    name = '__out_fixed'
+    if name in module.globals:
+        return module.globals[name]
+    function, builder = _define_helper(module, name, ir.VoidType(), [ir.IntType(1), I64, I64])
+    negative, units, hundredths = function.args
+    ten = ir.Constant(I64, 10)
+    _reserve_output(module, builder, ir.Constant(I64, NUMBER_MAX_WIDTH))
+
+    def digit(value):
+        return builder.trunc(builder.add(value, ir.Constant(I64, ord('0'))), I8)
+
+    text = builder.alloca(ir.ArrayType(I8, NUMBER_MAX_WIDTH), name="text")
+    end = ir.Constant(I64, NUMBER_MAX_WIDTH)
+
+    def put(position, char):
+        builder.store(char, builder.gep(text, [ir.Constant(I32, 0), position]))
+
+    put(ir.Constant(I64, NUMBER_MAX_WIDTH - 1), digit(builder.urem(hundredths, ten)))
+    put(ir.Constant(I64, NUMBER_MAX_WIDTH - 2), digit(builder.udiv(hundredths, ten)))
+    put(ir.Constant(I64, NUMBER_MAX_WIDTH - 3), ir.Constant(I8, ord('.')))
+
+    # do { write units % 10 } while (units /= 10), so zero prints as "0"
+    entry_block = builder.block
+    loop_block = function.append_basic_block(name="digits")
+    sign_block = function.append_basic_block(name="sign")
+    builder.branch(loop_block)
+    builder.position_at_end(loop_block)
+    position = builder.phi(I64, name="position")
+    remaining = builder.phi(I64, name="remaining")
+    position.add_incoming(ir.Constant(I64, NUMBER_MAX_WIDTH - 3), entry_block)
+    remaining.add_incoming(units, entry_block)
+    next_position = builder.sub(position, ir.Constant(I64, 1))
+    put(next_position, digit(builder.urem(remaining, ten)))
+    quotient = builder.udiv(remaining, ten)
+    position.add_incoming(next_position, loop_block)
+    remaining.add_incoming(quotient, loop_block)
+    builder.cbranch(builder.icmp_unsigned('!=', quotient, ir.Constant(I64, 0)), loop_block, sign_block)
+
+    builder.position_at_end(sign_block)
+    # The slot before the digits always exists; it is only copied out for negative numbers
+    sign_position = builder.sub(next_position, ir.Constant(I64, 1))
+    put(sign_position, ir.Constant(I8, ord('-')))
+    start = builder.select(negative, sign_position, next_position)
+    _append(module, builder, builder.gep(text, [ir.Constant(I32, 0), start]), builder.sub(end, start))
+    builder.ret_void()
+    return function
+
+
+def _get_output_float(module):
+    """
+    Define (once per module) `void __out_f64(double value)`, appending it as "%.2f" does.
+
+    Below FAST_FLOAT_LIMIT the value is scaled to hundredths and rounded to
+    nearest, ties to even, exactly like printf: the product value * 100 is
+    rounded, but fma() recovers its rounding error, which decides the
+    direction whenever the product lands on a tie. Larger, infinite and NaN
+    values are formatted by snprintf.
+    """
+    name = '__out_f64'
+    if name in module.globals:
+        return module.globals[name]
+    snprintf = declare_c_function(module, 'snprintf', I32, [I8_PTR, I64, I8_PTR], var_arg=True)
+    fabs = module.declare_intrinsic('llvm.fabs', [DOUBLE])
+    fma = module.declare_intrinsic('llvm.fma', [DOUBLE], ir.FunctionType(DOUBLE, [DOUBLE] * 3))
+    rint = module.declare_intrinsic('llvm.rint', [DOUBLE])
+    fixed = _get_output_fixed(module)
+    function, builder = _define_helper(module, name, ir.VoidType(), [DOUBLE])
+    value = function.args[0]
+    zero = ir.Constant(DOUBLE, 0.0)
+    hundred = ir.Constant(DOUBLE, 100.0)
+    half = ir.Constant(DOUBLE, 0.5)
+    text = builder.alloca(ir.ArrayType(I8, FLOAT_TEXT_SIZE), name="text")
+
+    magnitude = builder.call(fabs, [value])
+    fast = builder.fcmp_ordered('<', magnitude, ir.Constant(DOUBLE, FAST_FLOAT_LIMIT))
+    with builder.if_else(fast, likely=True) as (fast_path, slow_path):
+        with fast_path:
+            scaled = builder.fmul(magnitude, hundred)
+            error = builder.call(fma, [magnitude, hundred, builder.fsub(zero, scaled)])
+            rounded = builder.call(rint, [scaled])
+            fraction = builder.fsub(scaled, rounded)
+            # rint resolved a tie in `scaled`; the exact product lies on the side of its error
+            up = builder.and_(builder.fcmp_ordered('==', fraction, half), builder.fcmp_ordered('>', error, zero))
+            down = builder.and_(builder.fcmp_ordered('==', fraction, builder.fsub(zero, half)),
+                                builder.fcmp_ordered('<', error, zero))
+            cents = builder.fptoui(rounded, I64)
+            cents = builder.add(cents, builder.zext(up, I64))
+            cents = builder.sub(cents, builder.zext(down, I64))
+            # The sign bit, not the comparison, so -0.0 and small negatives print "-0.00" like printf
+            negative = builder.icmp_signed('<', builder.bitcast(value, I64), ir.Constant(I64, 0))
+            hundredths = ir.Constant(I64, 100)
+            builder.call(fixed, [negative, builder.udiv(cents, hundredths), builder.urem(cents, hundredths)])
+        with slow_path:
+            text_ptr = builder.bitcast(text, I8_PTR)
+            format_ptr = builder.bitcast(_constant_text(module, '__out_float_format', '%.2f'), I8_PTR)
+            size = builder.sext(builder.call(snprintf, [text_ptr, ir.Constant(I64, FLOAT_TEXT_SIZE), format_ptr,
+                                                        value]), I64)
+            _reserve_output(module, builder, size)
+            _append(module, builder, text_ptr, size)
+    builder.ret_void()
+    return function
+
+
+def _get_output_int(module):
+    """
+    Define (once per module) `void __out_i64(i64 value)`, appending it as "%.2f" of the value does.
+
+    Integers print with two zero decimals. Beyond 2**53 the conversion to
+    double rounds, so those go through __out_f64 to print the same digits.
+    """
+    name = '__out_i64'
+    if name in module.globals:
+        return module.globals[name]
+    fixed = _get_output_fixed(module)
+    to_float = _get_output_float(module)
+    function, builder = _define_helper(module, name, ir.VoidType(), [I64])
+    value = function.args[0]
+    exact = builder.icmp_unsigned('<', builder.add(value, ir.Constant(I64, 2 ** 53)), ir.Constant(I64, 2 ** 54))
+    with builder.if_else(exact, likely=True) as (exact_path, rounded_path):
+        with exact_path:
+            negative = builder.icmp_signed('<', value, ir.Constant(I64, 0))
+            magnitude = builder.select(negative, builder.neg(value), value)
+            builder.call(fixed, [negative, magnitude, ir.Constant(I64, 0)])
+        with rounded_path:
+            builder.call(to_float, [builder.sitofp(value, DOUBLE)])
+    builder.ret_void()
+    return function
+
+
+def _define_output_template(module):
+    """
+    Define `void __out_template(i8* template, i64 size, i64* values)`.
+
+    Appends one print line. The template is the line's literal text with an
+    OUTPUT_INT_SLOT or OUTPUT_FLOAT_SLOT byte where each value goes; the
+    values (doubles stored as their bits) are formatted by the integer or
+    float fast path. Runs of text are copied in one go.
+    """
+    name = '__out_template'
+    if name in module.globals:
+        return module.globals[name]
+    to_int = _get_output_int(module)
+    to_float = _get_output_float(module)
+    function, builder = _define_helper(module, name, ir.VoidType(), [I8_PTR, I64, I64.as_pointer()],
+                                       linkage='external')
+    template, size, values = function.args
+    one = ir.Constant(I64, 1)
+    entry_block = builder.block
+    next_block = function.append_basic_block(name="next")
+    part_block = function.append_basic_block(name="part")
+    int_block = function.append_basic_block(name="int")
+    float_block = function.append_basic_block(name="float")
+    scan_block = function.append_basic_block(name="scan")
+    scan_more = function.append_basic_block(name="scan.more")
+    text_block = function.append_basic_block(name="text")
+    done_block = function.append_basic_block(name="done")
+    builder.branch(next_block)
+
+    # Loop over the parts of the template: a value slot or a run of text
+    builder.position_at_end(next_block)
+    position = builder.phi(I64, name="position")
+    slot = builder.phi(I64, name="slot")
+    position.add_incoming(ir.Constant(I64, 0), entry_block)
+    slot.add_incoming(ir.Constant(I64, 0), entry_block)
+    builder.cbranch(builder.icmp_signed('<', position, size), part_block, done_block)
+
+    builder.position_at_end(part_block)
+    after = builder.add(position, one)
+    switch = builder.switch(builder.load(builder.gep(template, [position])), scan_block)
+    switch.add_case(ir.Constant(I8, ord(OUTPUT_INT_SLOT)), int_block)
+    switch.add_case(ir.Constant(I8, ord(OUTPUT_FLOAT_SLOT)), float_block)
+
+    for block, writer in ((int_block, to_int), (float_block, to_float)):
+        builder.position_at_end(block)
+        value = builder.load(builder.gep(values, [slot]))
+        builder.call(writer, [value if writer is to_int else builder.bitcast(value, DOUBLE)])
+        position.add_incoming(after, block)
+        slot.add_incoming(builder.add(slot, one), block)
+        builder.branch(next_block)
+
+    # Text runs up to the next slot byte or the end of the template
+    builder.position_at_end(scan_block)
+    end = builder.phi(I64, name="end")
+    end.add_incoming(after, part_block)
+    in_template = builder.icmp_signed('<', end, size)
+    builder.cbranch(in_template, scan_more, text_block)
+    builder.position_at_end(scan_more)
+    is_text = builder.icmp_unsigned('>', builder.load(builder.gep(template, [end])),
+                                    ir.Constant(I8, ord(OUTPUT_FLOAT_SLOT)))
+    following = builder.add(end, one)
+    end.add_incoming(following, scan_more)
+    builder.cbranch(is_text, scan_block, text_block)
+
+    builder.position_at_end(text_block)
+    run_size = builder.sub(end, position)
+    _reserve_output(module, builder, run_size)
+    _append(module, builder, builder.gep(template, [position]), run_size)
+    position.add_incoming(end, builder.block)
+    slot.add_incoming(slot, builder.block)
+    builder.branch(next_block)
+
+    builder.position_at_end(done_block)
+    builder.ret_void()
+    return function
+
+
+def get_output_line(module, value_count):
+    """
+    Define (once per module and value count) `void __out_line<N>(i8* template, i64 size, i64 value...)`.
+
+    Like printf, a print is a single call taking its values as arguments
+    (doubles as their bits), so programs that print a lot stay small. The
+    wrapper gathers them into an array for __out_template.
+    """
+    name = f"__out_line{value_count}"
+    if name in module.globals:
+        return module.globals[name]
+    template = declare_runtime_function(module, '__out_template')
+    function, builder = _define_helper(module, name, ir.VoidType(), [I8_PTR, I64] + [I64] * value_count,
+                                       attributes=('noinline',))
+    values = builder.alloca(I64, ir.Constant(I64, max(value_count, 1)), name="values")
+    for index, value in enumerate(function.args[2:]):
+        builder.store(value, builder.gep(values, [ir.Constant(I64, index)]))
+    builder.call(template, [function.args[0], function.args[1], values])
+    builder.ret_void()
+    return function
+
+
+def build_output_runtime():
+    """
+    Build the output runtime module: the buffer state, __out_flush and
+    __out_template with the formatting code they use.
+
+    Its entry points and state are external so that the module can be
+    optimized on its own and linked into programs (which then make them
+    internal, see code_optimizer.link_runtime).
+    """
+    module = ir.Module(name="output_runtime")
+    _define_output_flush(module)
+    _define_output_template(module)
+    return module
+
+
+# Input buffer
+#
+# input reads numbers from file descriptor 0 through one process-wide buffer
+# instead of one scanf("%lf") call per number: a read() fills the buffer with
+# as many numbers as are available, and each number is parsed in place. Like
+# the output buffer, the reader is a separate runtime module linked into the
+# programs that use it. It writes out buffered output before every read(), so
+# prompts show before the program waits for input.
+
+# Entry points and state of the input runtime, by name
+INPUT_FUNCTION_TYPES = {
+    '__in_f64': ir.FunctionType(DOUBLE, [DOUBLE]),
+}
+INPUT_STATE = ('__in_buffer', '__in_position', '__in_length', '__in_eof')
+
+
+def _input_state(module):
+    """Return the (buffer, position, length, end of file) globals of the input buffer."""
+    buffer_name, position_name, length_name, eof_name = INPUT_STATE
+    return (_output_global(module, buffer_name, I8_PTR, ir.Constant(I8_PTR, None)),
+            _output_global(module, position_name, I64, ir.Constant(I64, 0)),
+            _output_global(module, length_name, I64, ir.Constant(I64, 0)),
+            _output_global(module, eof_name, ir.IntType(1), ir.Constant(ir.IntType(1), 0)))
+
+
+def _get_input_refill(module):
+    """
+    Define (once per module) `i1 __in_refill()`.
+
+    Moves the unread bytes to the start of the buffer (allocating it with
+    INPUT_BUFFER_SIZE bytes on first use) and appends what one read() of
+    file descriptor 0 returns. The buffered bytes are always followed by a
+    NUL, so a number at the end of the input is terminated. Returns false,
+    and remembers it, at the end of the input (or on a read error).
+    """
+    name = '__in_refill'
+    if name in module.globals:
+        return module.globals[name]
+    malloc = declare_c_function(module, 'malloc', I8_PTR, [I64])
+    read = declare_c_function(module, '_read' if platform.system() == 'Windows' else 'read',
+                              I64, [I32, I8_PTR, I64])
+    memmove = module.declare_intrinsic('llvm.memmove', [I8_PTR, I8_PTR, I64])
+    buffer_ptr, position_ptr, length_ptr, eof_ptr = _input_state(module)
+    function, builder = _define_helper(module, name, ir.IntType(1), [], attributes=('noinline', 'cold'))
+    read_block = function.append_basic_block(name="read")
+    done_block = function.append_basic_block(name="done")
+    builder.cbranch(builder.load(eof_ptr), done_block, read_block)
+
+    builder.position_at_end(read_block)
+    # Waiting for input: show what was printed (prompts in particular) first
+    builder.call(declare_runtime_function(module, '__out_flush'), [])
+    with builder.if_then(builder.icmp_unsigned('==', builder.load(buffer_ptr), ir.Constant(I8_PTR, None))):
+        builder.store(builder.call(malloc, [ir.Constant(I64, INPUT_BUFFER_SIZE + 1)]), buffer_ptr)
+    buffer = builder.load(buffer_ptr)
+    position = builder.load(position_ptr)
+    unread = builder.sub(builder.load(length_ptr), position)
+    builder.call(memmove, [buffer, builder.gep(buffer, [position]), unread, ir.Constant(ir.IntType(1), 0)])
+    free = builder.sub(ir.Constant(I64, INPUT_BUFFER_SIZE), unread)
+    count = builder.call(read, [ir.Constant(I32, 0), builder.gep(buffer, [unread]), free])
+    received = builder.icmp_signed('>', count, ir.Constant(I64, 0))
+    length = builder.add(unread, builder.select(received, count, ir.Constant(I64, 0)))
+    builder.store(ir.Constant(I8, 0), builder.gep(buffer, [length]))
+    builder.store(ir.Constant(I64, 0), position_ptr)
+    builder.store(length, length_ptr)
+    builder.store(builder.not_(received), eof_ptr)
+    builder.ret(received)
+
+    builder.position_at_end(done_block)
+    builder.ret(ir.Constant(ir.IntType(1), 0))
+    return function
+
+
+def _is_space(builder, char):
+    """Whether a byte is C whitespace: ' ', or '\\t' through '\\r'."""
+    control = builder.icmp_unsigned('<', builder.sub(char, ir.Constant(I8, ord('\t'))), ir.Constant(I8, 5))
+    return builder.or_(builder.icmp_unsigned('==', char, ir.Constant(I8, ord(' '))), control)
+
+
+def _define_input_number(module):
+    """
+    Define `double __in_f64(double fallback)`.
+
+    Reads the next number, skipping whitespace first, with the semantics of
+    scanf("%lf"): the longest prefix of the next word that is a number is
+    consumed. When there is none (or the input ended), nothing is consumed
+    and `fallback` is returned, so the variable being read keeps its value.
+
+    Plain decimals of up to FAST_NUMBER_DIGITS digits are parsed in place
+    and rounded exactly like strtod; anything else (exponents, hex, inf,
+    nan, long mantissas) goes through strtod.
+    """
+    name = '__in_f64'
+    if name in module.globals:
+        return module.globals[name]
+    refill = _get_input_refill(module)
+    strtod = declare_c_function(module, 'strtod', DOUBLE, [I8_PTR, I8_PTR.as_pointer()])
+    buffer_ptr, position_ptr, length_ptr, eof_ptr = _input_state(module)
+    function, builder = _define_helper(module, name, DOUBLE, [DOUBLE], linkage='external')
+    fallback = function.args[0]
+    zero, one = ir.Constant(I64, 0), ir.Constant(I64, 1)
+    blocks = {block: function.append_basic_block(name=block)
+              for block in ('skip', 'skip.char', 'skip.next', 'skip.refill', 'word', 'word.scan', 'word.char',
+                            'word.end', 'word.refill', 'number', 'digits', 'digit', 'point', 'point.take', 'digits.end',
+                            'fast', 'slow', 'slow.done', 'fail')}
+    end_ptr = builder.alloca(I64, name="end")
+    index_ptr = builder.alloca(I64, name="index")
+    mantissa_ptr = builder.alloca(I64, name="mantissa")
+    digits_ptr = builder.alloca(I64, name="digits")
+    scale_ptr = builder.alloca(I64, name="scale")
+    point_ptr = builder.alloca(ir.IntType(1), name="point")
+    parsed_end_ptr = builder.alloca(I8_PTR, name="parsed.end")
+    builder.branch(blocks['skip'])
+
+    def char_at(offset):
+        return builder.load(builder.gep(builder.load(buffer_ptr), [offset]))
+
+    # Skip whitespace, reading more input whenever the buffer runs out
+    builder.position_at_end(blocks['skip'])
+    position = builder.load(position_ptr)
+    buffered = builder.icmp_signed('<', position, builder.load(length_ptr))
+    builder.cbranch(buffered, blocks['skip.char'], blocks['skip.refill'])
+    builder.position_at_end(blocks['skip.char'])
+    builder.cbranch(_is_space(builder, char_at(position)), blocks['skip.next'], blocks['word'])
+    builder.position_at_end(blocks['skip.next'])
+    builder.store(builder.add(position, one), position_ptr)
+    builder.branch(blocks['skip'])
+    builder.position_at_end(blocks['skip.refill'])
+    builder.cbranch(builder.call(refill, []), blocks['skip'], blocks['fail'])
+
+    # Make sure the whole word is buffered: it must end before the buffered bytes do, unless the input
+    # ended or the word fills the buffer on its own
+    builder.position_at_end(blocks['word'])
+    builder.store(builder.load(position_ptr), end_ptr)
+    builder.branch(blocks['word.scan'])
+    builder.position_at_end(blocks['word.scan'])
+    end = builder.load(end_ptr)
+    length = builder.load(length_ptr)
+    builder.cbranch(builder.icmp_signed('<', end, length), blocks['word.char'], blocks['word.end'])
+    builder.position_at_end(blocks['word.char'])
+    builder.store(builder.add(end, one), end_ptr)
+    builder.cbranch(_is_space(builder, char_at(end)), blocks['number'], blocks['word.scan'])
+    builder.position_at_end(blocks['word.end'])
+    room = builder.or_(builder.icmp_signed('>', builder.load(position_ptr), zero),
+                       builder.icmp_signed('<', length, ir.Constant(I64, INPUT_BUFFER_SIZE)))
+    more = builder.and_(room, builder.not_(builder.load(eof_ptr)))
+    builder.cbranch(more, blocks['word.refill'], blocks['number'])
+    builder.position_at_end(blocks['word.refill'])
+    builder.call(refill, [])
+    builder.branch(blocks['word'])
+
+    # Fast path: [+-]digits[.digits]
+    builder.position_at_end(blocks['number'])
+    start = builder.gep(builder.load(buffer_ptr), [builder.load(position_ptr)])
+    first = builder.load(start)
+    signed = builder.or_(builder.icmp_unsigned('==', first, ir.Constant(I8, ord('-'))),
+                         builder.icmp_unsigned('==', first, ir.Constant(I8, ord('+'))))
+    builder.store(builder.zext(signed, I64), index_ptr)
+    for pointer in (mantissa_ptr, digits_ptr, scale_ptr):
+        builder.store(zero, pointer)
+    builder.store(ir.Constant(ir.IntType(1), 0), point_ptr)
+    builder.branch(blocks['digits'])
+
+    builder.position_at_end(blocks['digits'])
+    index = builder.load(index_ptr)
+    char = builder.load(builder.gep(start, [index]))
+    digit = builder.sub(char, ir.Constant(I8, ord('0')))
+    is_digit = builder.icmp_unsigned('<', digit, ir.Constant(I8, 10))
+    builder.cbranch(is_digit, blocks['digit'], blocks['point'])
+    builder.position_at_end(blocks['digit'])
+    mantissa = builder.mul(builder.load(mantissa_ptr), ir.Constant(I64, 10))
+    builder.store(builder.add(mantissa, builder.zext(digit, I64)), mantissa_ptr)
+    builder.store(builder.add(builder.load(digits_ptr), one), digits_ptr)
+    builder.store(builder.add(builder.load(scale_ptr), builder.zext(builder.load(point_ptr), I64)), scale_ptr)
+    builder.store(builder.add(index, one), index_ptr)
+    builder.branch(blocks['digits'])
+    builder.position_at_end(blocks['point'])
+    first_point = builder.and_(builder.icmp_unsigned('==', char, ir.Constant(I8, ord('.'))),
+                               builder.not_(builder.load(point_ptr)))
+    builder.cbranch(first_point, blocks['point.take'], blocks['digits.end'])
+    builder.position_at_end(blocks['point.take'])
+    builder.store(ir.Constant(ir.IntType(1), 1), point_ptr)
+    builder.store(builder.add(index, one), index_ptr)
+    builder.branch(blocks['digits'])
+
+    # Exponents ('e') and hex numbers ('0x') continue where the fast path stops
+    builder.position_at_end(blocks['digits.end'])
+    digits = builder.load(digits_ptr)
+    lowered = builder.or_(char, ir.Constant(I8, 0x20))
+    continues = builder.or_(builder.icmp_unsigned('==', lowered, ir.Constant(I8, ord('e'))),
+                            builder.icmp_unsigned('==', lowered, ir.Constant(I8, ord('x'))))
+    fast = builder.and_(builder.icmp_signed('>', digits, zero),
+                        builder.icmp_signed('<=', digits, ir.Constant(I64, FAST_NUMBER_DIGITS)))
+    builder.cbranch(builder.and_(fast, builder.not_(continues)), blocks['fast'], blocks['slow'])
+
+    builder.position_at_end(blocks['fast'])
+    powers_type = ir.ArrayType(DOUBLE, FAST_NUMBER_DIGITS + 1)
+    powers = ir.GlobalVariable(module, powers_type, name="__in_powers")
+    powers.linkage = 'private'
+    powers.global_constant = True
+    powers.initializer = ir.Constant(powers_type, [float(10 ** k) for k in range(FAST_NUMBER_DIGITS + 1)])
+    power = builder.load(builder.gep(powers, [ir.Constant(I32, 0), builder.load(scale_ptr)]))
+    magnitude = builder.fdiv(builder.uitofp(builder.load(mantissa_ptr), DOUBLE), power)
+    negative = builder.icmp_unsigned('==', first, ir.Constant(I8, ord('-')))
+    value = builder.select(negative, builder.fneg(magnitude), magnitude)
+    builder.store(builder.add(builder.load(position_ptr), builder.load(index_ptr)), position_ptr)
+    builder.ret(value)
+
+    builder.position_at_end(blocks['slow'])
+    value = builder.call(strtod, [start, parsed_end_ptr])
+    parsed_end = builder.load(parsed_end_ptr)
+    consumed = builder.sub(builder.ptrtoint(parsed_end, I64), builder.ptrtoint(start, I64))
+    builder.cbranch(builder.icmp_signed('>', consumed, zero), blocks['slow.done'], blocks['fail'])
+    builder.position_at_end(blocks['slow.done'])
+    builder.store(builder.add(builder.load(position_ptr), consumed), position_ptr)
+    builder.ret(value)
+
+    builder.position_at_end(blocks['fail'])
+    builder.ret(fallback)
+    return function
+
+
+def build_input_runtime():
+    """
+    Build the input runtime module: the buffer state and __in_f64.
+
+    It calls the output runtime's __out_flush, which the program provides.
+    """
+    module = ir.Module(name="input_runtime")
+    _define_input_number(module)
+    return module
+
+
+# Entry points of all runtime modules, and the modules in the order they are linked: a module's
+# dependencies come after it, so linking it adds the declarations that pull them in
+RUNTIME_FUNCTION_TYPES = {**OUTPUT_FUNCTION_TYPES, **INPUT_FUNCTION_TYPES}
+RUNTIME_MODULES = (
+    (INPUT_FUNCTION_TYPES, INPUT_STATE, build_input_runtime),
+    (OUTPUT_FUNCTION_TYPES, OUTPUT_STATE, build_output_runtime),
+)
+
+
+def declare_runtime_function(module, name):
+    """Return the declaration of a runtime entry point (see RUNTIME_FUNCTION_TYPES), adding it on first use."""
+    if name in module.globals:
+        return module.globals[name]
+    return ir.Function(module, RUNTIME_FUNCTION_TYPES[name], name=name)
@@ -1,30 +1,104 @@
-class SemanticAnalyzer:
+import logging
+from node_dispatch import dispatch_table
+
+logger = logging.getLogger('compiler.semantic')
+
+# Log level of the per-expression type resolution traces (matches compiler.TRACE)
+TRACE = 5
+
+
+class SymbolTable:
+    """
+    Resolved variables of one function (or of the main program).
+
+    Every variable name gets a slot, numbered in order of first declaration.
+    A variable lives as long as its function, so declarations of the same
+    name in nested scopes share the slot, whose storage type merges all of
+    their types. The code generator gives every slot one stack slot.
+    """
+
     def __init__(self):
-        # Symbol table to store variable information
-        self.symbol_table = {}
-        self.current_scope = [{}]  # Stack for scope management
+        self.slots = {}              # Variable name -> slot index
+        self.names = []              # Slot index -> variable name
+        self.types = []              # Slot index -> storage type
+        self.definitions = []        # Slot index -> number of definitions (parameters included)
+        self.first_definitions = []  # Slot index -> id() of the statement defining it first (None: a parameter)
+
+    def declare(self, var_name, var_type, node=None):
+        """Record a definition of a variable, returning its slot."""
+        slot = self.slots.get(var_name)
+        if slot is None:
+            slot = len(self.names)
+            self.slots[var_name] = slot
+            self.names.append(var_name)
+            self.types.append(var_type)
+            self.definitions.append(1)
+            self.first_definitions.append(None if node is None else id(node))
+            return slot
+        self.definitions[slot] += 1
+        self.merge_type(slot, var_type)
+        return slot
+
+    def merge_type(self, slot, var_type):
+        """Merge a declared type into the storage type of a slot."""
+        known_type = self.types[slot]
+        if known_type is None or known_type == var_type or known_type == 'list[unknown]':
+            self.types[slot] = var_type
+        elif var_type == 'list[unknown]' and known_type.startswith('list['):
+            pass  # An empty list takes the element type of the appends
+        elif known_type in ('int', 'float') and var_type in ('int', 'float'):
+            self.types[slot] = 'float'  # Mixed numeric use widens to float
+        else:
+            self.types[slot] = 'unknown'
+
+
+class SemanticAnalyzer:
+    def __init__(self, trace=False, widened=frozenset()):
+        # Emit per-expression type resolution traces (off by default: they dominate analysis time)
+        self.trace = trace
+        # Variables, as (function name or None, name), whose slots an earlier pass widened to float
+        self.widened = widened
+        # Variables read as int this pass, checked against their final slot types by analyze_program()
+        self.int_reads = set()
+        # Scopes of the nested blocks being analyzed: the names each declares, with their types
+        self.scopes = [{}]
+        # Scope depths declaring every visible name, innermost last, so lookups never walk the scopes
+        self.visible = {}
         self.functions = {}  # Track defined functions
+        # Resolved variables of the main program (consumed by the code generator).
+        # Each function gets its own table, stored with the function.
+        self.symbols = SymbolTable()
+        self.scope_base = 0  # Index of the outermost scope visible from the current function
+        self.current_function = None  # Name of the function being analyzed, if any
 
     def enter_scope(self):
         """Enter a new scope."""
-        self.current_scope.append({})  # Push a new scope onto the stack
+        self.scopes.append({})  # Push a new scope onto the stack
 
     def leave_scope(self):
         """Exit the current scope."""
-        if self.current_scope:
-            self.current_scope.pop()  # Pop the current scope from the stack
+        for var_name in self.scopes.pop():
+            self.visible[var_name].pop()  # Uncover the declarations the scope shadowed
 
-    def declare_variable(self, var_name, var_type):
-        """Declare a variable in the current scope."""
-        if var_name in self.current_scope[-1]:
+    def declare_variable(self, var_name, var_type, node=None):
+        """Declare a variable in the current scope, defined by the statement `node`."""
+        scope = self.scopes[-1]
+        if var_name in scope:
             raise Exception(f"Semantic Error: Variable '{var_name}' already declared in this scope.")
-        self.current_scope[-1][var_name] = var_type  # Add variable to the current scope
+        scope[var_name] = var_type  # Add variable to the current scope
+        self.visible.setdefault(var_name, []).append(len(self.scopes) - 1)
+        self.symbols.declare(var_name, var_type, node)
+
+    def refine_variable_type(self, var_name, var_type):
+        """Replace the type of a declared variable in the scope that declares it (e.g. an empty list's)."""
+        self.scopes[self.visible[var_name][-1]][var_name] = var_type
+        self.symbols.merge_type(self.symbols.slots[var_name], var_type)
 
     def lookup_variable(self, var_name):
-        """Find a variable in the nested scopes."""
-        for scope in reversed(self.current_scope):
-            if var_name in scope:
-                return scope[var_name]  # Return variable type if found
+        """Find a variable in the nested scopes of the current function (or of the main program)."""
+        depths = self.visible.get(var_name)
+        if depths and depths[-1] >= self.scope_base:
+            return self.scopes[depths[-1]][var_name]  # Return variable type if found
         raise Exception(f"Semantic Error: Variable '{var_name}' not declared.")  # Raise error if not found
 
     def declare_function(self, func_name, params, return_type=None):
@@ -33,307 +107,398 @@ class SemanticAnalyzer:
             raise Exception(f"Semantic Error: Function '{func_name}' already defined.")
         self.functions[func_name] = {
             'params': params,  # Store function parameters
-            'return_type': return_type  # Store return type
+            'return_type': return_type,  # Store return type
+            'symbols': SymbolTable()  # Resolved parameters and locals
         }
 
+    def analyze_program(self, ast):
+        """
+        Analyze a whole program, returning the analyzer holding its final symbol tables.
+
+        A slot's storage type is only known once every definition merged into
+        it, so an int variable read before a later definition widens it to
+        float was typed from a stale int. The program is then analyzed again
+        with those variables read as floats, until no read goes stale.
+        """
+        analyzer = self
+        while True:
+            analyzer.analyze(ast)
+            stale = {key for key in analyzer.int_reads if analyzer.slot_type(*key) == 'float'}
+            if not stale:
+                return analyzer
+            analyzer = SemanticAnalyzer(self.trace, analyzer.widened | stale)
+
+    def slot_type(self, func_name, var_name):
+        """Storage type of a variable of a function (None: the main program)."""
+        symbols = self.symbols if func_name is None else self.functions[func_name]['symbols']
+        return symbols.types[symbols.slots[var_name]]
+
     def analyze(self, node):
         """Traverse and analyze the parse tree."""
         if isinstance(node, list):  # Handle a list of statements
             for sub_node in node:
                 self.analyze(sub_node)  # Recursively analyze each statement
         elif isinstance(node, tuple):
-            node_type = node[0]  # Get the type of the node
-
-            # Function Definition
-            if node_type == 'function_def':
-                func_name = node[1]  # Function name
-                params = node[2]  # Function parameters
-                func_body = node[3]  # Function body
-                
-                # Enter function scope
-                self.enter_scope()
-                
-                # Declare function parameters
-                param_types = []
-                for param in params:
-                    # For simplicity, we'll use 'unknown' type for parameters
-                    self.declare_variable(param, 'unknown')
-                    param_types.append('unknown')
-                
-                # Declare function in global scope
-                self.declare_function(func_name, param_types)  # Register the function with its parameters
-                
-                # Analyze function body
-                self.analyze(func_body)  # Recursively analyze the function's body
-                
-                # Exit function scope
-                self.leave_scope()  # Clean up the scope after analyzing the function
-
-            # Function Call
-            elif node_type == 'function_call':
-                func_name = node[1]  # Name of the function being called
-                args = node[2]  # Arguments passed to the function
-                
-                # Check if function is defined
-                if func_name not in self.functions:
-                    raise Exception(f"Semantic Error: Function '{func_name}' not defined.")
-                
-                # Check argument count
-                expected_params = len(self.functions[func_name]['params'])  # Expected number of parameters
-                if len(args) != expected_params:
-                    raise Exception(f"Semantic Error: Function '{func_name}' expects {expected_params} arguments, got {len(args)}")
-                
-                # Validate arguments
-                for arg in args:
-                    self.evaluate_expression(arg)  # Ensure each argument is valid
-
-            # List Creation
-            elif node_type == 'list_create':
-                var_name = node[1]  # Variable name for the list
-                elements = node[2]  # Elements of the list
-                
-                # Determine list element type
-                if not elements:
-                    # Empty list, use 'unknown' type
-                    self.declare_variable(var_name, 'list[unknown]')
-                else:
-                    # Infer type from first element
-                    first_elem_type = self.evaluate_expression(elements[0])
-                    
-                    # Check if all elements have the same type
-                    list_type = f'list[{first_elem_type}]'
-                    for elem in elements[1:]:
-                        elem_type = self.evaluate_expression(elem)
-                        if elem_type != first_elem_type:
-                            raise Exception(f"Semantic Error: List elements must be of the same type. Found {first_elem_type} and {elem_type}")
-                    
-                    self.declare_variable(var_name, list_type)  # Declare the list variable
-
-            # List Append
-            elif node_type == 'list_append':
-                list_name = node[1]  # Name of the list
-                element = node[2]  # Element to append
-                
-                # Check if list exists
-                list_type = self.lookup_variable(list_name)
-                
-                # Extract expected element type
-                if list_type.startswith('list['):
-                    expected_type = list_type[5:-1]  # Extract type between list[ and ]
-                    
-                    # Check if appended element matches list type
-                    actual_type = self.evaluate_expression(element)
-                    if actual_type != expected_type and expected_type != 'unknown':
-                        raise Exception(f"Semantic Error: Cannot append {actual_type} to list of {expected_type}")
-
-            # List Access
-            elif node_type == 'list_access':
-                list_name = node[1]  # Name of the list
-                index = node[2]  # Index to access
-                
-                # Check if list exists
-                list_type = self.lookup_variable(list_name)
-                
-                # Verify index type
-                index_type = self.evaluate_expression(index)
-                if index_type != 'int':
-                    raise Exception(f"Semantic Error: List index must be an integer, got {index_type}")
-
-            # Input Statement
-            elif node_type == 'input':
-                var_name = node[1]  # Variable name for input
-                prompt = node[2]  # Prompt message
-                self.declare_variable(var_name, 'float')  # Assume input variables are floats
-
-            # Multiple Input Statement
-            elif node_type == 'input_multiple':
-                var_names = node[1]  # List of variable names for input
-                prompt = node[2]  # Prompt message
-                for var_name in var_names:
-                    self.declare_variable(var_name, 'float')  # Assume each input variable is a float
-
-            # Assignment
-            elif node_type == 'assign':
-                var_name = node[1]  # Variable name for assignment
-                expr = node[2]  # Expression being assigned
-                expr_type = self.evaluate_expression(expr)  # Evaluate the expression to get its type
-                self.declare_variable(var_name, expr_type)  # Declare the variable with the evaluated type
-
-            # Print Statement
-            # Print Statement
-            elif node_type == 'print':
-                print_args = node[1]  # Extract arguments for the print statement
-                for arg in print_args:
-                    resolved_type = self.evaluate_expression(arg)  # Resolve the type of each argument
-                    if resolved_type == 'unknown':
-                        raise Exception(f"Semantic Error: Unable to resolve type for print argument '{arg}'")
-
-            # If Statement
-            elif node_type == 'if_stmt':
-                # Main if block
-                if_condition = node[1][1]  # Condition of the if statement
-                if_body = node[1][2]       # Body of the if statement
-                
-                # Evaluate condition
-                self.evaluate_expression(if_condition)  # Check the validity of the condition
-                
-                # Enter new scope for if body
-                self.enter_scope()
-                self.analyze(if_body)  # Analyze the body of the if statement
-                self.leave_scope()  # Exit the scope after analyzing
-
-                # Analyze elif blocks
-                elifs = node[2]  # Elif blocks
-                if elifs:
-                    self.analyze_elif_blocks(elifs)  # Analyze any elif blocks
-
-                # Analyze else block
-                else_block = node[3]  # Else block
-                if else_block:
-                    self.enter_scope()
-                    self.analyze(else_block[1])  # Analyze the body of the else block
-                    self.leave_scope()  # Exit the scope after analyzing
-
-            # While Loop
-            elif node_type == 'while':
-                condition = node[1]  # Condition of the while loop
-                body = node[2]  # Body of the while loop
-                
-                # Evaluate condition
-                self.evaluate_expression(condition)  # Check the validity of the condition
-                
-                # Enter new scope for while body
-                self.enter_scope()
-                self.analyze(body)  # Analyze the body of the while loop
-                self.leave_scope()  # Exit the scope after analyzing
-
-            # For Loop
-            elif node_type == 'for':
-                iterator_var = node[1]  # Iterator variable name
-                range_expr = node[2]  # Range expression
-                body = node[3]  # Body of the for loop
-                
-                # Declare iterator variable
-                self.declare_variable(iterator_var, 'int')  # Set type for the iterator variable
-                
-                # Validate range expression
-                if range_expr[0] == 'range':
-                    start = range_expr[1]  # Start of the range
-                    end = range_expr[2]  # End of the range
-                    
-                    # Evaluate range start and end
-                    self.evaluate_expression(start)  # Check validity of start
-                    self.evaluate_expression(end)  # Check validity of end
-                
-                # Enter new scope for for loop body
-                self.enter_scope()
-                self.analyze(body)  # Analyze the body of the for loop
-                self.leave_scope()  # Exit the scope after analyzing
-
-            else:
-                raise Exception(f"Semantic Error: Unrecognized node type '{node_type}'")  # Handle unrecognized node types
+            analyzer = NODE_ANALYZERS.get(node[0])  # Look up the analyzer of the node type
+            if analyzer is None:
+                raise Exception(f"Semantic Error: Unrecognized node type '{node[0]}'")  # Handle unrecognized node types
+            analyzer(self, node)
         else:
             pass  # Handle base cases like literals or identifiers
 
-    def evaluate_expression(self, expr):
-        """Evaluate an expression to determine its type."""
-        def identify_type(value):
-            # Debug print to track type resolution
-            print(f"Resolving type for: {value}")
-            
-            # Check for string literals
-            if isinstance(value, str):
-                if value.startswith('"') and value.endswith('"'):
-                    return 'str'  # Return string type
-                try:
-                    # Check if it's a variable
-                    var_type = self.lookup_variable(value)  # Look up variable type
-                    print(f"Variable {value} resolved to type: {var_type}")
-                    return var_type  # Return variable type
-                except Exception:
-                    # If lookup fails, raise error
-                    raise Exception(f"Semantic Error: Unrecognized identifier '{value}'")
+    def analyze_function_def(self, node):
+        """Analyze a function definition."""
+        func_name = node[1]  # Function name
+        params = node[2]  # Function parameters
+        func_body = node[3]  # Function body
+        
+        # Parameters are passed (and results returned) as floats
+        param_types = ['float'] * len(params)
+
+        # Declare function in global scope before its body, so it can call itself
+        self.declare_function(func_name, param_types, 'float')  # Register the function with its parameters
+
+        # Enter function scope: the body only sees its parameters and locals
+        saved_state = (self.symbols, self.scope_base, self.current_function)
+        self.symbols = self.functions[func_name]['symbols']
+        self.current_function = func_name
+        self.enter_scope()
+        self.scope_base = len(self.scopes) - 1
+
+        # Declare function parameters
+        for param, param_type in zip(params, param_types):
+            self.declare_variable(param, param_type)
+
+        # Analyze function body
+        self.analyze(func_body)  # Recursively analyze the function's body
+
+        # Exit function scope
+        self.leave_scope()  # Clean up the scope after analyzing the function
+        self.symbols, self.scope_base, self.current_function = saved_state
+
+    def analyze_return(self, node):
+        """Analyze a return statement."""
+        if self.current_function is None:
+            raise Exception("Semantic Error: 'return' outside function")
+        if node[1] is not None:
+            return_type = self.evaluate_expression(node[1])
+            if return_type not in ['int', 'float', 'bool']:
+                raise Exception(f"Type Error: Function '{self.current_function}' must return a number, got {return_type}")
+
+    def analyze_function_call(self, node):
+        """Analyze a function call statement."""
+        self.check_function_call(node)
+
+    def analyze_list_create(self, node):
+        """Analyze a list creation."""
+        var_name = node[1]  # Variable name for the list
+        elements = node[2]  # Elements of the list
+        
+        # Determine list element type
+        if not elements:
+            # Empty list, use 'unknown' type
+            self.declare_variable(var_name, 'list[unknown]', node)
+        else:
+            # Infer type from first element
+            first_elem_type = self.evaluate_expression(elements[0])
             
-            # Check for numeric literals
-            if isinstance(value, (int, float)):
-                return 'float'  # Return float type for numeric literals
+            # Check if all elements have the same type
+            list_type = f'list[{first_elem_type}]'
+            for elem in elements[1:]:
+                elem_type = self.evaluate_expression(elem)
+                if elem_type != first_elem_type:
+                    raise Exception(f"Semantic Error: List elements must be of the same type. Found {first_elem_type} and {elem_type}")
             
-            # Check for boolean literals
-            if value is True or value is False:
-                return 'bool'  # Return boolean type
+            self.declare_variable(var_name, list_type, node)  # Declare the list variable
+
+    def analyze_list_append(self, node):
+        """Analyze a list append."""
+        list_name = node[1]  # Name of the list
+        element = node[2]  # Element to append
+        
+        # Check if list exists
+        list_type = self.lookup_variable(list_name)
+        
+        # Extract expected element type
+        if list_type.startswith('list['):
+            expected_type = list_type[5:-1]  # Extract type between list[ and ]
             
-            # Handle tuples (operations, function calls, etc.)
-            if isinstance(value, tuple):
-                print(f"Processing tuple: {value}")
-                
-                if value[0] == 'function_call':
-                    func_name = value[1]  # Function name
-                    if func_name not in self.functions:
-                        raise Exception(f"Semantic Error: Function '{func_name}' not defined")
-                    func_return_type = self.functions[func_name].get('return_type', 'float')  # Default to float for input
-                    print(f"Function {func_name} return type: {func_return_type}")
-                    return func_return_type  # Return function return type
-                
-                # Handle binary and unary operations
-                if len(value) == 3:  # Binary operation
-                    operator = value[0]  # Operator
-                    left_type = identify_type(value[1])  # Left operand type
-                    right_type = identify_type(value[2])  # Right operand type
-                    
-                    print(f"Binary operation: {operator} with types {left_type} and {right_type}")
-                    
-                    # Division by Zero Check
-                    if operator in ['/', '//']:
-                        if (isinstance(value[2], (int, float)) and value[2] == 0) or \
-                        (isinstance(value[2], str) and value[2] == '0'):
-                            raise Exception("Semantic Error: Division by zero")
-                    
-                    # Arithmetic operations
-                    arithmetic_ops = ['+', '-', '*', '/', '//', '**', '^']
-                    if operator in arithmetic_ops:
-                        if left_type not in ['int', 'float'] or right_type not in ['int', 'float']:
-                            raise Exception(f"Type Error: Cannot perform {operator} on non-numeric types {left_type} and {right_type}.")
-                        return 'float'  # Return float for arithmetic operations
-                    
-                    # Comparison operations
-                    comparison_ops = ['==', '!=', '>', '>=', '<', '<=']
-                    if operator in comparison_ops:
-                        if left_type not in ['int', 'float'] or right_type not in ['int', 'float']:
-                            raise Exception(f"Type Error: Cannot compare non-numeric types {left_type} and {right_type}")
-                        return 'bool'  # Return boolean for comparison operations
-                    
-                    # Logical operations
-                    logical_ops = ['and', 'or']
-                    if operator in logical_ops:
-                        if left_type != 'bool' or right_type != 'bool':
-                            raise Exception(f"Type Error: Logical {operator} requires boolean operands")
-                        return 'bool'  # Return boolean for logical operations
-                
-                # Unary operations
-                elif len(value) == 2:
-                    operator = value[0]  # Operator
-                    operand_type = identify_type(value[1])  # Operand type
-                    
-                    if operator == '-':
-                        if operand_type not in ['int', 'float']:
-                            raise Exception(f"Type Error: Cannot negate non-numeric type {operand_type}")
-                        return operand_type  # Return type of the operand
-                    
-                    if operator == 'not':
-                        if operand_type != 'bool':
-                            raise Exception(f"Type Error: 'not' requires boolean operand")
-                        return 'bool'  # Return boolean for 'not' operation
+            # Check if appended element matches list type
+            actual_type = self.evaluate_expression(element)
+            if actual_type != expected_type and expected_type != 'unknown':
+                raise Exception(f"Semantic Error: Cannot append {actual_type} to list of {expected_type}")
+            if expected_type == 'unknown':
+                # The first append decides the element type of an empty list
+                self.refine_variable_type(list_name, f'list[{actual_type}]')
+        else:
+            raise Exception(f"Semantic Error: '{list_name}' is not a list")
+
+    def analyze_list_access(self, node):
+        """Analyze a list access statement."""
+        list_name = node[1]  # Name of the list
+        index = node[2]  # Index to access
+        
+        # Check if list exists
+        list_type = self.lookup_variable(list_name)
+        
+        # Verify index type
+        index_type = self.evaluate_expression(index)
+        if index_type != 'int':
+            raise Exception(f"Semantic Error: List index must be an integer, got {index_type}")
+        if not list_type.startswith('list['):
+            raise Exception(f"Semantic Error: '{list_name}' is not a list")
+
+    def analyze_input(self, node):
+        """Analyze an input statement."""
+        var_name = node[1]  # Variable name for input
+        prompt = node[2]  # Prompt message
+        self.declare_variable(var_name, 'float', node)  # Assume input variables are floats
+
+    def analyze_input_multiple(self, node):
+        """Analyze an input statement reading several variables."""
+        var_names = node[1]  # List of variable names for input
+        prompt = node[2]  # Prompt message
+        for var_name in var_names:
+            self.declare_variable(var_name, 'float', node)  # Assume each input variable is a float
+
+    def analyze_assign(self, node):
+        """Analyze an assignment."""
+        var_name = node[1]  # Variable name for assignment
+        expr = node[2]  # Expression being assigned
+        expr_type = self.evaluate_expression(expr)  # Evaluate the expression to get its type
+        self.declare_variable(var_name, expr_type, node)  # Declare the variable with the evaluated type
+
+    def analyze_print(self, node):
+        """Analyze a print statement."""
+        print_args = node[1]  # Extract arguments for the print statement
+        for arg in print_args:
+            resolved_type = self.evaluate_expression(arg)  # Resolve the type of each argument
+            if resolved_type == 'unknown':
+                raise Exception(f"Semantic Error: Unable to resolve type for print argument '{arg}'")
+            if resolved_type.startswith('list['):
+                raise Exception(f"Semantic Error: Cannot print a list ('{arg}'); print its elements instead")
+
+    def analyze_if_stmt(self, node):
+        """Analyze an if statement and its elif/else blocks."""
+        # Main if block
+        if_condition = node[1][1]  # Condition of the if statement
+        if_body = node[1][2]       # Body of the if statement
+        
+        # Evaluate condition
+        self.evaluate_expression(if_condition)  # Check the validity of the condition
+        
+        # Enter new scope for if body
+        self.enter_scope()
+        self.analyze(if_body)  # Analyze the body of the if statement
+        self.leave_scope()  # Exit the scope after analyzing
+
+        # Analyze elif blocks
+        elifs = node[2]  # Elif blocks
+        if elifs:
+            self.analyze_elif_blocks(elifs)  # Analyze any elif blocks
+
+        # Analyze else block
+        else_block = node[3]  # Else block
+        if else_block:
+            self.enter_scope()
+            self.analyze(else_block[1])  # Analyze the body of the else block
+            self.leave_scope()  # Exit the scope after analyzing
+
+    def analyze_while(self, node):
+        """Analyze a while loop."""
+        condition = node[1]  # Condition of the while loop
+        body = node[2]  # Body of the while loop
+        
+        # Evaluate condition
+        self.evaluate_expression(condition)  # Check the validity of the condition
+        
+        # Enter new scope for while body
+        self.enter_scope()
+        self.analyze(body)  # Analyze the body of the while loop
+        self.leave_scope()  # Exit the scope after analyzing
+
+    def analyze_for(self, node):
+        """Analyze a for loop over a range or over the elements of a list."""
+        iterator_var = node[1]  # Iterator variable name
+        iterable = node[2]  # ('range', start, end[, step]) or ('list', list name)
+        body = node[3]  # Body of the for loop
+        
+        if iterable[0] == 'list':
+            # The iterator takes the type of the list elements
+            list_name = iterable[1]
+            list_type = self.lookup_variable(list_name)
+            if not list_type.startswith('list['):
+                raise Exception(f"Semantic Error: '{list_name}' is not a list")
+            element_type = list_type[5:-1]
+            self.declare_variable(iterator_var, 'float' if element_type == 'unknown' else element_type, node)
+        else:
+            # Declare iterator variable
+            self.declare_variable(iterator_var, 'int', node)  # Set type for the iterator variable
             
-            return 'unknown'  # Default return type if none matched
+            # Evaluate range start, end and step
+            for bound in iterable[1:]:
+                self.evaluate_expression(bound)  # Check validity of the bound
+            if len(iterable) > 3:
+                step = iterable[3]
+                if isinstance(step, (int, float)) and not isinstance(step, bool) and step == 0:
+                    raise Exception("Semantic Error: range() step must not be zero")
+        
+        # Enter new scope for for loop body
+        self.enter_scope()
+        self.analyze(body)  # Analyze the body of the for loop
+        self.leave_scope()  # Exit the scope after analyzing
 
+    def evaluate_expression(self, expr):
+        """Evaluate an expression to determine its type."""
         try:
-            result_type = identify_type(expr)  # Identify the type of the expression
-            print(f"Final resolved type: {result_type}")  # Debug print for final type
+            result_type = self.identify_type(expr)  # Identify the type of the expression
+            if self.trace:
+                logger.log(TRACE, "Final resolved type: %s", result_type)
             return result_type  # Return the resolved type
         except Exception as e:
-            print(f"Type resolution failed: {e}")  # Debug print for errors
+            if self.trace:
+                logger.log(TRACE, "Type resolution failed: %s", e)
             raise  # Raise the exception for further handling
 
+    def identify_type(self, value):
+        """Type of an expression or sub-expression (see evaluate_expression)."""
+        # Trace type resolution
+        if self.trace:
+            logger.log(TRACE, "Resolving type for: %s", value)
+        
+        # Check for string literals
+        if isinstance(value, str):
+            if value.startswith('"') and value.endswith('"'):
+                return 'str'  # Return string type
+            # Check if it's a variable visible from the current function (see lookup_variable)
+            depths = self.visible.get(value)
+            if not depths or depths[-1] < self.scope_base:
+                raise Exception(f"Semantic Error: Unrecognized identifier '{value}'")
+            var_type = self.scopes[depths[-1]][value]  # Look up variable type
+            if var_type == 'int':
+                # Read as stored: a slot widened to float holds a float here too
+                key = (self.current_function, value)
+                if key in self.widened or self.symbols.types[self.symbols.slots[value]] == 'float':
+                    var_type = 'float'
+                else:
+                    self.int_reads.add(key)
+            if self.trace:
+                logger.log(TRACE, "Variable %s resolved to type: %s", value, var_type)
+            return var_type  # Return variable type
+        
+        # Check for boolean literals (before numbers: bool is a subclass of int)
+        if value is True or value is False:
+            return 'bool'  # Return boolean type
+
+        # Check for numeric literals
+        if isinstance(value, int):
+            return 'int'  # Return int type for integer literals
+        if isinstance(value, float):
+            return 'float'  # Return float type for floating point literals
+        
+        # Handle tuples (operations, function calls, etc.)
+        if isinstance(value, tuple):
+            return self.operation_type(value)
+        
+        return 'unknown'  # Default return type if none matched
+
+    def operation_type(self, value):
+        """Type of an operation, function call or list access node."""
+        if self.trace:
+            logger.log(TRACE, "Processing tuple: %s", value)
+        
+        if value[0] == 'function_call':
+            func_name = value[1]  # Function name
+            self.check_function_call(value)
+            func_return_type = self.functions[func_name].get('return_type') or 'float'  # Default to float
+            if self.trace:
+                logger.log(TRACE, "Function %s return type: %s", func_name, func_return_type)
+            return func_return_type  # Return function return type
+
+        # List element access has the list's element type; append has no value
+        if value[0] == 'list_access':
+            self.analyze(value)
+            return self.lookup_variable(value[1])[5:-1]
+        if value[0] == 'list_append':
+            self.analyze(value)
+            return 'unknown'
+        
+        # Handle binary and unary operations
+        if len(value) == 3:  # Binary operation
+            operator = value[0]  # Operator
+            left_type = self.identify_type(value[1])  # Left operand type
+            right_type = self.identify_type(value[2])  # Right operand type
+            
+            if self.trace:
+                logger.log(TRACE, "Binary operation: %s with types %s and %s", operator, left_type, right_type)
+            
+            # Division by Zero Check
+            if operator in ['/', '//']:
+                if (isinstance(value[2], (int, float)) and value[2] == 0) or \
+                (isinstance(value[2], str) and value[2] == '0'):
+                    raise Exception("Semantic Error: Division by zero")
+            
+            # Arithmetic operations
+            arithmetic_ops = ['+', '-', '*', '/', '//', '**', '^']
+            if operator in arithmetic_ops:
+                if left_type not in ['int', 'float'] or right_type not in ['int', 'float']:
+                    raise Exception(f"Type Error: Cannot perform {operator} on non-numeric types {left_type} and {right_type}.")
+                # Integer arithmetic stays integral; division and exponentiation produce floats
+                if operator in ['+', '-', '*'] and left_type == 'int' and right_type == 'int':
+                    return 'int'
+                return 'float'  # Return float for other arithmetic operations
+            
+            # Comparison operations
+            comparison_ops = ['==', '!=', '>', '>=', '<', '<=']
+            if operator in comparison_ops:
+                if left_type not in ['int', 'float'] or right_type not in ['int', 'float']:
+                    raise Exception(f"Type Error: Cannot compare non-numeric types {left_type} and {right_type}")
+                return 'bool'  # Return boolean for comparison operations
+            
+            # Logical operations
+            logical_ops = ['and', 'or']
+            if operator in logical_ops:
+                if left_type != 'bool' or right_type != 'bool':
+                    raise Exception(f"Type Error: Logical {operator} requires boolean operands")
+                return 'bool'  # Return boolean for logical operations
+        
+        # Unary operations
+        elif len(value) == 2:
+            operator = value[0]  # Operator
+            operand_type = self.identify_type(value[1])  # Operand type
+            
+            if operator == '-':
+                if operand_type not in ['int', 'float']:
+                    raise Exception(f"Type Error: Cannot negate non-numeric type {operand_type}")
+                return operand_type  # Return type of the operand
+            
+            if operator == 'not':
+                if operand_type != 'bool':
+                    raise Exception(f"Type Error: 'not' requires boolean operand")
+                return 'bool'  # Return boolean for 'not' operation
+
+        return 'unknown'  # Default return type if none matched
+
+    def check_function_call(self, node):
+        """Check that a called function exists and receives valid arguments."""
+        func_name = node[1]  # Name of the function being called
+        args = node[2]  # Arguments passed to the function
+
+        # Check if function is defined
+        if func_name not in self.functions:
+            raise Exception(f"Semantic Error: Function '{func_name}' not defined.")
+
+        # Check argument count
+        expected_params = len(self.functions[func_name]['params'])  # Expected number of parameters
+        if len(args) != expected_params:
+            raise Exception(f"Semantic Error: Function '{func_name}' expects {expected_params} arguments, got {len(args)}")
+
+        # Validate arguments: parameters are passed as floats, so only numbers can be passed
+        for arg in args:
+            arg_type = self.evaluate_expression(arg)  # Ensure each argument is valid
+            if arg_type not in ['int', 'float', 'bool']:
+                raise Exception(f"Type Error: Function '{func_name}' takes numbers, got {arg_type}")
+
     def analyze_elif_blocks(self, elifs):
         """Analyze elif blocks recursively."""
         if not elifs:
@@ -354,4 +519,8 @@ class SemanticAnalyzer:
         # Recursively analyze next elif block
         next_elifs = elifs[3]  # Next elif blocks
         if next_elifs:
-            self.analyze_elif_blocks(next_elifs)  # Continue analyzing
\ No newline at end of file
+            self.analyze_elif_blocks(next_elifs)  # Continue analyzing
+
+
+# Analyzer of each statement node type, looked up once per node by analyze()
+NODE_ANALYZERS = dispatch_table(SemanticAnalyzer, 'analyze_')